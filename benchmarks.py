@@ -1,30 +1,252 @@
-"""Simple memory benchmark comparing WOE and OneHot encoders."""
+"""Benchmark suite for the encoders registered in ``EncodingManager``.
+
+Every registered encoder is fitted and applied over a grid of
+rows × cardinality × column count × NaN rate. For each case the suite records:
+
+* fit / transform wall time (best of ``--repeat`` runs, ``time.perf_counter``);
+* throughput in rows per second;
+* peak Python heap allocation of fit / transform (``tracemalloc``, measured in a
+  separate run so tracing does not distort the timings).
+
+Results are written as JSON. When ``--baseline`` points to an earlier results
+file, cases that are slower or use more memory than the tolerance allows are
+reported and the process exits with status 1.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks.py --quick --output bench.json
+    PYTHONPATH=src python benchmarks.py --output new.json --baseline bench.json
+    PYTHONPATH=src python benchmarks.py --fit-engine
+    PYTHONPATH=src python benchmarks.py --monitor
+
+``--monitor`` measures the transform overhead of ``WOEGuard(monitor=True)`` on
+categorical and numeric columns and exits with status 1 when it exceeds
+``--monitor-budget`` (5% by default).
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-import psutil
 from encoding import EncodingManager
+from encoding.encoders import WOEGuard
+
+DEFAULT_GRID = {
+    "rows": [10_000, 100_000],
+    "cardinality": [10, 1_000],
+    "n_cols": [1, 10],
+    "nan_rate": [0.0, 0.1],
+}
+QUICK_GRID = {
+    "rows": [5_000],
+    "cardinality": [10, 500],
+    "n_cols": [2],
+    "nan_rate": [0.0, 0.1],
+}
+CASE_KEYS = ("encoder", "rows", "cardinality", "n_cols", "nan_rate")
+
+
+def make_data(rows: int, cardinality: int, n_cols: int, nan_rate: float, seed: int = 0) -> Tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(seed)
+    cats = np.array([f"cat_{i}" for i in range(cardinality)], dtype=object)
+    data = {}
+    for j in range(n_cols):
+        col = cats[rng.integers(0, cardinality, size=rows)]
+        if nan_rate:
+            col[rng.random(rows) < nan_rate] = np.nan
+        data[f"c{j}"] = col
+    return pd.DataFrame(data), pd.Series(rng.integers(0, 2, size=rows), name="y")
+
+
+def encoder_kwargs(name: str, columns: List[str]) -> Dict[str, Any]:
+    if name == "woe":
+        return {"categorical_cols": columns}
+    return {"columns": columns}
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_bytes(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(name: str, rows: int, cardinality: int, n_cols: int, nan_rate: float, repeat: int) -> Dict[str, Any]:
+    X, y = make_data(rows, cardinality, n_cols, nan_rate)
+    kwargs = encoder_kwargs(name, list(X.columns))
+
+    def fit() -> EncodingManager:
+        return EncodingManager(name, **kwargs).fit(X, y)
+
+    fitted = fit()
+    fit_s = _best_time(fit, repeat)
+    transform_s = _best_time(lambda: fitted.transform(X), repeat)
+    return {
+        "encoder": name,
+        "rows": rows,
+        "cardinality": cardinality,
+        "n_cols": n_cols,
+        "nan_rate": nan_rate,
+        "fit_s": fit_s,
+        "transform_s": transform_s,
+        "fit_rows_per_s": rows / fit_s,
+        "transform_rows_per_s": rows / transform_s,
+        "fit_peak_bytes": _peak_bytes(fit),
+        "transform_peak_bytes": _peak_bytes(lambda: fitted.transform(X)),
+    }
+
+
+def run_suite(grid: Dict[str, List], encoders: List[str], repeat: int = 3) -> Dict[str, Any]:
+    results = []
+    combos = list(itertools.product(grid["rows"], grid["cardinality"], grid["n_cols"], grid["nan_rate"]))
+    for name in encoders:
+        for rows, card, n_cols, nan_rate in combos:
+            res = run_case(name, rows, card, n_cols, nan_rate, repeat)
+            print(
+                f"{name:>14} rows={rows:<9} card={card:<7} cols={n_cols:<4} nan={nan_rate:<5} "
+                f"fit={res['fit_s']:.4f}s transform={res['transform_s']:.4f}s "
+                f"peak={res['transform_peak_bytes'] / 2**20:.1f}MiB"
+            )
+            results.append(res)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], time_tol: float = 0.2, mem_tol: float = 0.2) -> List[str]:
+    """Return one message per metric that regressed beyond the tolerance."""
+    base = {tuple(r[k] for k in CASE_KEYS): r for r in baseline["results"]}
+    regressions = []
+    for res in current["results"]:
+        key = tuple(res[k] for k in CASE_KEYS)
+        old = base.get(key)
+        if old is None:
+            continue
+        for metric, tol in (("fit_s", time_tol), ("transform_s", time_tol),
+                            ("fit_peak_bytes", mem_tol), ("transform_peak_bytes", mem_tol)):
+            if old[metric] and res[metric] > old[metric] * (1 + tol):
+                regressions.append(
+                    f"{dict(zip(CASE_KEYS, key))} {metric}: {old[metric]:.4g} -> {res[metric]:.4g} "
+                    f"(+{res[metric] / old[metric] - 1:.0%})"
+                )
+    return regressions
+
+
+def bench_fit_engine(n_rows: int = 1_000_000, n_cols: int = 20, n_unique: int = 50):
+    """Compare the vectorized WoE fit against the reference groupby path."""
+    X, y = make_data(n_rows, n_unique, n_cols, 0.0)
+    enc = WOEGuard(list(X.columns))
+
+    start = time.perf_counter()
+    for col in X.columns:
+        enc._calculate_woe_iv(enc._prepare_series(X[col]), y)
+    t_groupby = time.perf_counter() - start
+
+    start = time.perf_counter()
+    enc.fit(X, y)
+    t_vectorized = time.perf_counter() - start
+
+    print(f"groupby fit:    {t_groupby:.3f}s")
+    print(f"vectorized fit: {t_vectorized:.3f}s ({t_groupby / t_vectorized:.1f}x)")
+
+
+def bench_monitor(n_rows: int = 1_000_000, n_cols: int = 4, repeat: int = 15, budget: float = 0.05) -> bool:
+    """Transform time with ``monitor=True`` against the same encoder without it."""
+    X, y = make_data(n_rows, 50, n_cols, 0.1)
+    rng = np.random.default_rng(1)
+    X["num"] = rng.normal(size=n_rows)
+    X.loc[X.index[::20], "num"] = np.nan
+    ok = True
+    for label, cols, numeric in (("categorical", list(X.columns[:-1]), None), ("numeric", [], ["num"])):
+        plain = WOEGuard(cols, numeric_cols=numeric).fit(X, y)
+        monitored = WOEGuard(cols, numeric_cols=numeric, monitor=True).fit(X, y)
+        # alternate the runs so drift in machine load hits both sides alike
+        t_plain = t_monitored = float("inf")
+        for _ in range(repeat):
+            t_plain = min(t_plain, _best_time(lambda: plain.transform(X), 1))
+            t_monitored = min(t_monitored, _best_time(lambda: monitored.transform(X), 1))
+        overhead = t_monitored / t_plain - 1
+        ok &= overhead <= budget
+        print(f"{label:<12} plain {t_plain:.4f}s  monitored {t_monitored:.4f}s  overhead {overhead:+.1%}")
+    return ok
+
 
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="small grid for smoke runs")
+    parser.add_argument("--encoders", nargs="+", default=sorted(EncodingManager._registry))
+    parser.add_argument("--rows", nargs="+", type=int)
+    parser.add_argument("--cardinality", nargs="+", type=int)
+    parser.add_argument("--n-cols", nargs="+", type=int)
+    parser.add_argument("--nan-rate", nargs="+", type=float)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--time-tolerance", type=float, default=0.2)
+    parser.add_argument("--mem-tolerance", type=float, default=0.2)
+    parser.add_argument("--fit-engine", action="store_true", help="only run the WoE fit engine comparison")
+    parser.add_argument("--monitor", action="store_true", help="only run the drift monitoring overhead check")
+    parser.add_argument("--monitor-budget", type=float, default=0.05)
+    args = parser.parse_args(argv)
 
-def bench(n_rows: int = 1000, n_unique: int = 1000):
-    df = pd.DataFrame({
-        "feat": np.random.choice([f"cat_{i}" for i in range(n_unique)], size=n_rows),
-        "y": np.random.randint(0, 2, size=n_rows),
-    })
+    if args.fit_engine:
+        bench_fit_engine()
+        return 0
+    if args.monitor:
+        if bench_monitor(repeat=max(args.repeat, 15), budget=args.monitor_budget):
+            return 0
+        print(f"REGRESSION drift monitoring overhead above {args.monitor_budget:.0%}")
+        return 1
 
-    mem_before = psutil.Process().memory_info().rss
-    woe = EncodingManager("woe", categorical_cols=["feat"])
-    woe.fit_transform(df[["feat"]], df["y"])
-    mem_woe = psutil.Process().memory_info().rss - mem_before
+    grid = dict(QUICK_GRID if args.quick else DEFAULT_GRID)
+    for key in grid:
+        override = getattr(args, key)
+        if override:
+            grid[key] = override
 
-    mem_before = psutil.Process().memory_info().rss
-    oh = EncodingManager("onehot", columns=["feat"])
-    oh.fit_transform(df[["feat"]], df["y"])
-    mem_onehot = psutil.Process().memory_info().rss - mem_before
+    current = run_suite(grid, args.encoders, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
 
-    print(f"WoE memory delta: {mem_woe} bytes")
-    print(f"OneHot memory delta: {mem_onehot} bytes")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.time_tolerance, args.mem_tolerance)
+        for msg in regressions:
+            print(f"REGRESSION {msg}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
 
 
 if __name__ == "__main__":
-    bench()
+    sys.exit(main())
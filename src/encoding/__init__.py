@@ -3,7 +3,10 @@ from .memory_manager import MemoryManager
 from .column_map import ColumnNameManager
 from .missing import MissingHandler
 from .comparison import ComparisonResult
+from .profiling import ProfileRecord, InMemorySink, JsonLinesSink, LoggingSink
 from .report.builder import ReportBuilder
+from .report.stats import FrameStats, frame_stats
+from .serving.batcher import MicroBatcher, ServingMetrics
 from .registry.filesystem import FilesystemRegistry, ArtefactRegistry
 
 __all__ = [
@@ -12,7 +15,15 @@ __all__ = [
     "ColumnNameManager",
     "MissingHandler",
     "ComparisonResult",
+    "ProfileRecord",
+    "InMemorySink",
+    "JsonLinesSink",
+    "LoggingSink",
     "ReportBuilder",
+    "FrameStats",
+    "frame_stats",
+    "MicroBatcher",
+    "ServingMetrics",
     "FilesystemRegistry",
     "ArtefactRegistry",
 ]
@@ -11,3 +11,6 @@ class ComparisonResult:
     dtype_changes: Dict[str, str] | None = None
     time_fit: float | None = None
     time_transform: float | None = None
+    output_dtype: str | None = None
+    # bytes saved by the encoded values compared with float64 output
+    memory_saved: int | None = None
@@ -1,11 +1,15 @@
 from .woe_guard import WOEGuard
+from .woe_scorer import WOEScorer
 from .target_encoder import TargetEncoder
 from .leave_one_out import LeaveOneOutEncoder
 from .one_hot_encoder import OneHotEncoder
+from .composite import CompositeEncoder
 
 __all__ = [
     "WOEGuard",
+    "WOEScorer",
     "TargetEncoder",
     "LeaveOneOutEncoder",
     "OneHotEncoder",
+    "CompositeEncoder",
 ]
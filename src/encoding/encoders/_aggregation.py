@@ -0,0 +1,248 @@
+"""Integer-code aggregation helpers shared by the categorical encoders.
+
+Each column is factorized once into integer codes (``-1`` marks ``NaN``) and the
+per-category statistics are obtained with ``np.bincount`` instead of a pandas
+``groupby``. Codes are shifted by one so that slot ``0`` of every count array
+collects the missing values without an extra mask.
+
+Row counts are stored in the smallest unsigned integer type that holds them
+(``compact_counts``), so the state of high-cardinality columns stays small.
+``CategoryStats`` are mergeable, so the same statistics can be accumulated
+chunk by chunk (``StatsAccumulator``) with memory bounded by the chunk size
+plus the number of distinct categories.
+
+That number can itself be bounded: ``CategoryStats.pool`` folds rare categories
+into an ``"__other__"`` entry in one vectorized pass over the counts, and
+``hash_buckets`` maps values to a fixed number of buckets (the hashing trick)
+before any aggregation, hashing only the unique values of each column.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._arrow import arrow_factorize, is_arrow_column
+from ._parallel import map_columns
+
+__all__ = [
+    "factorize",
+    "row_positions",
+    "hash_buckets",
+    "NAN_POSITION",
+    "UNSEEN_POSITION",
+    "OTHER_KEY",
+    "bincount_stats",
+    "compact_counts",
+    "CategoryStats",
+    "StatsAccumulator",
+    "check_mergeable",
+    "pooled_mean",
+]
+
+
+def factorize(s: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Return integer codes (``-1`` for ``NaN``) and the unique values of ``s``.
+
+    Categorical columns reuse their codes directly, without hashing the values;
+    so do dictionary-encoded Arrow/polars columns (see ``_arrow``).
+    """
+    if is_arrow_column(s):
+        return arrow_factorize(s)
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return np.asarray(s.cat.codes, dtype=np.intp), s.cat.categories
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    return codes, pd.Index(uniques)
+
+
+NAN_POSITION = -1
+UNSEEN_POSITION = -2
+OTHER_KEY = "__other__"
+
+
+def hash_buckets(s: pd.Series, n_buckets: int) -> np.ndarray:
+    """Bucket in ``[0, n_buckets)`` of each row's value (``-1`` for ``NaN``).
+
+    Values are hashed through their ``str`` form with pandas' fixed-key hash, so
+    buckets are stable across processes, dtypes and Arrow/pandas input.
+    """
+    codes, uniques = factorize(s)
+    keys = np.asarray(uniques.astype(str), dtype=object)
+    buckets = (pd.util.hash_array(keys) % np.uint64(n_buckets)).astype(np.intp)
+    return np.append(buckets, -1).take(codes)
+
+
+def _codes(s: pd.Series, n_buckets: int | None) -> Tuple[np.ndarray, pd.Index]:
+    if n_buckets:
+        return hash_buckets(s, n_buckets), pd.RangeIndex(n_buckets)
+    return factorize(s)
+
+
+def row_positions(s: pd.Series, categories: pd.Index, n_buckets: int | None = None) -> np.ndarray:
+    """Position of each row's value in ``categories``.
+
+    ``NaN`` rows get ``NAN_POSITION`` (``-1``) and values absent from
+    ``categories`` get ``UNSEEN_POSITION`` (``-2``), so a lookup table laid out as
+    ``[*per_category, unseen, nan]`` serves every row with a single ``take``.
+    Only the unique values of ``s`` are hashed against ``categories``. With
+    ``n_buckets`` the categories are hash buckets (see ``hash_buckets``).
+    """
+    codes, uniques = _codes(s, n_buckets)
+    idx = categories.get_indexer(uniques)
+    idx[idx < 0] = UNSEEN_POSITION
+    return np.append(idx, NAN_POSITION).take(codes)
+
+
+def bincount_stats(codes: np.ndarray, n_categories: int, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Count rows and sum ``y`` per code.
+
+    Returns arrays of length ``n_categories + 1``; slot ``0`` holds the rows with
+    code ``-1`` (``NaN``) and slot ``i + 1`` holds category ``i``.
+    """
+    shifted = codes + 1
+    count = np.bincount(shifted, minlength=n_categories + 1)
+    total = np.bincount(shifted, weights=y, minlength=n_categories + 1)
+    return count, total
+
+
+def compact_counts(count: np.ndarray) -> np.ndarray:
+    """Cast non-negative counts to the smallest unsigned integer dtype that holds them."""
+    peak = int(count.max()) if len(count) else 0
+    return count.astype(np.min_scalar_type(peak), copy=False)
+
+
+@dataclass
+class CategoryStats:
+    """Sufficient statistics of a single column: row count and target sum per category."""
+
+    categories: pd.Index
+    count: np.ndarray
+    total: np.ndarray
+    nan_count: int = 0
+    nan_total: float = 0.0
+
+    @classmethod
+    def from_series(cls, s: pd.Series, y: np.ndarray, n_buckets: int | None = None) -> "CategoryStats":
+        """Aggregate ``y`` over the categories (or hash buckets) of ``s`` in a single pass."""
+        codes, uniques = _codes(s, n_buckets)
+        count, total = bincount_stats(codes, len(uniques), y)
+        observed = count[1:] > 0
+        return cls(
+            categories=uniques[observed],
+            count=compact_counts(count[1:][observed]),
+            total=total[1:][observed],
+            nan_count=int(count[0]),
+            nan_total=float(total[0]),
+        )
+
+    def sorted(self) -> "CategoryStats":
+        """Return a copy ordered by category (insertion order if not sortable)."""
+        try:
+            order = self.categories.argsort()
+        except TypeError:
+            return self
+        return CategoryStats(
+            categories=self.categories.take(order),
+            count=self.count[order],
+            total=self.total[order],
+            nan_count=self.nan_count,
+            nan_total=self.nan_total,
+        )
+
+    def pool(self, min_count: int = 1, max_categories: int | None = None) -> "CategoryStats":
+        """Fold rare categories into a single ``OTHER_KEY`` entry (appended last).
+
+        Categories seen fewer than ``min_count`` times are pooled, and only the
+        ``max_categories`` most frequent of the rest are kept (ties keep the
+        earlier category). Returns ``self`` when nothing is pooled.
+        """
+        count = self.count.astype(np.int64)
+        keep = count >= min_count
+        if max_categories is not None and int(keep.sum()) > max_categories:
+            ranked = np.argsort(np.where(keep, -count, 1), kind="stable")[:max_categories]
+            keep = np.zeros(len(count), dtype=bool)
+            keep[ranked] = True
+        if keep.all():
+            return self
+        categories = self.categories[keep]
+        rare_count = int(count[~keep].sum())
+        rare_total = float(self.total[~keep].sum())
+        count, total = count[keep], self.total[keep].astype(float)
+        pos = categories.get_indexer([OTHER_KEY])[0]
+        if pos >= 0:
+            # a literal "__other__" category already exists: pool into it
+            count[pos] += rare_count
+            total[pos] += rare_total
+        else:
+            categories = categories.append(pd.Index([OTHER_KEY], dtype=object))
+            count = np.append(count, rare_count)
+            total = np.append(total, rare_total)
+        return CategoryStats(categories, compact_counts(count), total, self.nan_count, self.nan_total)
+
+    def merge(self, other: "CategoryStats") -> "CategoryStats":
+        """Return the sum of two sets of statistics; new categories are appended."""
+        idx = self.categories.get_indexer(other.categories)
+        new = idx < 0
+        n_old = len(self.categories)
+        idx[new] = np.arange(n_old, n_old + int(new.sum()))
+        # sum in int64 and re-compact: the merged counts may outgrow either dtype
+        count = np.concatenate([self.count, np.zeros(int(new.sum()), dtype=self.count.dtype)]).astype(np.int64)
+        total = np.concatenate([self.total, np.zeros(int(new.sum()), dtype=self.total.dtype)])
+        # ``other.categories`` is unique, so fancy-index accumulation is safe
+        count[idx] += other.count
+        total[idx] += other.total
+        return CategoryStats(
+            categories=self.categories.append(other.categories[new]),
+            count=compact_counts(count),
+            total=total,
+            nan_count=self.nan_count + other.nan_count,
+            nan_total=self.nan_total + other.nan_total,
+        )
+
+
+class StatsAccumulator:
+    """Accumulate per-column ``CategoryStats`` and target totals across row chunks."""
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, CategoryStats] = {}
+        self.n_rows = 0
+        self.target_sum = 0.0
+
+    def update(
+        self,
+        X: pd.DataFrame,
+        y: np.ndarray,
+        columns: Iterable[str],
+        n_jobs: int | None = 1,
+        n_buckets: int | None = None,
+    ) -> "StatsAccumulator":
+        columns = list(columns)
+        chunks = map_columns(
+            CategoryStats.from_series, [(X[col], y, n_buckets) for col in columns], n_jobs, labels=columns
+        )
+        for col, chunk in zip(columns, chunks):
+            self.stats[col] = self.stats[col].merge(chunk) if col in self.stats else chunk
+        self.n_rows += len(y)
+        self.target_sum += float(y.sum())
+        return self
+
+    @property
+    def target_mean(self) -> float:
+        return self.target_sum / self.n_rows if self.n_rows else float("nan")
+
+
+def check_mergeable(enc, other) -> None:
+    """Raise unless ``enc`` and ``other`` are fitted encoders of one type over the same columns."""
+    if type(other) is not type(enc) or list(other.columns) != list(enc.columns):
+        raise ValueError("Only encoders of the same type over the same columns can be merged")
+    if not getattr(enc, "n_rows_", 0) or not getattr(other, "n_rows_", 0):
+        raise RuntimeError("Both encoders must be fitted before merging")
+
+
+def pooled_mean(enc, other) -> Tuple[float, int]:
+    """Row-weighted ``global_mean`` and total row count of two fitted encoders."""
+    n_rows = enc.n_rows_ + other.n_rows_
+    return (enc.global_mean * enc.n_rows_ + other.global_mean * other.n_rows_) / n_rows, n_rows
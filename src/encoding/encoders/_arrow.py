@@ -0,0 +1,172 @@
+"""Arrow / polars input for the encoders (optional ``pyarrow`` and ``polars``).
+
+A ``pyarrow.Table`` or ``polars.DataFrame`` is wrapped in ``ArrowFrame``, a
+read-only view exposing the few DataFrame operations the encoders use
+(``columns``, ``len``, ``X[col]``). Columns stay Arrow ``ChunkedArray``s:
+``arrow_factorize`` takes the dictionary indices of dictionary-encoded columns
+as integer codes (other columns are dictionary-encoded by Arrow), so
+aggregation and lookup never materialize pandas ``object`` columns.
+
+Encoded output comes back as Arrow: ``"copy"``/``"inplace"`` append the encoded
+columns to the input table (zero-copy for the existing columns),
+``"encoded_only"`` builds a table over the encoded block and ``"ndarray"``
+returns the block itself. Polars input gets a polars DataFrame back.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except Exception:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+try:
+    import polars as pl
+except Exception:  # pragma: no cover - optional dependency
+    pl = None
+
+__all__ = [
+    "ArrowFrame",
+    "as_frame",
+    "is_arrow_column",
+    "arrow_factorize",
+    "fill_null",
+    "target_values",
+]
+
+
+def is_arrow_column(s: Any) -> bool:
+    if pa is not None and isinstance(s, (pa.Array, pa.ChunkedArray)):
+        return True
+    return pl is not None and isinstance(s, pl.Series)
+
+
+def _to_chunked(s: Any) -> "pa.ChunkedArray":
+    if pl is not None and isinstance(s, pl.Series):
+        s = s.to_arrow()
+    if isinstance(s, pa.Array):
+        s = pa.chunked_array([s])
+    return s
+
+
+class ArrowFrame:
+    """Read-only DataFrame-like view over a ``pyarrow.Table``.
+
+    ``source`` records whether the caller passed Arrow or polars, so results
+    are returned in the same library.
+    """
+
+    def __init__(self, table: "pa.Table", source: str = "arrow") -> None:
+        self.table = table
+        self.source = source
+        self.columns = pd.Index(table.column_names)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.table.num_rows, self.table.num_columns)
+
+    @property
+    def dtypes(self) -> pd.Series:
+        return pd.Series(list(self.table.schema.types), index=self.columns, dtype=object)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.table.nbytes)
+
+    def __getitem__(self, key: Union[str, List[str]]):
+        if isinstance(key, list):
+            return ArrowFrame(self.table.select(key), self.source)
+        return self.table.column(key)
+
+    def copy(self, deep: bool = True) -> "ArrowFrame":
+        # Arrow tables are immutable: every "modification" builds a new table
+        return self
+
+    def slice(self, offset: int, length: int) -> "ArrowFrame":
+        return ArrowFrame(self.table.slice(offset, length), self.source)
+
+    def with_columns(self, arrays: Dict[str, Any], drop: Iterable[str] = ()) -> "ArrowFrame":
+        """New frame with ``arrays`` replacing same-named columns or appended, minus ``drop``."""
+        table = self.table
+        for name, values in arrays.items():
+            arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values)
+            if name in table.column_names:
+                table = table.set_column(table.column_names.index(name), name, arr)
+            else:
+                table = table.append_column(name, arr)
+        drop = [c for c in drop if c in table.column_names]
+        if drop:
+            table = table.drop_columns(drop)
+        return ArrowFrame(table, self.source)
+
+    def to_numpy(self, dtype: Any = None) -> np.ndarray:
+        out = np.empty((len(self), self.table.num_columns), dtype=dtype or float, order="F")
+        for j, col in enumerate(self.table.columns):
+            out[:, j] = col.to_numpy()
+        return out
+
+    def unwrap(self):
+        """The underlying ``pyarrow.Table`` (or polars DataFrame for polars input)."""
+        if self.source == "polars":
+            return pl.from_arrow(self.table)
+        return self.table
+
+
+def as_frame(X: Any):
+    """Wrap Arrow/polars frames in ``ArrowFrame``; anything else is returned unchanged."""
+    if pa is not None and isinstance(X, pa.Table):
+        return ArrowFrame(X, "arrow")
+    if pl is not None and isinstance(X, pl.DataFrame):
+        return ArrowFrame(X.to_arrow(), "polars")
+    return X
+
+
+def arrow_factorize(s: Any) -> Tuple[np.ndarray, pd.Index]:
+    """Integer codes (``-1`` for null and ``NaN``) and uniques of an Arrow or polars column.
+
+    Dictionary-encoded columns reuse their indices; chunks with different
+    dictionaries are unified first. Only the dictionary is converted to pandas
+    and factorized like a pandas column, so null or ``NaN`` dictionary entries
+    get code ``-1`` and duplicate entries share one code, exactly as
+    ``pd.factorize`` would encode the same values.
+    """
+    col = _to_chunked(s)
+    if not pa.types.is_dictionary(col.type):
+        col = pc.dictionary_encode(col)
+    if col.num_chunks == 0:
+        return np.empty(0, dtype=np.intp), pd.Index([])
+    col = col.unify_dictionaries()
+    dictionary = col.chunk(0).dictionary
+    indices = pa.chunked_array([chunk.indices for chunk in col.chunks], type=col.type.index_type)
+    # index types may be unsigned; widen before marking nulls with -1
+    codes = pc.fill_null(indices.cast(pa.int64()), -1).to_numpy().astype(np.intp, copy=False)
+    entry_codes, uniques = pd.factorize(dictionary.to_pandas(), use_na_sentinel=True)
+    if len(uniques) < len(dictionary):
+        # code -1 picks the appended -1, so null rows stay null
+        codes = np.append(entry_codes, -1).astype(np.intp).take(codes)
+    return codes, pd.Index(uniques)
+
+
+def fill_null(col: "pa.ChunkedArray", value: Any) -> "pa.ChunkedArray":
+    """Replace nulls with ``value``, keeping dictionary columns dictionary-encoded."""
+    if pa.types.is_dictionary(col.type):
+        filled = pc.fill_null(col.cast(col.type.value_type), value)
+        return pc.dictionary_encode(filled)
+    return pc.fill_null(col, value)
+
+
+def target_values(y: Any) -> Any:
+    """NumPy values of an Arrow/polars target; pandas and NumPy targets pass through."""
+    if is_arrow_column(y):
+        return _to_chunked(y).to_numpy()
+    return y
@@ -0,0 +1,424 @@
+"""Supervised binning of numeric features for WoE.
+
+A numeric column is sorted once; cumulative event counts over the sorted
+values give the statistics of any contiguous range in O(1). Quantile
+pre-bins (cut at the end of runs of tied values) are then merged on those small
+arrays only:
+
+* ``"monotonic"`` – pool-adjacent-violators on the event rate, in the direction
+  with the higher IV, followed by merges enforcing ``min_bin_size`` and ``max_bins``;
+* ``"optimal"`` – dynamic programming over the pre-bins for the partition with
+  the highest IV, with at most ``max_bins`` bins of at least ``min_bin_size`` rows.
+
+The fitted bins are kept as arrays (``NumericBins.edges``), so transform is one
+``np.searchsorted`` per column. Their row/event counts are kept too, so bins
+with the same edges can be merged and re-smoothed (``refit``) without the data.
+
+For chunked fits, ``BinSketch`` reduces each block to counts on a fixed grid of
+quantile cells, so memory does not grow with the number of rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._arrow import is_arrow_column, target_values
+from ._lookup import sample_rows, scale_counts
+
+__all__ = ["BINNING_METHODS", "NumericBins", "fit_bins", "woe_iv"]
+
+BINNING_METHODS = ("monotonic", "optimal")
+
+
+def woe_iv(total: np.ndarray, bad: np.ndarray, alpha: float) -> Tuple[np.ndarray, float]:
+    """WoE per group and total IV from row and event counts, with Laplace ``alpha``."""
+    good = total - bad + alpha
+    bad = bad + alpha
+    dist_good = good / good.sum()
+    dist_bad = bad / bad.sum()
+    woe = np.log(dist_good / dist_bad)
+    return woe, float(((dist_good - dist_bad) * woe).sum())
+
+
+def numeric_values(s: Any) -> np.ndarray:
+    """``float`` values of a pandas, NumPy, Arrow or polars column (missing → ``NaN``)."""
+    if is_arrow_column(s):
+        return np.asarray(target_values(s), dtype=float)
+    if isinstance(s, pd.Series):
+        return s.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(s, dtype=float)
+
+
+@dataclass(frozen=True)
+class NumericBins:
+    """Right-closed bins ``(edges[i-1], edges[i]]`` with their WoE and counts."""
+
+    edges: np.ndarray
+    woe: np.ndarray
+    count: np.ndarray
+    bad: np.ndarray
+    nan_woe: Optional[float] = None
+    nan_count: int = 0
+    nan_bad: float = 0.0
+
+    def labels(self) -> List[str]:
+        bounds = [-np.inf, *self.edges.tolist(), np.inf]
+        return [f"({lo:g}, {hi:g}]" for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def mapping(self) -> Dict[str, float]:
+        """``{interval label: woe}`` (plus ``"__nan__"``), as stored in ``woe_log_``."""
+        out = dict(zip(self.labels(), self.woe.tolist()))
+        if self.nan_woe is not None:
+            out["__nan__"] = float(self.nan_woe)
+        return out
+
+    def _nan_fill(self, default: float, nan_default: Optional[float]) -> float:
+        if self.nan_woe is not None:
+            return self.nan_woe
+        return default if nan_default is None else nan_default
+
+    def lookup(self, s: Any, default: float, nan_default: Optional[float] = None) -> np.ndarray:
+        """One ``searchsorted`` over the edges; ``NaN`` rows get ``nan_woe`` (or ``nan_default``/``default``)."""
+        x = numeric_values(s)
+        out = self.woe.take(np.searchsorted(self.edges, x, side="left"))
+        missing = np.isnan(x)
+        if missing.any():
+            out[missing] = self._nan_fill(default, nan_default)
+        return out
+
+    def slot_labels(self) -> List[str]:
+        return [*self.labels(), "__unseen__", "__nan__"]
+
+    def lookup_hits(
+        self,
+        s: Any,
+        default: float,
+        nan_default: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``lookup`` plus the rows per bin (slots of ``slot_labels``), as ``(values, slots, counts)``.
+
+        Above ``max_rows`` rows the bins are estimated from a sample (see ``sample_rows``); ``NaN`` is exact.
+        """
+        x = numeric_values(s)
+        pos = np.searchsorted(self.edges, x, side="left")
+        out = self.woe.take(pos)
+        missing = np.isnan(x)
+        if missing.any():
+            out[missing] = self._nan_fill(default, nan_default)
+        n_nan = int(np.count_nonzero(missing))  # exact: the mask is already built
+        n_bins = len(self.edges) + 1
+        sample = sample_rows(len(pos), max_rows)
+        if sample is None:
+            counts = np.bincount(pos, minlength=n_bins)
+            counts[-1] -= n_nan  # NaN sorts past the last edge
+        else:
+            drawn = pos.take(sample)[~missing.take(sample)]
+            counts = scale_counts(np.bincount(drawn, minlength=n_bins), len(x) - n_nan, len(drawn))
+        return out, np.arange(n_bins + 2), np.append(counts, [0, n_nan])
+
+    def astype(self, dtype: Any) -> "NumericBins":
+        return replace(self, woe=self.woe.astype(dtype, copy=False))
+
+    def refit(self, alpha: float, include_nan: bool = True) -> Tuple["NumericBins", float]:
+        """Recompute WoE and IV from the stored counts. Returns ``(bins, iv)``."""
+        use_nan = include_nan and self.nan_count > 0
+        total = self.count.astype(float)
+        bad = np.asarray(self.bad, dtype=float)
+        if use_nan:
+            total = np.append(total, self.nan_count)
+            bad = np.append(bad, self.nan_bad)
+        if not len(total):
+            return replace(self, woe=np.zeros(1), nan_woe=None), 0.0
+        woe, iv = woe_iv(total, bad, alpha)
+        n_bins = len(self.count)
+        return replace(
+            self,
+            woe=woe[:n_bins] if n_bins else np.zeros(1),
+            nan_woe=float(woe[-1]) if use_nan else None,
+        ), iv
+
+    def merge(self, other: "NumericBins") -> "NumericBins":
+        """Sum the counts of bins with identical edges (WoE is stale until ``refit``)."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Bins with different edges cannot be merged.")
+        return replace(
+            self,
+            count=self.count + other.count,
+            bad=self.bad + other.bad,
+            nan_count=self.nan_count + other.nan_count,
+            nan_bad=self.nan_bad + other.nan_bad,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "edges": self.edges.tolist(),
+            "woe": self.woe.tolist(),
+            "count": self.count.tolist(),
+            "bad": self.bad.tolist(),
+            "nan_woe": self.nan_woe,
+            "nan_count": int(self.nan_count),
+            "nan_bad": float(self.nan_bad),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NumericBins":
+        return cls(
+            edges=np.asarray(data["edges"], dtype=float),
+            woe=np.asarray(data["woe"], dtype=float),
+            count=np.asarray(data.get("count", []), dtype=np.int64),
+            bad=np.asarray(data.get("bad", []), dtype=float),
+            nan_woe=data.get("nan_woe"),
+            nan_count=data.get("nan_count", 0),
+            nan_bad=data.get("nan_bad", 0.0),
+        )
+
+
+def _prebins(xs: np.ndarray, n_prebins: int) -> np.ndarray:
+    """End positions (exclusive) of quantile pre-bins over sorted ``xs``; ties never split."""
+    n = len(xs)
+    q = xs[(np.arange(1, n_prebins) * n) // n_prebins]
+    cuts = np.unique(np.searchsorted(xs, q, side="right"))
+    cuts = cuts[(cuts > 0) & (cuts < n)]
+    return np.append(cuts, n)
+
+
+def _iv_terms(count: np.ndarray, bad: np.ndarray, n_good: float, n_bad: float, alpha: float) -> np.ndarray:
+    g = (count - bad + alpha) / (n_good + alpha)
+    b = (bad + alpha) / (n_bad + alpha)
+    return (g - b) * np.log(g / b)
+
+
+def _pav(count: np.ndarray, bad: np.ndarray, increasing: bool) -> List[int]:
+    """Pool adjacent violators on the event rate; returns group end indices (exclusive)."""
+    stack: List[List[float]] = []  # [count, bad, end]
+    for i in range(len(count)):
+        c, b = float(count[i]), float(bad[i])
+        while stack:
+            pc, pb, _ = stack[-1]
+            prev, cur = pb / pc, b / c
+            if (prev <= cur) if increasing else (prev >= cur):
+                break
+            stack.pop()
+            c += pc
+            b += pb
+        stack.append([c, b, i + 1])
+    return [int(end) for _, _, end in stack]
+
+
+def _group(count: np.ndarray, bad: np.ndarray, ends: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    starts = np.asarray([0, *ends[:-1]], dtype=np.intp)
+    return np.add.reduceat(count, starts), np.add.reduceat(bad, starts)
+
+
+def _merge_small(count, bad, ends, min_rows, max_bins, n_good, n_bad, alpha) -> List[int]:
+    """Merge adjacent groups (least IV loss first) until size and count limits hold."""
+    ends = list(ends)
+    while len(ends) > 1:
+        gc, gb = _group(count, bad, ends)
+        small = gc < min_rows
+        if not small.any() and len(ends) <= max_bins:
+            break
+        terms = _iv_terms(gc, gb, n_good, n_bad, alpha)
+        merged = _iv_terms(gc[:-1] + gc[1:], gb[:-1] + gb[1:], n_good, n_bad, alpha)
+        loss = terms[:-1] + terms[1:] - merged
+        if small.any():
+            # only pairs touching an undersized group are candidates
+            loss = np.where(small[:-1] | small[1:], loss, np.inf)
+        j = int(np.argmin(loss))
+        del ends[j]
+    return ends
+
+
+def _optimal(count, bad, min_rows, max_bins, n_good, n_bad, alpha) -> List[int]:
+    """Highest-IV partition of the pre-bins into ≤ ``max_bins`` groups of ≥ ``min_rows`` rows."""
+    m = len(count)
+    cc = np.concatenate([[0], np.cumsum(count)])
+    cb = np.concatenate([[0.0], np.cumsum(bad)])
+    seg_n = cc[None, :] - cc[:, None]  # rows of pre-bins i..j-1
+    seg_b = cb[None, :] - cb[:, None]
+    valid = (np.arange(m + 1)[None, :] > np.arange(m + 1)[:, None]) & (seg_n >= min_rows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        seg = np.where(valid, _iv_terms(seg_n, seg_b, n_good, n_bad, alpha), -np.inf)
+    best = np.full(m + 1, -np.inf)
+    best[0] = 0.0
+    back = []
+    results = []
+    for _ in range(min(max_bins, m)):
+        cand = best[:, None] + seg
+        arg = cand.argmax(axis=0)
+        best = cand[arg, np.arange(m + 1)]
+        back.append(arg)
+        results.append(best[m])
+    if not np.isfinite(max(results, default=-np.inf)):
+        return [m]
+    k = int(np.argmax(results))
+    ends, j = [], m
+    for level in range(k, -1, -1):
+        ends.append(j)
+        j = int(back[level][j])
+    return sorted(ends)
+
+
+def fit_bins(
+    x: np.ndarray,
+    y: np.ndarray,
+    method: str = "monotonic",
+    n_prebins: int = 20,
+    max_bins: int = 6,
+    min_bin_size: float = 0.05,
+    alpha: float = 0.5,
+    include_nan: bool = True,
+) -> Tuple[NumericBins, float]:
+    """Bin one numeric column against a binary target. Returns ``(bins, iv)``."""
+    if method not in BINNING_METHODS:
+        raise ValueError(f"binning must be one of {BINNING_METHODS}, got {method!r}")
+    missing = np.isnan(x)
+    xv, yv = x[~missing], y[~missing]
+    order = np.argsort(xv, kind="stable")
+    xs = xv[order]
+    cum_bad = np.concatenate([[0.0], np.cumsum(yv[order])])
+
+    if len(xs) == 0:
+        ends = np.empty(0, dtype=np.int64)
+    else:
+        ends = _prebins(xs, n_prebins)
+    bounds = np.concatenate([[0], ends]).astype(np.int64)
+    return _bin_prebins(
+        np.diff(bounds),
+        np.diff(cum_bad[bounds]),
+        xs[bounds[1:] - 1],
+        int(missing.sum()),
+        float(y[missing].sum()),
+        method,
+        max_bins,
+        min_bin_size,
+        alpha,
+        include_nan,
+    )
+
+
+def _bin_prebins(count, bad, right, nan_count, nan_bad, method, max_bins, min_bin_size, alpha, include_nan):
+    """Merge pre-bins (``count``/``bad`` rows, ``right`` = largest value of each) into bins."""
+    n = int(count.sum())
+    n_bad = float(bad.sum())
+    n_good = n - n_bad
+    min_rows = int(np.ceil(min_bin_size * n))
+
+    if len(count) > 1:
+        if method == "optimal":
+            groups = _optimal(count, bad, min_rows, max_bins, n_good, n_bad, alpha)
+        else:
+            options = []
+            for increasing in (True, False):
+                g = _pav(count, bad, increasing)
+                g = _merge_small(count, bad, g, min_rows, max_bins, n_good, n_bad, alpha)
+                gc, gb = _group(count, bad, g)
+                options.append((_iv_terms(gc, gb, n_good, n_bad, alpha).sum(), g))
+            groups = max(options, key=lambda o: o[0])[1]
+    else:
+        groups = [len(count)] if len(count) else []
+
+    if groups:
+        gc, gb = _group(count, bad, groups)
+        edges = right[np.asarray(groups[:-1], dtype=np.int64) - 1]
+    else:
+        gc, gb = np.empty(0, dtype=np.int64), np.empty(0)
+        edges = np.empty(0)
+
+    bins = NumericBins(
+        edges=np.asarray(edges, dtype=float),
+        woe=np.zeros(max(len(gc), 1)),
+        count=gc.astype(np.int64),
+        bad=np.asarray(gb, dtype=float),
+        nan_count=nan_count,
+        nan_bad=nan_bad,
+    )
+    return bins.refit(alpha, include_nan)
+
+
+class BinSketch:
+    """Bounded summary of a numeric column fed in blocks, for ``partial_fit``.
+
+    The first block is kept as is, so a single-block fit is exactly ``fit_bins``.
+    When a second block arrives, the first one fixes a grid of up to ``n_cells``
+    quantile cuts (each cut an observed value) and every block is reduced to exact
+    row/event counts per cell; the raw values are dropped. Pre-bins are then
+    whole cells, so the bin counts stay exact and only the edges are limited to
+    the grid: values outside the first block's range share its end cells.
+    """
+
+    def __init__(self, n_cells: int = 1024):
+        self.n_cells = n_cells
+        self.cuts: Optional[np.ndarray] = None
+        self.count: Optional[np.ndarray] = None
+        self.bad: Optional[np.ndarray] = None
+        self.nan_count = 0
+        self.nan_bad = 0.0
+        self._block: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._n_blocks = 0
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> "BinSketch":
+        self._n_blocks += 1
+        if self._n_blocks == 1:
+            self._block = (x, y)
+            return self
+        if self._block is not None:
+            self._add(*self._block)
+            self._block = None
+        return self._add(x, y)
+
+    def _add(self, x: np.ndarray, y: np.ndarray) -> "BinSketch":
+        missing = np.isnan(x)
+        self.nan_count += int(missing.sum())
+        self.nan_bad += float(y[missing].sum())
+        xv, yv = x[~missing], y[~missing]
+        if not len(xv):
+            return self
+        if self.cuts is None:
+            xs = np.sort(xv)
+            n = len(xs)
+            self.cuts = np.unique(xs[(np.arange(1, self.n_cells + 1) * n) // self.n_cells - 1])
+            self.count = np.zeros(len(self.cuts) + 1, dtype=np.int64)
+            self.bad = np.zeros(len(self.cuts) + 1)
+        # cell i holds (cuts[i-1], cuts[i]]; the last one everything above cuts[-1]
+        cells = np.searchsorted(self.cuts, xv, side="left")
+        self.count += np.bincount(cells, minlength=len(self.count))
+        self.bad += np.bincount(cells, weights=yv, minlength=len(self.bad))
+        return self
+
+    def fit(
+        self,
+        method: str = "monotonic",
+        n_prebins: int = 20,
+        max_bins: int = 6,
+        min_bin_size: float = 0.05,
+        alpha: float = 0.5,
+        include_nan: bool = True,
+    ) -> Tuple[NumericBins, float]:
+        """Bin the streamed column like ``fit_bins``. Returns ``(bins, iv)``."""
+        if self._block is not None:
+            x, y = self._block
+            return fit_bins(x, y, method, n_prebins, max_bins, min_bin_size, alpha, include_nan)
+        if method not in BINNING_METHODS:
+            raise ValueError(f"binning must be one of {BINNING_METHODS}, got {method!r}")
+        if self.cuts is None:
+            count, bad, right = np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        else:
+            keep = self.count > 0
+            cells, cell_bad = self.count[keep], self.bad[keep]
+            cell_right = np.append(self.cuts, np.inf)[keep]
+            # cut after the cell holding each quantile row; cells are never split
+            cum = np.cumsum(cells)
+            pos = (np.arange(1, n_prebins) * cum[-1]) // n_prebins
+            ends = np.unique(np.searchsorted(cum, pos, side="right") + 1)
+            ends = np.append(ends[ends < len(cells)], len(cells)).tolist()
+            count, bad = _group(cells, cell_bad, ends)
+            right = cell_right[np.asarray(ends, dtype=np.int64) - 1]
+        return _bin_prebins(
+            count, bad, right, self.nan_count, self.nan_bad, method, max_bins, min_bin_size, alpha, include_nan
+        )
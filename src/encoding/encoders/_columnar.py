@@ -0,0 +1,195 @@
+"""Columnar, memory-mappable binary artefact format for fitted ``WOEGuard`` encoders.
+
+Layout (little-endian)::
+
+    magic     8 bytes   b"WOEGCOL\\0"
+    version   uint32    FORMAT_VERSION
+    hlen      uint64    length of the JSON header
+    header    hlen bytes of UTF-8 JSON (params, IV, array specs)
+    padding   up to the next 64-byte boundary
+    arrays    64-byte aligned category / value arrays, one pair per feature
+
+Numeric categories are stored as ``int64``/``float64`` and string categories as
+sorted fixed-width UTF-8 bytes (``S``), so both can be searched with
+``np.searchsorted`` straight from the mapped pages. WoE values are stored in the
+encoder's ``output_dtype``, so ``transform`` reads them without a cast. Loading with ``mmap=True``
+parses only the header; the arrays are views into a single read-only
+``np.memmap`` and therefore shared by every process that maps the same file.
+Columns whose categories mix types fall back to a pickled block. Numeric
+features binned by ``WOEGuard`` are small and stored in the header (``"bins"``).
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from ._lookup import NAN_KEY, SortedMapping
+
+__all__ = ["MAGIC", "FORMAT_VERSION", "is_columnar", "write_woe", "read_woe"]
+
+MAGIC = b"WOEGCOL\0"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<8sIQ")
+_ALIGN = 64
+
+_PARAMS = (
+    "categorical_cols",
+    "drop_original",
+    "suffix",
+    "alpha",
+    "default_woe",
+    "include_nan",
+    "output_mode",
+    "n_jobs",
+    "output_dtype",
+    "numeric_cols",
+    "binning",
+    "n_prebins",
+    "max_bins",
+    "min_bin_size",
+    "min_count",
+    "max_categories",
+    "n_buckets",
+    "monitor",
+)
+
+
+def is_columnar(path: Union[str, Path]) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGN
+
+
+def _category_array(keys: List[Any]) -> Tuple[str, Any]:
+    """Return ``(kind, array)`` for the categories of one feature."""
+    if all(isinstance(k, str) for k in keys):
+        encoded = [k.encode("utf-8") for k in keys]
+        width = max((len(k) for k in encoded), default=1) or 1
+        return "bytes", np.array(encoded, dtype=f"S{width}")
+    if all(isinstance(k, (bool, int, np.integer)) for k in keys):
+        return "int", np.array(keys, dtype=np.int64)
+    if all(isinstance(k, (bool, int, float, np.integer, np.floating)) for k in keys):
+        return "float", np.array(keys, dtype=np.float64)
+    return "pickle", None
+
+
+def _split(mapping) -> Tuple[str, Any, np.ndarray, Any]:
+    """Split a mapping into sorted category/value arrays plus the ``__nan__`` entry."""
+    if isinstance(mapping, SortedMapping):
+        kind = "bytes" if mapping.categories.dtype.kind == "S" else mapping.categories.dtype.kind
+        kind = {"i": "int", "f": "float"}.get(kind, kind)
+        return kind, mapping.categories, mapping.values, mapping.nan_entry
+    nan_entry = mapping.get(NAN_KEY)
+    keys = [k for k in mapping if not (isinstance(k, str) and k == NAN_KEY)]
+    values = np.fromiter((mapping[k] for k in keys), dtype=np.float64, count=len(keys))
+    kind, cats = _category_array(keys)
+    if kind == "pickle":
+        return kind, keys, values, nan_entry
+    order = np.argsort(cats, kind="stable")
+    return kind, cats[order], values[order], nan_entry
+
+
+def write_woe(encoder, path: Union[str, Path]) -> None:
+    """Write a fitted ``WOEGuard`` to ``path`` in the columnar format."""
+    blobs: List[bytes] = []
+    columns: List[Dict[str, Any]] = []
+    offset = 0
+
+    def add(raw: bytes) -> int:
+        nonlocal offset
+        start = offset
+        blobs.append(raw + b"\0" * _pad(len(raw)))
+        offset += len(raw) + _pad(len(raw))
+        return start
+
+    # values in the serving dtype, so mapped tables need no cast (and no private copy)
+    value_dtype = np.dtype(getattr(encoder, "output_dtype", "float64")).newbyteorder("<")
+    bins = getattr(encoder, "bins_", {})
+    for col, mapping in encoder.woe_log_.items():
+        if col in bins:
+            continue
+        kind, cats, values, nan_entry = _split(mapping)
+        if kind == "pickle":
+            raw = pickle.dumps(cats, protocol=pickle.HIGHEST_PROTOCOL)
+            cat_spec = {"offset": add(raw), "nbytes": len(raw), "dtype": "pickle", "length": len(cats)}
+        else:
+            cats = np.ascontiguousarray(cats)
+            cat_spec = {"offset": add(cats.tobytes()), "nbytes": cats.nbytes, "dtype": cats.dtype.str, "length": len(cats)}
+        values = np.ascontiguousarray(values, dtype=value_dtype)
+        columns.append({
+            "name": col,
+            "kind": kind,
+            "categories": cat_spec,
+            "values": {
+                "offset": add(values.tobytes()),
+                "nbytes": values.nbytes,
+                "dtype": value_dtype.str,
+                "length": len(values),
+            },
+            "nan_woe": None if nan_entry is None else float(nan_entry),
+        })
+
+    rate = encoder.global_event_rate_
+    header = json.dumps({
+        "params": {name: getattr(encoder, name) for name in _PARAMS if hasattr(encoder, name)},
+        "iv_log": {col: float(iv) for col, iv in encoder.iv_log_.items()},
+        "global_event_rate": None if rate is None else float(rate),
+        "columns": columns,
+        "bins": {col: b.to_dict() for col, b in bins.items()},
+    }, ensure_ascii=False).encode("utf-8")
+
+    head = _PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)) + header
+    head += b"\0" * _pad(len(head))
+    with open(path, "wb") as f:
+        f.write(head)
+        for blob in blobs:
+            f.write(blob)
+
+
+def read_woe(path: Union[str, Path], mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Read a columnar artefact. Returns ``(header, woe_log)``.
+
+    ``woe_log`` maps each feature to a ``SortedMapping`` whose arrays are views
+    into the memory-mapped file (or an in-memory buffer when ``mmap=False``).
+    """
+    with open(path, "rb") as f:
+        magic, version, hlen = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a columnar WOEGuard artefact")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported artefact version {version} (max {FORMAT_VERSION})")
+        header = json.loads(f.read(hlen).decode("utf-8"))
+    base = _PREFIX.size + hlen
+    base += _pad(base)
+
+    buf = np.memmap(path, dtype=np.uint8, mode="r") if mmap else np.fromfile(path, dtype=np.uint8)
+
+    def view(spec: Dict[str, Any]) -> np.ndarray:
+        start = base + spec["offset"]
+        return buf[start:start + spec["nbytes"]].view(np.dtype(spec["dtype"]))
+
+    use_nan = header["params"].get("include_nan", True)
+    woe_log: Dict[str, Any] = {}
+    for spec in header["columns"]:
+        values = view(spec["values"])
+        nan_woe = spec["nan_woe"]
+        if spec["kind"] == "pickle":
+            cat = spec["categories"]
+            start = base + cat["offset"]
+            keys = pickle.loads(buf[start:start + cat["nbytes"]].tobytes())
+            mapping = dict(zip(keys, values.tolist()))
+            if nan_woe is not None:
+                mapping[NAN_KEY] = nan_woe
+            woe_log[spec["name"]] = mapping
+        else:
+            woe_log[spec["name"]] = SortedMapping(view(spec["categories"]), values, nan_woe, use_nan)
+    return header, woe_log
@@ -0,0 +1,98 @@
+"""Drift monitoring from the category hits of ``transform``.
+
+Every compiled table resolves a row to a *slot* (a category, a numeric bin,
+``"__unseen__"`` or ``"__nan__"``). With monitoring on, ``lookup_hits`` returns
+the rows per slot next to the WoE values and a ``HitCounter`` adds them to a
+fixed ``int64`` array per feature. The lock is held only for that
+O(unique values) addition. Counts are returned to the caller rather than written
+by the workers, so they are also correct with process backends.
+
+``drift_table`` then compares the accumulated (actual) distribution with the
+training counts (expected):
+
+* PSI – ``Σ (a - e) · ln(a / e)`` over the category shares, with shares floored
+  at ``eps`` so empty categories stay finite;
+* characteristic analysis – ``(a - e) · woe`` per category, the shift of the
+  feature's mean WoE (and so of the score) caused by the population change.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Hashable, List
+
+import numpy as np
+import pandas as pd
+
+from ._lookup import UNSEEN_KEY
+
+__all__ = ["HitCounter", "drift_table"]
+
+
+class HitCounter:
+    """Thread-safe row counts per slot of one feature's compiled table."""
+
+    def __init__(self, labels: List[Hashable]) -> None:
+        self.labels = list(labels)
+        self.hits = np.zeros(len(self.labels), dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def add(self, slots: np.ndarray, counts: np.ndarray) -> None:
+        with self._lock:
+            np.add.at(self.hits, slots, counts)
+
+    def snapshot(self) -> pd.Series:
+        """Counts per label; labels appearing twice (a literal ``"__nan__"``) are summed."""
+        with self._lock:
+            hits = self.hits.copy()
+        return pd.Series(hits, index=pd.Index(self.labels, dtype=object)).groupby(level=0, sort=False).sum()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits[:] = 0
+
+    def __getstate__(self):
+        with self._lock:
+            return {"labels": self.labels, "hits": self.hits.copy()}
+
+    def __setstate__(self, state) -> None:
+        self.labels = state["labels"]
+        self.hits = state["hits"]
+        self._lock = threading.Lock()
+
+
+def drift_table(
+    feature: str,
+    expected: pd.Series,
+    actual: pd.Series,
+    woe: Callable[[Hashable], float],
+    other_key: Hashable,
+    eps: float = 1e-4,
+) -> pd.DataFrame:
+    """Per-category expected/actual counts and shares, PSI term and WoE shift of ``feature``.
+
+    Unseen rows are reported under ``other_key`` when the training data pooled
+    rare categories there, since they are encoded with its WoE.
+    """
+    if other_key in expected.index and UNSEEN_KEY in actual.index:
+        actual = actual.rename({UNSEEN_KEY: other_key}).groupby(level=0, sort=False).sum()
+    both = pd.concat({"expected": expected, "actual": actual}, axis=1, sort=False).fillna(0)
+    both = both[(both["expected"] > 0) | (both["actual"] > 0)]
+    e = both["expected"].to_numpy(dtype=float)
+    a = both["actual"].to_numpy(dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        e_pct = e / e.sum()
+        a_pct = a / a.sum()
+    e_floor, a_floor = np.maximum(e_pct, eps), np.maximum(a_pct, eps)
+    woe_values = np.array([woe(c) for c in both.index], dtype=float)
+    return pd.DataFrame({
+        "feature": feature,
+        "category": both.index.to_numpy(dtype=object),
+        "expected": e.astype(np.int64),
+        "actual": a.astype(np.int64),
+        "expected_pct": e_pct,
+        "actual_pct": a_pct,
+        "psi": (a_floor - e_floor) * np.log(a_floor / e_floor),
+        "woe": woe_values,
+        "woe_shift": (a_pct - e_pct) * woe_values,
+    })
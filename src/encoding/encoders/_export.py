@@ -0,0 +1,82 @@
+"""Export of report tables to CSV, Parquet or streamed XLSX.
+
+``pd.ExcelWriter`` builds the whole workbook in memory and silently fails past
+Excel's row limit. ``export_table`` instead streams XLSX rows through an
+``openpyxl`` write-only workbook in fixed-size batches (memory independent of
+the table length) and continues on a new sheet (``<name>_2``, ``<name>_3``, …)
+every ``EXCEL_MAX_ROWS - 1`` data rows. CSV and Parquet are written by pandas
+(Parquet needs ``pyarrow``).
+
+All three writers get the same table from ``_normalize``: ``object`` columns
+(``category`` mixes numeric categories, bin labels and ``"__nan__"``) become
+strings, with missing values kept missing.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import pandas as pd
+
+__all__ = ["EXCEL_MAX_ROWS", "EXPORT_FORMATS", "export_table"]
+
+EXCEL_MAX_ROWS = 1_048_576
+EXPORT_FORMATS = ("csv", "parquet", "xlsx")
+_BATCH = 10_000
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast ``object`` columns to ``str`` (missing stays missing) so every format has one schema."""
+    mixed = [c for c in df.columns if df[c].dtype == object]
+    if not mixed:
+        return df
+    out = df.copy(deep=False)
+    for col in mixed:
+        s = out[col]
+        out[col] = s.astype(str).astype(object).where(s.notna(), None)
+    return out
+
+
+def _rows(df: pd.DataFrame) -> Iterator[tuple]:
+    """Rows of ``df`` as plain Python values, ``NaN`` → ``None`` (an empty cell)."""
+    for start in range(0, len(df), _BATCH):
+        block = df.iloc[start:start + _BATCH].astype(object)
+        yield from block.where(block.notna(), None).itertuples(index=False, name=None)
+
+
+def _write_xlsx(df: pd.DataFrame, path: Union[str, Path], sheet_name: str, max_rows: int) -> None:
+    try:
+        from openpyxl import Workbook
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("XLSX export requires openpyxl; use a .csv or .parquet path instead.") from exc
+    per_sheet = max_rows - 1  # one row per sheet for the header
+    wb = Workbook(write_only=True)
+    n_sheets = max(1, -(-len(df) // per_sheet))
+    for i in range(n_sheets):
+        title = sheet_name if i == 0 else f"{sheet_name[:27]}_{i + 1}"
+        ws = wb.create_sheet(title[:31])
+        ws.append([str(c) for c in df.columns])
+        for row in _rows(df.iloc[i * per_sheet:(i + 1) * per_sheet]):
+            ws.append(row)
+    wb.save(path)
+
+
+def export_table(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    sheet_name: str = "Sheet1",
+    max_rows: int = EXCEL_MAX_ROWS,
+) -> None:
+    """Write ``df`` to ``path``; ``format`` defaults to the file extension."""
+    fmt = (format or Path(path).suffix.lstrip(".")).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {EXPORT_FORMATS}, got {fmt!r}")
+    df = _normalize(df)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        _write_xlsx(df, path, sheet_name, max_rows)
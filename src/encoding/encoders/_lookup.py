@@ -0,0 +1,321 @@
+"""Compiled category → value lookup tables used at transform time.
+
+A mapping such as ``woe_log_[col]`` is compiled once into a sorted category
+index and an aligned value array stored in the encoder's output dtype
+(``float64``/``float32``/``float16``), so the gather writes the final dtype. Rows are resolved by factorizing
+the input column, looking up only its *unique* values, and gathering the result
+with a single ``take`` over the integer codes. Unseen categories and ``NaN`` are
+part of that small per-unique table, so no ``fillna`` pass is needed afterwards.
+
+``SortedMapping`` offers the same lookup over plain sorted NumPy arrays (numeric
+or UTF-8 bytes) using ``np.searchsorted``; it needs no hash table, so it works
+directly on memory-mapped artefacts shared between processes.
+
+``HashedMapping`` wraps either one for encoders fitted with the hashing trick:
+rows are reduced to their hash bucket and the wrapped table is resolved once
+over the fixed bucket range.
+
+``lookup_hits`` is the same lookup that also reports how many rows fell in each
+*slot* of the table – one per category, then ``"__unseen__"`` and ``"__nan__"``
+(``slot_labels``). The counts come from the codes the lookup already computed
+and are returned per unique value. With ``max_rows``, the seen categories of
+larger inputs are counted on a fresh random sample of ``max_rows`` rows and
+scaled to the full size, while the unseen and ``NaN`` slots – rare, and the
+main drift signal – are always counted exactly with a few vectorized
+comparisons. Drift monitoring (see ``_drift``) then costs a small amount per
+batch instead of a full ``bincount`` pass over the rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ._aggregation import factorize, hash_buckets
+
+__all__ = ["CompiledMapping", "SortedMapping", "HashedMapping"]
+
+NAN_KEY = "__nan__"
+UNSEEN_KEY = "__unseen__"
+
+
+def sample_rows(n_rows: int, max_rows: Optional[int]) -> Optional[np.ndarray]:
+    """Positions of ``max_rows`` random rows of ``n_rows`` (fresh draw per call), or ``None`` to count all."""
+    if not max_rows or n_rows <= max_rows:
+        return None
+    return np.random.default_rng().integers(0, n_rows, max_rows)
+
+
+def scale_counts(counts: np.ndarray, total: int, n_sampled: int) -> np.ndarray:
+    """``counts`` over ``n_sampled`` sampled rows scaled to ``total`` rows."""
+    if not n_sampled:
+        return np.zeros_like(counts)
+    return np.rint(counts * (total / n_sampled)).astype(np.int64)
+
+
+def unique_hits(
+    codes: np.ndarray, slots: np.ndarray, n_seen: int, max_rows: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows per unique value: ``(slots, counts)`` where ``slots`` ends with the ``NaN`` slot (code ``-1``).
+
+    Slots from ``n_seen`` on (unseen values, ``NaN``) are always counted
+    exactly. Above ``max_rows`` rows the seen categories are estimated from a
+    sample (see ``sample_rows``) and scaled to the remaining rows.
+    """
+    sample = sample_rows(len(codes), max_rows)
+    if sample is None:
+        per_code = np.bincount(codes + 1, minlength=len(slots))
+        return slots, np.append(per_code[1:], per_code[0])
+    rare = slots >= n_seen  # indexed like the lookup table: code -1 picks the last entry
+    positions = np.flatnonzero(rare)
+    counts = np.zeros(len(slots), dtype=np.int64)
+    if len(positions) <= 4:
+        for pos in positions:
+            counts[pos] = np.count_nonzero(codes == (-1 if pos == len(slots) - 1 else pos))
+    else:
+        hits = np.bincount(codes[rare.take(codes)] + 1, minlength=len(slots))
+        counts[positions] = np.append(hits[1:], hits[0])[positions]
+    drawn = codes.take(sample)
+    drawn = drawn[~rare.take(drawn)]
+    seen = np.bincount(drawn, minlength=len(slots))
+    counts[~rare] = scale_counts(seen[~rare], len(codes) - int(counts.sum()), len(drawn))
+    return slots, counts
+
+
+@dataclass(frozen=True)
+class CompiledMapping:
+    """Sorted category/value arrays compiled from a ``{category: value}`` dict."""
+
+    categories: pd.Index
+    values: np.ndarray
+    nan_key: Optional[Hashable] = None
+    # value of the ``nan_key`` entry, resolved once at compile time (``None`` if absent)
+    nan_entry: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.nan_key is not None:
+            pos = self.categories.get_indexer([self.nan_key])[0]
+            if pos >= 0:
+                object.__setattr__(self, "nan_entry", float(self.values[pos]))
+
+    @classmethod
+    def from_dict(
+        cls,
+        mapping: Dict[Hashable, float],
+        nan_key: Optional[Hashable] = None,
+        dtype: Any = np.float64,
+    ) -> "CompiledMapping":
+        categories = pd.Index(list(mapping.keys()))
+        values = np.fromiter(mapping.values(), dtype=dtype, count=len(mapping))
+        try:
+            order = categories.argsort()
+        except TypeError:
+            order = None
+        if order is not None:
+            categories = categories.take(order)
+            values = values[order]
+        return cls(categories=categories, values=values, nan_key=nan_key)
+
+    def nan_value(self, default: float) -> float:
+        """Value assigned to ``NaN`` rows: the ``nan_key`` entry, if present, else ``default``."""
+        return default if self.nan_entry is None else self.nan_entry
+
+    def table(
+        self,
+        uniques: pd.Index,
+        default: float,
+        idx: Optional[np.ndarray] = None,
+        nan_default: Optional[float] = None,
+    ) -> np.ndarray:
+        """Values for ``uniques`` followed by the ``NaN`` value (picked by code ``-1``).
+
+        Unseen values get ``default``; ``NaN`` gets the ``NaN`` entry, else
+        ``nan_default`` (``default`` when not given).
+        """
+        if idx is None:
+            idx = self.categories.get_indexer(uniques)
+        out = np.empty(len(uniques) + 1, dtype=self.values.dtype)
+        np.copyto(out[:-1], default)
+        hit = idx >= 0
+        out[:-1][hit] = self.values[idx[hit]]
+        out[-1] = self.nan_value(default if nan_default is None else nan_default)
+        return out
+
+    def lookup(self, s: pd.Series, default: float, nan_default: Optional[float] = None) -> np.ndarray:
+        """Resolve every row of ``s`` in one vectorized gather over its integer codes."""
+        codes, uniques = factorize(s)
+        return self.table(uniques, default, nan_default=nan_default).take(codes)
+
+    def slot_labels(self) -> List[Hashable]:
+        return [*self.categories, UNSEEN_KEY, NAN_KEY]
+
+    def lookup_hits(
+        self,
+        s: pd.Series,
+        default: float,
+        nan_default: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``lookup`` plus the rows per slot of ``slot_labels``, as ``(values, slots, counts)``.
+
+        Seen-category counts are estimated from a sample when ``s`` has more than ``max_rows`` rows.
+        """
+        codes, uniques = factorize(s)
+        idx = self.categories.get_indexer(uniques)
+        n = len(self.categories)
+        slots = np.append(np.where(idx >= 0, idx, n), n + 1)
+        return (self.table(uniques, default, idx, nan_default).take(codes), *unique_hits(codes, slots, n, max_rows))
+
+
+@dataclass(frozen=True, eq=False)
+class SortedMapping(Mapping):
+    """Read-only ``{category: value}`` view over sorted category/value arrays.
+
+    ``categories`` is a sorted numeric array or a sorted ``S`` (UTF-8 bytes)
+    array; the optional ``nan_value`` is exposed under the ``"__nan__"`` key and
+    is used for ``NaN`` rows when ``use_nan`` is set.
+    """
+
+    categories: np.ndarray
+    values: np.ndarray
+    nan_entry: Optional[float] = None
+    use_nan: bool = True
+
+    @property
+    def _is_bytes(self) -> bool:
+        return self.categories.dtype.kind == "S"
+
+    def _encode(self, uniques: Any) -> Optional[np.ndarray]:
+        """Convert query values to the category dtype; ``None`` if impossible."""
+        arr = np.asarray(uniques)
+        if self._is_bytes:
+            if arr.dtype.kind == "U":
+                return np.char.encode(arr, "utf-8")
+            if arr.dtype.kind == "O" and all(isinstance(u, str) for u in arr):
+                return np.char.encode(arr.astype(str), "utf-8")
+            return arr if arr.dtype.kind == "S" else None
+        if arr.dtype.kind not in "biuf":
+            return None
+        return arr
+
+    def indexer(self, uniques: Any) -> np.ndarray:
+        """Positions of ``uniques`` in ``categories`` (``-1`` when absent)."""
+        n = len(uniques)
+        keys = self._encode(uniques)
+        if keys is None or not len(self.categories):
+            return np.full(n, -1, dtype=np.intp)
+        pos = np.searchsorted(self.categories, keys)
+        pos[pos >= len(self.categories)] = 0
+        return np.where(self.categories[pos] == keys, pos, -1)
+
+    def nan_value(self, default: float) -> float:
+        if self.use_nan and self.nan_entry is not None:
+            return self.nan_entry
+        return default
+
+    def _literal_nan(self, uniques: pd.Index) -> Optional[np.ndarray]:
+        # a literal "__nan__" category behaves like the one seen at fit time
+        if self.nan_entry is None or pd.api.types.is_numeric_dtype(uniques.dtype):
+            return None
+        return np.asarray(uniques == NAN_KEY, dtype=bool)
+
+    def table(
+        self,
+        uniques: pd.Index,
+        default: float,
+        idx: Optional[np.ndarray] = None,
+        nan_default: Optional[float] = None,
+    ) -> np.ndarray:
+        """Values for ``uniques`` followed by the ``NaN`` value (picked by code ``-1``).
+
+        Unseen values get ``default``; ``NaN`` gets the ``NaN`` entry, else
+        ``nan_default`` (``default`` when not given).
+        """
+        if idx is None:
+            idx = self.indexer(uniques)
+        out = np.empty(len(uniques) + 1, dtype=self.values.dtype)
+        np.copyto(out[:-1], default)
+        hit = idx >= 0
+        out[:-1][hit] = self.values[idx[hit]]
+        literal = self._literal_nan(uniques)
+        if literal is not None:
+            out[:-1][literal] = self.nan_entry
+        out[-1] = self.nan_value(default if nan_default is None else nan_default)
+        return out
+
+    def lookup(self, s: pd.Series, default: float, nan_default: Optional[float] = None) -> np.ndarray:
+        codes, uniques = factorize(s)
+        return self.table(uniques, default, nan_default=nan_default).take(codes)
+
+    def slot_labels(self) -> List[Hashable]:
+        return [*self._decoded(), UNSEEN_KEY, NAN_KEY]
+
+    def lookup_hits(
+        self,
+        s: pd.Series,
+        default: float,
+        nan_default: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        codes, uniques = factorize(s)
+        idx = self.indexer(uniques)
+        n = len(self.categories)
+        slots = np.where(idx >= 0, idx, n)
+        literal = self._literal_nan(uniques)
+        if literal is not None:
+            slots[literal] = n + 1
+        slots = np.append(slots, n + 1)
+        return (self.table(uniques, default, idx, nan_default).take(codes), *unique_hits(codes, slots, n, max_rows))
+
+    # Mapping interface ------------------------------------------------
+    def _decoded(self) -> list:
+        if self._is_bytes:
+            return [c.decode("utf-8") for c in self.categories.tolist()]
+        return self.categories.tolist()
+
+    def __getitem__(self, key: Hashable) -> float:
+        if key == NAN_KEY and self.nan_entry is not None:
+            return self.nan_entry
+        pos = self.indexer([key])[0]
+        if pos < 0:
+            raise KeyError(key)
+        return float(self.values[pos])
+
+    def __iter__(self) -> Iterator[Hashable]:
+        yield from self._decoded()
+        if self.nan_entry is not None:
+            yield NAN_KEY
+
+    def __len__(self) -> int:
+        return len(self.categories) + (self.nan_entry is not None)
+
+
+@dataclass(frozen=True)
+class HashedMapping:
+    """Lookup over hash buckets: ``mapping`` is keyed by bucket id (see ``hash_buckets``)."""
+
+    mapping: Any
+    n_buckets: int
+
+    def lookup(self, s: pd.Series, default: float, nan_default: Optional[float] = None) -> np.ndarray:
+        table = self.mapping.table(pd.RangeIndex(self.n_buckets), default, nan_default=nan_default)
+        return table.take(hash_buckets(s, self.n_buckets))
+
+    def slot_labels(self) -> List[Hashable]:
+        return [*range(self.n_buckets), UNSEEN_KEY, NAN_KEY]
+
+    def lookup_hits(
+        self,
+        s: pd.Series,
+        default: float,
+        nan_default: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        table = self.mapping.table(pd.RangeIndex(self.n_buckets), default, nan_default=nan_default)
+        buckets = hash_buckets(s, self.n_buckets)
+        slots = np.append(np.arange(self.n_buckets), self.n_buckets + 1)
+        return (table.take(buckets), *unique_hits(buckets, slots, self.n_buckets, max_rows))
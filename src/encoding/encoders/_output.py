@@ -0,0 +1,158 @@
+"""Output modes shared by the column encoders.
+
+``output_mode`` controls how encoded columns are returned by ``transform``:
+
+* ``"copy"`` – (default) a copy of ``X`` with the encoded columns added;
+* ``"inplace"`` – encoded columns are written into ``X`` itself, which is returned;
+* ``"encoded_only"`` – a DataFrame holding only the encoded columns;
+* ``"ndarray"`` – a preallocated column-major ``float`` block (rows × encoded columns).
+
+``encoded_only`` and ``ndarray`` share a single preallocated block, so scoring
+needs no memory beyond the input and the encoded values. In ``ndarray`` mode the
+caller may pass that block (``out=``), e.g. a column slice of a wider result.
+
+Arrow/polars input (``_arrow.ArrowFrame``) is answered with Arrow/polars output;
+``"inplace"`` behaves like ``"copy"`` there, which is zero-copy for Arrow.
+
+``output_dtype`` (``"float64"``, ``"float32"`` or ``"float16"``) sets the dtype of
+the encoded columns; ``float32`` halves the output of wide frames at no cost for
+linear models downstream.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ._arrow import ArrowFrame, pa
+
+__all__ = [
+    "OUTPUT_MODES",
+    "OUTPUT_DTYPES",
+    "check_output_mode",
+    "check_output_dtype",
+    "OutputWriter",
+    "estimate_output_bytes",
+    "low_precision_savings",
+]
+
+OUTPUT_MODES = ("copy", "inplace", "encoded_only", "ndarray")
+OUTPUT_DTYPES = ("float64", "float32", "float16")
+
+
+def check_output_mode(mode: str) -> None:
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"output_mode must be one of {OUTPUT_MODES}, got {mode!r}")
+
+
+def check_output_dtype(dtype: Any) -> str:
+    """Validate ``dtype`` and return its canonical name (e.g. ``np.float32`` → ``"float32"``)."""
+    try:
+        name = np.dtype(dtype).name
+    except TypeError:
+        name = None
+    if name not in OUTPUT_DTYPES:
+        raise ValueError(f"output_dtype must be one of {OUTPUT_DTYPES}, got {dtype!r}")
+    return name
+
+
+def estimate_output_bytes(X: pd.DataFrame, n_encoded: int, mode: str, dtype: Any = "float64") -> int:
+    """Bytes returned by ``transform``: the encoded block plus, in ``"copy"`` mode, a copy of ``X``."""
+    out = len(X) * n_encoded * np.dtype(dtype).itemsize
+    if mode == "copy" and not isinstance(X, ArrowFrame):  # appending to Arrow shares the input buffers
+        # shallow usage: copying object columns duplicates pointers, not the objects
+        out += int(X.memory_usage(index=False, deep=False).sum())
+    return out
+
+
+class OutputWriter:
+    """Collect encoded columns into the container requested by ``mode``."""
+
+    def __init__(
+        self,
+        X: pd.DataFrame,
+        names: List[str],
+        mode: str = "copy",
+        drop: Iterable[str] = (),
+        dtype: Any = "float64",
+        out: Optional[np.ndarray] = None,
+    ) -> None:
+        check_output_mode(mode)
+        if out is not None:
+            if mode != "ndarray":
+                raise ValueError(f"out= needs output_mode='ndarray', got {mode!r}")
+            if out.shape != (len(X), len(names)):
+                raise ValueError(f"out has shape {out.shape}, expected {(len(X), len(names))}")
+        self.X = X
+        self.names = list(names)
+        self.mode = mode
+        self.dtype = np.dtype(dtype)
+        self.drop = [c for c in drop if c in X.columns]
+        self.block = None
+        self.arrow = isinstance(X, ArrowFrame)
+        if out is not None or mode in ("encoded_only", "ndarray") or self.arrow:
+            # column-major so every column write and the DataFrame wrap are copy-free
+            if out is None:
+                out = np.empty((len(X), len(self.names)), dtype=self.dtype, order="F")
+            self.block = out
+            self._pos = {name: i for i, name in enumerate(self.names)}
+        elif mode == "copy":
+            self.frame = X.drop(columns=self.drop) if self.drop else X.copy()
+        else:
+            self.frame = X
+
+    def write(self, name: str, values: np.ndarray) -> None:
+        if self.block is not None:
+            self.block[:, self._pos[name]] = values
+        else:
+            self.frame[name] = np.asarray(values).astype(self.dtype, copy=False)
+
+    def result(self) -> Union[pd.DataFrame, np.ndarray]:
+        if self.mode == "ndarray":
+            return self.block
+        if self.arrow:
+            # F-ordered block: every column slice is contiguous, so ``pa.array`` wraps it
+            arrays = {name: pa.array(self.block[:, j]) for j, name in enumerate(self.names)}
+            if self.mode == "encoded_only":
+                return ArrowFrame(pa.table(arrays), self.X.source).unwrap()
+            return self.X.with_columns(arrays, drop=self.drop).unwrap()
+        if self.mode == "encoded_only":
+            return pd.DataFrame(self.block, index=self.X.index, columns=self.names, copy=False)
+        if self.mode == "inplace" and self.drop:
+            self.frame.drop(columns=self.drop, inplace=True)
+        return self.frame
+
+
+def low_precision_savings(out: Any, encoded: Optional[Iterable[Any]] = None) -> int:
+    """Bytes saved by sub-``float64`` encoded values in ``out`` compared with ``float64``.
+
+    Works on DataFrames (per float column), dense arrays and scipy sparse matrices.
+    ``encoded`` restricts the count to the columns written by the encoder — names
+    for DataFrames and Arrow tables, positions for arrays and sparse matrices — so
+    input columns passed through as they are do not count.
+    """
+    def saved(dtype: np.dtype, n_values: int) -> int:
+        dtype = np.dtype(dtype)
+        if dtype.kind != "f" or dtype.itemsize >= 8:
+            return 0
+        return n_values * (8 - dtype.itemsize)
+
+    keep = None if encoded is None else list(encoded)
+    if isinstance(out, pd.DataFrame):
+        dtypes = out.dtypes if keep is None else out.dtypes[out.columns.isin(keep)]
+        return sum(saved(dtype, len(out)) for dtype in dtypes if isinstance(dtype, np.dtype))
+    if hasattr(out, "data") and hasattr(out, "nnz"):  # scipy sparse
+        if keep is None:
+            return saved(out.dtype, out.nnz)
+        return saved(out.dtype, int(np.isin(out.tocsr().indices, keep).sum()))
+    if isinstance(out, np.ndarray):
+        return saved(out.dtype, out.size if keep is None else len(out) * len(keep))
+    if pa is not None and isinstance(out, pa.Table):
+        return sum(
+            saved(np.dtype(field.type.to_pandas_dtype()), out.num_rows)
+            for field in out.schema
+            if pa.types.is_floating(field.type) and (keep is None or field.name in keep)
+        )
+    return 0
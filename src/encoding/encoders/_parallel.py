@@ -0,0 +1,40 @@
+"""Column-level parallelism shared by the encoders.
+
+Columns are independent, so fit statistics and transform lookups are mapped
+over them with ``joblib``. Threads are preferred: every worker reads the same
+input frame and target array without pickling. The backend can be switched
+with ``joblib.parallel_config`` (``EncodingManager(backend=...)`` does this);
+with process backends joblib memory-maps large NumPy buffers such as the target
+instead of copying them to each worker.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from joblib import Parallel, delayed
+
+from ..profiling import column_timer, timed_column
+
+__all__ = ["map_columns"]
+
+
+def map_columns(
+    func: Callable,
+    args_list: Sequence[Tuple],
+    n_jobs: int | None = 1,
+    labels: Optional[Sequence[str]] = None,
+) -> List:
+    """Call ``func(*args)`` for each entry of ``args_list``, in order.
+
+    Inside ``MemoryManager.profile`` each call is timed and reported under the
+    matching entry of ``labels`` (the column name).
+    """
+    timer = column_timer.get()
+    if timer is not None and labels is not None:
+        funcs = [timed_column(func, label, timer) for label in labels]
+    else:
+        funcs = [func] * len(args_list)
+    if n_jobs in (None, 1) or len(args_list) < 2:
+        return [f(*args) for f, args in zip(funcs, args_list)]
+    return Parallel(n_jobs=n_jobs, prefer="threads")(delayed(f)(*args) for f, args in zip(funcs, args_list))
@@ -0,0 +1,235 @@
+"""Several encoders (and passthrough columns) combined into one output matrix.
+
+Each child encodes its own columns: dense encoders (WoE, target, leave-one-out)
+produce an ``ndarray`` block and one-hot a CSR block. The result is preallocated
+once — CSR when the combined density is below ``sparse_threshold``, a
+column-major ``ndarray`` otherwise — and no DataFrame or ``hstack`` copy is made.
+In the dense case the dense children and passthrough columns write straight
+into column slices of the result; only the CSR blocks are scattered into it.
+In the CSR case every dense child block is a temporary, interleaved row by row.
+"""
+
+from __future__ import annotations
+
+import copy
+import inspect
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from ._output import check_output_dtype
+
+__all__ = ["CompositeEncoder"]
+
+
+class CompositeEncoder:
+    """Concatenate the outputs of several encoders column-wise.
+
+    ``passthrough`` lists numeric columns copied to the output as they are, or
+    ``"remainder"`` for every column not used by an encoder (resolved at fit).
+    The output is one numeric matrix, so a non-numeric passthrough column (e.g.
+    a string column left in the remainder) is rejected at fit with the list of
+    offending columns: encode it with a child encoder or drop it first.
+    The output is CSR when the share of non-zeros is below ``sparse_threshold``
+    (as in ``sklearn.compose.ColumnTransformer``) and a dense ``ndarray`` otherwise.
+
+    The given ``encoders`` are left untouched: ``fit`` works on copies
+    (``encoders_``) switched to ``output_mode="ndarray"`` and to ``n_jobs``.
+    """
+
+    def __init__(
+        self,
+        encoders: Sequence,
+        passthrough: Union[Sequence[str], str] = (),
+        sparse_threshold: float = 0.3,
+        output_dtype: str = "float64",
+        n_jobs: int | None = None,
+    ) -> None:
+        self.encoders = list(encoders)
+        self.passthrough = passthrough if isinstance(passthrough, str) else list(passthrough)
+        self.sparse_threshold = sparse_threshold
+        self.output_dtype = check_output_dtype(output_dtype)
+        self.n_jobs = n_jobs
+
+    def _clones(self) -> list:
+        clones = []
+        for enc in self.encoders:
+            enc = copy.deepcopy(enc)
+            if hasattr(enc, "output_mode"):
+                enc.output_mode = "ndarray"
+            if self.n_jobs is not None and hasattr(enc, "n_jobs"):
+                enc.n_jobs = self.n_jobs
+            clones.append(enc)
+        return clones
+
+    def __setstate__(self, state: dict) -> None:
+        if "passthrough_" in state and "encoders_" not in state:
+            # older pickles fitted the given encoders themselves
+            state["encoders_"] = state["encoders"]
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _used_columns(enc) -> List[str]:
+        if hasattr(enc, "categorical_cols"):
+            return list(enc.categorical_cols) + list(getattr(enc, "numeric_cols", None) or [])
+        return list(getattr(enc, "columns", []))
+
+    def fit(self, X: pd.DataFrame, y: pd.Series | None = None):
+        self._resolve_passthrough(X)
+        self.encoders_ = self._clones()
+        for enc in self.encoders_:
+            enc.fit(X, y)
+        return self
+
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series):
+        for enc in self.encoders:
+            if not hasattr(enc, "partial_fit"):
+                raise TypeError(f"{type(enc).__name__} does not support partial_fit")
+        if not hasattr(self, "encoders_"):
+            self._resolve_passthrough(X)
+            self.encoders_ = self._clones()
+        for enc in self.encoders_:
+            enc.partial_fit(X, y)
+        return self
+
+    def finalize(self):
+        for enc in self.encoders_:
+            enc.finalize()
+        return self
+
+    def _resolve_passthrough(self, X: pd.DataFrame) -> None:
+        if self.passthrough == "remainder":
+            used = {c for enc in self.encoders for c in self._used_columns(enc)}
+            self.passthrough_ = [c for c in X.columns if c not in used]
+        else:
+            self.passthrough_ = list(self.passthrough)
+        bad = [c for c in self.passthrough_ if not pd.api.types.is_numeric_dtype(X[c].dtype)]
+        if bad:
+            del self.passthrough_
+            raise ValueError(
+                f"passthrough columns must be numeric, got non-numeric {bad}; "
+                "encode them with one of the encoders or drop them before fit"
+            )
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        names: List[str] = []
+        for enc in self.encoders_:
+            names.extend(enc.get_feature_names_out())
+        names.extend(getattr(self, "passthrough_", []))
+        return np.asarray(names, dtype=object)
+
+    def transform(self, X: pd.DataFrame):
+        n_rows = len(X)
+        # one-hot blocks are built by their encoder in any case; dense widths are known upfront
+        blocks = [None if _writes_into(enc) else enc.transform(X) for enc in self.encoders_]
+        widths = [
+            len(enc.get_feature_names_out()) if b is None else b.shape[1] for enc, b in zip(self.encoders_, blocks)
+        ]
+        width = sum(widths) + len(self.passthrough_)
+        nnz = sum(n_rows * k if b is None else b.nnz if sp.issparse(b) else b.size for b, k in zip(blocks, widths))
+        nnz += n_rows * len(self.passthrough_)
+        if any(sp.issparse(b) for b in blocks) and nnz < self.sparse_threshold * n_rows * max(width, 1):
+            blocks = [enc.transform(X) if b is None else b for enc, b in zip(self.encoders_, blocks)]
+            if self.passthrough_:
+                blocks.append(X[self.passthrough_].to_numpy(dtype=self.output_dtype))
+            return _fill_csr(blocks, n_rows, width, nnz, self.output_dtype)
+
+        scattered = any(b is not None for b in blocks)
+        alloc = np.zeros if scattered else np.empty
+        out = alloc((n_rows, width), dtype=self.output_dtype, order="F")
+        col = 0
+        for enc, b, k in zip(self.encoders_, blocks, widths):
+            if b is None:
+                enc.transform(X, out=out[:, col:col + k])
+            else:
+                _scatter_dense(out, b, col)
+            col += k
+        for name in self.passthrough_:
+            out[:, col] = X[name].to_numpy(dtype=self.output_dtype)
+            col += 1
+        return out
+
+    def memory_estimate(self, X: pd.DataFrame) -> Dict[str, int]:
+        """Output bytes of the combined matrix plus the children's temporaries per row.
+
+        Children that fill their slice of a dense result add no block of their own.
+        When the result may be CSR, every child block and the passthrough columns
+        are temporaries interleaved into it.
+        """
+        n_rows = max(len(X), 1)
+        itemsize = np.dtype(self.output_dtype).itemsize
+        passthrough = getattr(self, "passthrough_", [] if self.passthrough == "remainder" else self.passthrough)
+        output = len(passthrough) * len(X) * itemsize
+        dense_output = output
+        children = getattr(self, "encoders_", None) or self._clones()
+        estimates = [
+            enc.memory_estimate(X) if hasattr(enc, "memory_estimate") else {"output": 0, "temporary_per_row": 0}
+            for enc in children
+        ]
+        sparse = any("dense_output" in est for est in estimates)
+        temporary = len(passthrough) * itemsize if sparse else 0
+        for enc, est in zip(children, estimates):
+            output += est["output"]
+            dense_output += est.get("dense_output", est["output"])
+            temporary += est["temporary_per_row"]
+            if sparse or not _writes_into(enc):
+                temporary += est["output"] // n_rows
+        out = {"output": output, "temporary_per_row": temporary}
+        if sparse:
+            out["dense_output"] = dense_output
+        return out
+
+
+def _writes_into(enc) -> bool:
+    """Whether ``enc`` returns a dense block and can fill a caller-provided one (``out=``)."""
+    return getattr(enc, "output_mode", None) == "ndarray" and "out" in inspect.signature(enc.transform).parameters
+
+
+def _scatter_dense(out: np.ndarray, b, col: int) -> None:
+    """Write a block produced by its encoder (CSR or dense) into ``out`` from column ``col``."""
+    if sp.issparse(b):
+        b = b.tocsr()
+        rows = np.repeat(np.arange(b.shape[0]), np.diff(b.indptr))
+        out[rows, col + b.indices] = b.data
+    else:
+        out[:, col:col + b.shape[1]] = b
+
+
+def _fill_csr(blocks: list, n_rows: int, width: int, nnz: int, dtype: str) -> sp.csr_matrix:
+    """Interleave dense and CSR blocks row by row into one preallocated CSR matrix."""
+    row_nnz = np.zeros(n_rows, dtype=np.int64)
+    csr_blocks = []
+    for b in blocks:
+        if sp.issparse(b):
+            b = b.tocsr()
+            row_nnz += np.diff(b.indptr)
+        else:
+            row_nnz += b.shape[1]
+        csr_blocks.append(b)
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(row_nnz, out=indptr[1:])
+    index_dtype = np.int32 if max(nnz, width) < np.iinfo(np.int32).max else np.int64
+    indptr = indptr.astype(index_dtype, copy=False)
+    data = np.empty(nnz, dtype=dtype)
+    indices = np.empty(nnz, dtype=index_dtype)
+
+    cursor = indptr[:-1].astype(np.int64)  # next free slot of every row
+    col = 0
+    for b in csr_blocks:
+        k = b.shape[1]
+        if sp.issparse(b):
+            counts = np.diff(b.indptr)
+            rows = np.repeat(np.arange(n_rows), counts)
+            pos = cursor[rows] + (np.arange(b.nnz) - b.indptr[:-1][rows])
+            data[pos] = b.data
+            indices[pos] = b.indices + col
+            cursor += counts
+        else:
+            pos = cursor[:, None] + np.arange(k)
+            data[pos] = b
+            indices[pos] = np.arange(col, col + k)
+            cursor += k
+        col += k
+    return sp.csr_matrix((data, indices, indptr), shape=(n_rows, width))
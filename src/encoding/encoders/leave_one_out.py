@@ -1,33 +1,192 @@
+import numpy as np
 import pandas as pd
-from typing import Iterable
+from typing import Dict, Iterable
+
+from joblib import effective_n_jobs
+
+from ._aggregation import (
+    CategoryStats,
+    StatsAccumulator,
+    check_mergeable,
+    factorize,
+    pooled_mean,
+    row_positions,
+)
+from ._arrow import as_frame, target_values
+from ._output import OutputWriter, check_output_dtype, check_output_mode, estimate_output_bytes
+from ._parallel import map_columns
 
 class LeaveOneOutEncoder:
-    """Naive leave-one-out target encoder."""
+    """Leave-one-out / K-fold out-of-fold target encoder on integer codes.
+
+    Per-category row counts and target sums are kept as compact arrays
+    (``stats_``). ``transform(X)`` returns the category means; ``transform(X, y)``
+    (and ``fit_transform``) returns leakage-safe encodings for the training rows:
+
+    * ``n_folds=None`` – leave-one-out, ``(sum - y) / (count - 1)``;
+    * ``n_folds=K`` – out-of-fold means. Rows are assigned to ``K`` folds
+      (``random_state``) and a single ``(fold × category)`` bincount yields the
+      statistics of every fold at once instead of refitting ``K`` times.
+
+    Rows whose category is ``NaN``, unseen or has no other rows get ``global_mean``.
+
+    ``output_mode`` selects the return container of ``transform``
+    (``"copy"``, ``"inplace"``, ``"encoded_only"`` or ``"ndarray"``) and
+    ``output_dtype`` the dtype of the encoded columns.
+
+    For data that does not fit in memory, call ``partial_fit`` per chunk and
+    ``finalize`` once at the end instead of ``fit``; encoders fitted on separate
+    shards are combined with ``merge``. ``n_jobs`` spreads the per-column work
+    over joblib workers.
+    """
 
-    def __init__(self, columns: Iterable[str]):
+    def __init__(
+        self,
+        columns: Iterable[str],
+        output_mode: str = "copy",
+        n_jobs: int | None = 1,
+        n_folds: int | None = None,
+        random_state: int | None = None,
+        output_dtype: str = "float64",
+    ):
+        check_output_mode(output_mode)
+        self.output_dtype = check_output_dtype(output_dtype)
+        if n_folds is not None and n_folds < 2:
+            raise ValueError("n_folds must be at least 2")
         self.columns = list(columns)
-        self.sum_ = {}
-        self.count_ = {}
+        self.output_mode = output_mode
+        self.n_jobs = n_jobs
+        self.n_folds = n_folds
+        self.random_state = random_state
+        self.stats_: Dict[str, CategoryStats] = {}
         self.global_mean = None
+        self.n_rows_ = 0
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
-        self.global_mean = y.mean()
-        df = pd.concat([X[self.columns], y], axis=1)
-        for col in self.columns:
-            grouped = df.groupby(col)[y.name]
-            self.sum_[col] = grouped.sum()
-            self.count_[col] = grouped.count()
+        self._partial = None
+        return self.partial_fit(X, y).finalize()
+
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series):
+        """Accumulate per-category counts and target sums from one chunk."""
+        if getattr(self, "_partial", None) is None:
+            self._partial = StatsAccumulator()
+        y = np.asarray(target_values(y), dtype=float)
+        self._partial.update(as_frame(X), y, self.columns, n_jobs=self.n_jobs)
+        return self
+
+    def finalize(self):
+        """Keep the accumulated per-category sums and counts."""
+        acc = getattr(self, "_partial", None)
+        if acc is None:
+            raise RuntimeError("No chunks accumulated; call partial_fit first.")
+        self.global_mean = acc.target_mean
+        self.n_rows_ = acc.n_rows
+        self.stats_.update(acc.stats)
+        self._partial = None
         return self
 
-    def transform(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
-        X = X.copy()
+    def merge(self, other: "LeaveOneOutEncoder") -> "LeaveOneOutEncoder":
+        """Add the statistics of an encoder fitted on another shard; returns ``self``."""
+        check_mergeable(self, other)
+        self.global_mean, self.n_rows_ = pooled_mean(self, other)
         for col in self.columns:
-            s = X[col]
-            sums = self.sum_[col].reindex(s).values
-            counts = self.count_[col].reindex(s).values
-            if y is not None:
-                sums -= y.values
-                counts = counts - 1
-            enc = sums / counts.clip(min=1)
-            X[col] = pd.Series(enc, index=s.index).fillna(self.global_mean)
-        return X
+            self.stats_[col] = self.stats_[col].merge(other.stats_[col])
+        return self
+
+    def fold_ids(self, n_rows: int) -> np.ndarray:
+        """Balanced, shuffled fold assignment used by the K-fold mode."""
+        rng = np.random.default_rng(self.random_state)
+        return rng.permutation(n_rows) % self.n_folds
+
+    def memory_estimate(self, X: pd.DataFrame) -> Dict[str, int]:
+        """Output bytes of ``transform`` and temporary bytes per row.
+
+        Each column in flight allocates codes, row positions, gathered sums and
+        counts (4 arrays of 8 bytes) and the result (``output_dtype``).
+        """
+        workers = min(max(1, effective_n_jobs(self.n_jobs)), max(1, len(self.columns)))
+        return {
+            "output": estimate_output_bytes(as_frame(X), len(self.columns), self.output_mode, self.output_dtype),
+            "temporary_per_row": (32 + np.dtype(self.output_dtype).itemsize) * workers,
+        }
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Names of the columns returned by ``transform``, in order.
+
+        Encoded columns replace the originals, so ``"copy"``/``"inplace"`` keep
+        the layout of ``input_features``.
+        """
+        if self.output_mode in ("encoded_only", "ndarray") or input_features is None:
+            return np.asarray(self.columns, dtype=object)
+        extra = [c for c in self.columns if c not in set(input_features)]
+        return np.asarray(list(input_features) + extra, dtype=object)
+
+    def transform(self, X: pd.DataFrame, y: pd.Series | None = None, out: np.ndarray | None = None):
+        """Leave-one-out values when ``y`` is given, stored means otherwise.
+
+        In ``"ndarray"`` mode a preallocated ``out`` block is filled instead of a new one.
+        """
+        X = as_frame(X)
+        writer = OutputWriter(X, self.columns, mode=self.output_mode, dtype=self.output_dtype, out=out)
+        y_arr = None if y is None else np.asarray(target_values(y), dtype=float)
+        if y_arr is not None and self.n_folds is not None:
+            folds = self.fold_ids(len(X))
+            args = [(X[col], y_arr, folds, self.n_folds, self.global_mean, self.output_dtype) for col in self.columns]
+            encoded = map_columns(_kfold_column, args, self.n_jobs, labels=self.columns)
+        else:
+            args = [(X[col], self.stats_[col], y_arr, self.global_mean, self.output_dtype) for col in self.columns]
+            encoded = map_columns(_loo_column, args, self.n_jobs, labels=self.columns)
+        for col, values in zip(self.columns, encoded):
+            writer.write(col, values)
+        return writer.result()
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series):
+        """Fit and return the leakage-safe encoding of the training rows."""
+        return self.fit(X, y).transform(X, y)
+
+
+def _ratio(sums: np.ndarray, counts: np.ndarray, fallback: float, dtype: str) -> np.ndarray:
+    # divide straight into the output dtype, no float64 intermediate
+    out = np.full(len(sums), fallback, dtype=dtype)
+    np.divide(sums, counts, out=out, where=counts > 0, casting="same_kind")
+    return out
+
+
+def _loo_column(
+    s: pd.Series,
+    stats: CategoryStats,
+    y: np.ndarray | None,
+    global_mean: float,
+    dtype: str = "float64",
+) -> np.ndarray:
+    pos = row_positions(s, stats.categories)
+    # trailing zero slots: unseen (-2) and NaN (-1) rows gather an empty category
+    sums = np.append(stats.total, [0.0, 0.0]).take(pos)
+    counts = np.append(stats.count, [0, 0]).take(pos)
+    if y is not None:
+        seen = pos >= 0
+        sums -= np.where(seen, y, 0.0)
+        counts -= seen
+    return _ratio(sums, counts, global_mean, dtype)
+
+
+def _kfold_column(
+    s: pd.Series,
+    y: np.ndarray,
+    folds: np.ndarray,
+    n_folds: int,
+    global_mean: float,
+    dtype: str = "float64",
+) -> np.ndarray:
+    codes, uniques = factorize(s)
+    n_cats = len(uniques)
+    # one flat (fold × category) index; NaN rows go to a trailing slot per fold
+    flat = folds * (n_cats + 1) + np.where(codes >= 0, codes, n_cats)
+    size = n_folds * (n_cats + 1)
+    counts = np.bincount(flat, minlength=size).reshape(n_folds, n_cats + 1)
+    sums = np.bincount(flat, weights=y, minlength=size).reshape(n_folds, n_cats + 1)
+    # out-of-fold statistics: all folds minus the row's own fold
+    oof_counts = (counts.sum(axis=0) - counts).ravel().take(flat)
+    oof_sums = (sums.sum(axis=0) - sums).ravel().take(flat)
+    oof_counts[codes < 0] = 0
+    return _ratio(oof_sums, oof_counts, global_mean, dtype)
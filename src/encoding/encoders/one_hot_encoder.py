@@ -1,12 +1,21 @@
+import numpy as np
 from sklearn.preprocessing import OneHotEncoder as _OneHotEncoder
-from typing import Iterable
+from typing import Dict, Iterable
+
+from ._output import check_output_dtype
 
 class OneHotEncoder:
-    """Thin wrapper around scikit-learn's OneHotEncoder using sparse output."""
+    """Thin wrapper around scikit-learn's OneHotEncoder using sparse output.
+
+    ``output_dtype`` sets the dtype of the non-zero values of the CSR result.
+    """
 
-    def __init__(self, columns: Iterable[str], **kwargs) -> None:
+    def __init__(self, columns: Iterable[str], output_dtype: str = "float64", **kwargs) -> None:
         self.columns = list(columns)
-        self.encoder = _OneHotEncoder(handle_unknown="ignore", sparse_output=True, **kwargs)
+        self.output_dtype = check_output_dtype(output_dtype)
+        self.encoder = _OneHotEncoder(
+            handle_unknown="ignore", sparse_output=True, dtype=np.dtype(self.output_dtype), **kwargs
+        )
 
     def fit(self, X, y=None):
         self.encoder.fit(X[self.columns])
@@ -14,3 +23,22 @@ class OneHotEncoder:
 
     def transform(self, X):
         return self.encoder.transform(X[self.columns])
+
+    def get_feature_names_out(self, input_features=None):
+        """Names of the one-hot columns, e.g. ``"uf_SP"``."""
+        return self.encoder.get_feature_names_out(self.columns)
+
+    def memory_estimate(self, X) -> Dict[str, int]:
+        """Output bytes of the CSR result (and of its dense equivalent) plus temporaries per row.
+
+        Each row has at most one non-zero per column: ``output_dtype`` bytes of data
+        and 4 of index.
+        """
+        n_rows, n_cols = len(X), len(self.columns)
+        itemsize = np.dtype(getattr(self, "output_dtype", "float64")).itemsize
+        width = sum(len(c) for c in getattr(self.encoder, "categories_", [])) or n_cols
+        return {
+            "output": n_rows * n_cols * (itemsize + 4) + (n_rows + 1) * 4,
+            "dense_output": n_rows * width * itemsize,
+            "temporary_per_row": 2 * 8 * n_cols,
+        }
@@ -1,24 +1,205 @@
+import numpy as np
 import pandas as pd
-from typing import Iterable
+from typing import Dict, Iterable
+
+from joblib import effective_n_jobs
+
+from ._aggregation import (
+    OTHER_KEY,
+    CategoryStats,
+    StatsAccumulator,
+    check_mergeable,
+    pooled_mean,
+    row_positions,
+)
+from ._arrow import as_frame, target_values
+from ._output import OutputWriter, check_output_dtype, check_output_mode, estimate_output_bytes
+from ._parallel import map_columns
+
+NAN_STRATEGIES = ("global", "value")
+
 
 class TargetEncoder:
-    """Simple target mean encoder."""
+    """Target mean encoder with m-estimate smoothing.
+
+    Per-category row counts and target sums are kept as compact arrays
+    (``stats_``) and the encodings are derived from them::
+
+        (sum + smoothing * global_mean) / (count + smoothing)
+
+    ``smoothing=0`` gives the plain category mean. ``NaN`` and unseen categories
+    are mapped explicitly: unseen values get ``global_mean``; ``NaN`` gets
+    ``global_mean`` by default (``handle_nan="global"``), or is treated as its
+    own category with ``handle_nan="value"`` (``global_mean`` if no ``NaN`` was
+    seen during fit).
 
-    def __init__(self, columns: Iterable[str]):
+    The number of stored categories can be bounded for ID-like columns:
+    categories seen fewer than ``min_count`` times, or beyond the
+    ``max_categories`` most frequent ones, are pooled into ``"__other__"``,
+    whose encoding unseen values then receive instead of ``global_mean``. With
+    ``n_buckets`` values are hashed into a fixed number of buckets instead
+    (the hashing trick) and encoded per bucket.
+
+    ``pyarrow.Table`` and polars input is encoded from the dictionary indices of
+    its columns and returned as Arrow/polars (see ``_arrow``).
+
+    ``output_mode`` selects the return container of ``transform``
+    (``"copy"``, ``"inplace"``, ``"encoded_only"`` or ``"ndarray"``) and
+    ``output_dtype`` the dtype of the encoded columns; the lookup tables are
+    stored in that dtype.
+
+    For data that does not fit in memory, call ``partial_fit`` per chunk and
+    ``finalize`` once at the end instead of ``fit``. Encoders fitted on separate
+    shards are combined with ``merge`` and re-smoothed from ``stats_`` with
+    ``refinalize(smoothing=...)``. ``n_jobs`` spreads the per-column work over
+    joblib workers.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str],
+        output_mode: str = "copy",
+        n_jobs: int | None = 1,
+        smoothing: float = 0.0,
+        handle_nan: str = "global",
+        output_dtype: str = "float64",
+        min_count: int = 1,
+        max_categories: int | None = None,
+        n_buckets: int | None = None,
+    ):
+        check_output_mode(output_mode)
+        self.output_dtype = check_output_dtype(output_dtype)
+        if smoothing < 0:
+            raise ValueError("smoothing must be non-negative")
+        if handle_nan not in NAN_STRATEGIES:
+            raise ValueError(f"handle_nan must be one of {NAN_STRATEGIES}, got {handle_nan!r}")
+        if min_count < 1 or (max_categories is not None and max_categories < 1):
+            raise ValueError("min_count and max_categories must be at least 1")
+        if n_buckets is not None and n_buckets < 1:
+            raise ValueError("n_buckets must be at least 1")
         self.columns = list(columns)
-        self.maps = {}
+        self.output_mode = output_mode
+        self.n_jobs = n_jobs
+        self.smoothing = smoothing
+        self.handle_nan = handle_nan
+        self.min_count = min_count
+        self.max_categories = max_categories
+        self.n_buckets = n_buckets
+        self.stats_: Dict[str, CategoryStats] = {}
+        # per column: [*per_category, unseen, nan], indexed by ``row_positions``
+        self.values_: Dict[str, np.ndarray] = {}
         self.global_mean = None
+        self.n_rows_ = 0
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
-        self.global_mean = y.mean()
-        df = pd.concat([X[self.columns], y], axis=1)
-        for col in self.columns:
-            self.maps[col] = df.groupby(col)[y.name].mean()
+        self._partial = None
+        return self.partial_fit(X, y).finalize()
+
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series):
+        """Accumulate per-category counts and target sums from one chunk."""
+        if getattr(self, "_partial", None) is None:
+            self._partial = StatsAccumulator()
+        y = np.asarray(target_values(y), dtype=float)
+        self._partial.update(as_frame(X), y, self.columns, n_jobs=self.n_jobs, n_buckets=self.n_buckets)
         return self
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        X = X.copy()
+    def finalize(self):
+        """Turn the accumulated statistics into smoothed target means."""
+        acc = getattr(self, "_partial", None)
+        if acc is None:
+            raise RuntimeError("No chunks accumulated; call partial_fit first.")
+        self.global_mean = acc.target_mean
+        self.n_rows_ = acc.n_rows
+        for col, stats in acc.stats.items():
+            stats = stats.pool(self.min_count, self.max_categories)
+            self.stats_[col] = stats
+            self.values_[col] = self._encodings(stats)
+        self._partial = None
+        return self
+
+    def merge(self, other: "TargetEncoder") -> "TargetEncoder":
+        """Add the statistics of an encoder fitted on another shard; returns ``self``."""
+        check_mergeable(self, other)
+        if self.n_buckets != other.n_buckets:
+            raise ValueError("Encoders must use the same n_buckets to be merged")
+        self.global_mean, self.n_rows_ = pooled_mean(self, other)
+        for col in self.columns:
+            self.stats_[col] = self.stats_[col].merge(other.stats_[col])
+        return self.refinalize()
+
+    def refinalize(self, smoothing: float | None = None) -> "TargetEncoder":
+        """Recompute the encodings from ``stats_``, optionally with a new ``smoothing``."""
+        if smoothing is not None:
+            if smoothing < 0:
+                raise ValueError("smoothing must be non-negative")
+            self.smoothing = smoothing
         for col in self.columns:
-            mapping = self.maps.get(col, {})
-            X[col] = X[col].map(mapping).fillna(self.global_mean)
-        return X
+            self.stats_[col] = self.stats_[col].pool(self.min_count, self.max_categories)
+            self.values_[col] = self._encodings(self.stats_[col])
+        return self
+
+    def _encodings(self, stats: CategoryStats) -> np.ndarray:
+        prior = self.global_mean
+        m = self.smoothing
+        if self.handle_nan == "value":
+            nan_count, nan_total = stats.nan_count, stats.nan_total
+        else:
+            nan_count, nan_total = 0, 0.0
+        count = np.append(stats.count, [0, nan_count])
+        total = np.append(stats.total, [0.0, nan_total])
+        denom = count + m
+        out = np.full(len(count), prior, dtype=float)
+        np.divide(total + m * prior, denom, out=out, where=denom > 0)
+        other = stats.categories.get_indexer([OTHER_KEY])[0]
+        if other >= 0:
+            out[-2] = out[other]
+        return out.astype(self.output_dtype, copy=False)
+
+    @property
+    def maps(self) -> Dict[str, pd.Series]:
+        """Encoding per observed category of every column."""
+        return {
+            col: pd.Series(values[:-2], index=self.stats_[col].categories)
+            for col, values in self.values_.items()
+        }
+
+    def memory_estimate(self, X: pd.DataFrame) -> Dict[str, int]:
+        """Output bytes of ``transform`` and temporary bytes per row.
+
+        Each column in flight allocates codes, row positions (8 bytes each) and
+        the gathered values (``output_dtype``).
+        """
+        workers = min(max(1, effective_n_jobs(self.n_jobs)), max(1, len(self.columns)))
+        return {
+            "output": estimate_output_bytes(as_frame(X), len(self.columns), self.output_mode, self.output_dtype),
+            "temporary_per_row": (16 + np.dtype(self.output_dtype).itemsize) * workers,
+        }
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Names of the columns returned by ``transform``, in order.
+
+        Encoded columns replace the originals, so ``"copy"``/``"inplace"`` keep
+        the layout of ``input_features``.
+        """
+        if self.output_mode in ("encoded_only", "ndarray") or input_features is None:
+            return np.asarray(self.columns, dtype=object)
+        extra = [c for c in self.columns if c not in set(input_features)]
+        return np.asarray(list(input_features) + extra, dtype=object)
+
+    def transform(self, X: pd.DataFrame, out: np.ndarray | None = None):
+        """Encode ``columns``; with ``output_mode="ndarray"``, ``out`` receives the values."""
+        X = as_frame(X)
+        writer = OutputWriter(X, self.columns, mode=self.output_mode, dtype=self.output_dtype, out=out)
+        encoded = map_columns(
+            _map_column,
+            [(X[col], self.stats_[col].categories, self.values_[col], self.n_buckets) for col in self.columns],
+            self.n_jobs,
+            labels=self.columns,
+        )
+        for col, values in zip(self.columns, encoded):
+            writer.write(col, values)
+        return writer.result()
+
+
+def _map_column(s: pd.Series, categories: pd.Index, values: np.ndarray, n_buckets: int | None = None) -> np.ndarray:
+    return values.take(row_positions(s, categories, n_buckets))
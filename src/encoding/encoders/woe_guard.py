@@ -6,29 +6,76 @@ from __future__ import annotations
 Features
 --------
 * Calculates WoE and Information Value (IV) for categorical features.
+* Supervised binning of numeric features (`numeric_cols`): quantile pre-bins merged
+  monotonically or by optimal IV, applied with one `np.searchsorted` (see ``_binning``).
+* Vectorized fit engine: each column is factorized once and good/bad counts are
+  aggregated with ``np.bincount`` (see ``_aggregation``).
+* Compiled transform: mappings are compiled into sorted category/value arrays and
+  rows are resolved by a single gather over integer codes (see ``_lookup``).
 * Creates new columns with suffix "_woe"; optionally drops originals.
+* Out-of-core fitting: `partial_fit` accumulates counts per chunk and `finalize`
+  produces `woe_log_`/`iv_log_`.
+* Mergeable state: good/bad counts stay in compact arrays (`stats_`, `bins_`), so
+  encoders fitted on separate shards are combined with `merge` and re-smoothed
+  with `refinalize(alpha=...)` without rereading the data.
+* Column-parallel fit/transform (`n_jobs`) through joblib.
+* `to_scorer()` compiles a pandas-free, thread-safe scorer for single records.
+* Copy-free output modes (``inplace``, ``encoded_only``, ``ndarray``) for scoring.
+* Accepts `pyarrow.Table` / polars input: dictionary indices drive fit and
+  transform and the output comes back as Arrow/polars (see ``_arrow``).
 * Handles missing values as dedicated category.
+* Bounded maps for ID-like columns: rare categories pooled into `"__other__"`
+  (`min_count`/`max_categories`) or hashed into `n_buckets` buckets.
 * Laplace smoothing to avoid log(0).
 * Stores full WoE mapping (`woe_log_`) and IV per feature (`iv_log_`).
-* Provides `summary()` to export detailed report to Excel (``.xlsx``).
+* `iv_stability()`: bootstrap (Poisson/multinomial) of the stored good/bad counts
+  for every feature at once – IV confidence intervals and WoE-sign stability per
+  category, also reported by `summary()` (see ``_stability``).
+* `summary()` builds the per-category report (counts, event rates, distributions,
+  WoE, IV) from the count arrays in one vectorized step and exports it to CSV,
+  Parquet or streamed, sheet-split XLSX (see ``_export``).
+* Opt-in drift monitoring (`monitor=True`): `transform` accumulates per-category
+  hits (unseen and NaN included) in fixed arrays; on large batches the seen
+  categories are estimated from a sample of `monitor_rows` rows while unseen
+  and NaN stay exact; `psi()` and `drift_report()`
+  compare them with the training counts (see ``_drift``).
 * Offers `plot_woe()` for quick visual inspection.
 * Supports persistence (`save`, `load`, `export_log`, `load_from_json`) via `pickle` or JSON.
+* Columnar binary format (`save(path, format="columnar")`) that `load` memory-maps,
+  sharing category/WoE arrays between scoring processes (see ``_columnar``).
 * Robust to unseen categories at transform time (configurable default), with warnings for missing columns.
 """
 
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
 import pickle
 import json
+import threading
 import warnings
 from typing import Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from joblib import effective_n_jobs
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from ._aggregation import OTHER_KEY, CategoryStats, StatsAccumulator
+from ._arrow import as_frame, target_values
+from ._binning import BINNING_METHODS, BinSketch, NumericBins, numeric_values, woe_iv
+from ._columnar import is_columnar, read_woe, write_woe
+from ._drift import HitCounter, drift_table
+from ._export import export_table
+from ._lookup import NAN_KEY, CompiledMapping, HashedMapping, SortedMapping
+from ._output import OutputWriter, check_output_dtype, check_output_mode, estimate_output_bytes
+from ._parallel import map_columns
+from ._stability import bootstrap_stability
+
 __all__ = ["WOEGuard"]
 
+_MONITOR_LOCK = threading.Lock()
+
 
 class WOEGuard(BaseEstimator, TransformerMixin):
     """Encoder de Peso de Evidência (WoE) para variáveis categóricas.
@@ -47,6 +94,42 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         Valor WoE default para categorias não vistas em `transform`.
     include_nan : bool, default=True
         Trata `NaN` como categoria separada (`"__nan__"`).
+    output_mode : {"copy", "inplace", "encoded_only", "ndarray"}, default="copy"
+        Formato de saída do `transform`: cópia de `X` com as colunas `_woe`,
+        escrita direta em `X`, apenas as colunas `_woe` ou um bloco NumPy `float`.
+    n_jobs : int, default=1
+        Número de workers joblib para processar as colunas em paralelo.
+    output_dtype : {"float64", "float32", "float16"}, default="float64"
+        Dtype das colunas `_woe`; as tabelas compiladas são guardadas no mesmo dtype.
+    numeric_cols : List[str], optional
+        Colunas numéricas discretizadas em faixas supervisionadas antes do WoE
+        (ex.: contagens como `qtd_consultas_ultimos_6m`). As faixas ficam em `bins_`.
+    binning : {"monotonic", "optimal"}, default="monotonic"
+        `"monotonic"` funde pré-faixas até a taxa de evento ficar monótona;
+        `"optimal"` escolhe a partição de maior IV por programação dinâmica.
+    n_prebins : int, default=20
+        Número de pré-faixas por quantis (valores empatados nunca são separados).
+    max_bins : int, default=6
+        Número máximo de faixas finais (sem contar `"__nan__"`).
+    min_bin_size : float, default=0.05
+        Fração mínima de linhas não nulas em cada faixa final.
+    min_count : int, default=1
+        Categorias com menos linhas que `min_count` no fit são agrupadas em `"__other__"`.
+    max_categories : int, optional
+        Mantém apenas as `max_categories` categorias mais frequentes por coluna; as
+        demais vão para `"__other__"`. Categorias não vistas recebem o WoE de
+        `"__other__"` (quando existir) em vez de `default_woe`.
+    n_buckets : int, optional
+        Hashing trick: cada valor é mapeado para um de `n_buckets` buckets e o WoE
+        é calculado por bucket, limitando `woe_log_` a `n_buckets` entradas.
+    monitor : bool, default=False
+        Acumula no `transform` as contagens de linhas por categoria (incluindo
+        não vistas e `NaN`) em `monitor_`, para `psi()` e `drift_report()`.
+    monitor_rows : int, optional, default=8192
+        Linhas contadas por coluna em cada `transform` monitorado. Em lotes
+        maiores as categorias vistas são estimadas numa amostra aleatória
+        (nova a cada chamada) desse tamanho; não vistas e `NaN` são sempre
+        contadas exatamente. `None` conta todas as linhas.
     """
 
     def __init__(
@@ -57,20 +140,63 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         alpha: float = 0.5,
         default_woe: float = 0.0,
         include_nan: bool = True,
+        output_mode: str = "copy",
+        n_jobs: Optional[int] = 1,
+        output_dtype: str = "float64",
+        numeric_cols: Optional[List[str]] = None,
+        binning: str = "monotonic",
+        n_prebins: int = 20,
+        max_bins: int = 6,
+        min_bin_size: float = 0.05,
+        min_count: int = 1,
+        max_categories: Optional[int] = None,
+        n_buckets: Optional[int] = None,
+        monitor: bool = False,
+        monitor_rows: Optional[int] = 8192,
     ) -> None:
+        check_output_mode(output_mode)
+        if min_count < 1 or (max_categories is not None and max_categories < 1):
+            raise ValueError("min_count e max_categories devem ser >= 1.")
+        if n_buckets is not None and n_buckets < 1:
+            raise ValueError("n_buckets deve ser >= 1.")
+        if monitor_rows is not None and monitor_rows < 1:
+            raise ValueError("monitor_rows deve ser >= 1 ou None.")
+        if binning not in BINNING_METHODS:
+            raise ValueError(f"binning deve ser um de {BINNING_METHODS}, recebido {binning!r}.")
+        self.output_dtype = check_output_dtype(output_dtype)
         self.categorical_cols = categorical_cols
         self.drop_original = drop_original
         self.suffix = suffix
         self.alpha = alpha
         self.default_woe = default_woe
         self.include_nan = include_nan
+        self.output_mode = output_mode
+        self.n_jobs = n_jobs
+        self.numeric_cols = numeric_cols
+        self.binning = binning
+        self.n_prebins = n_prebins
+        self.max_bins = max_bins
+        self.min_bin_size = min_bin_size
+        self.min_count = min_count
+        self.max_categories = max_categories
+        self.n_buckets = n_buckets
+        self.monitor = monitor
+        self.monitor_rows = monitor_rows
 
         # Atributos pós-fit
         self.woe_log_: Dict[str, Dict[Union[str, float], float]] = {}
+        self.stats_: Dict[str, CategoryStats] = {}
+        self.bins_: Dict[str, NumericBins] = {}
+        self.n_rows_ = 0
         self.iv_log_: Dict[str, float] = {}
         self.global_event_rate_: Optional[float] = None
         self.fitted_ = False
 
+    @property
+    def _encoded_cols(self) -> List[str]:
+        """Colunas codificadas: categóricas seguidas das numéricas."""
+        return list(self.categorical_cols) + list(getattr(self, "numeric_cols", None) or [])
+
     def _validate_target(self, y: pd.Series) -> None:
         if not set(y.unique()).issubset({0, 1}):
             raise ValueError("Target deve ser binário contendo apenas 0 e 1.")
@@ -82,6 +208,7 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         return s.astype("category")
 
     def _calculate_woe_iv(self, s: pd.Series, y: pd.Series) -> Dict[str, object]:
+        """Implementação de referência via `groupby` (usada em benchmarks e testes)."""
         df = pd.DataFrame({"feature": s, "target": y})
         agg = (
             df.groupby("feature", observed=True)["target"]
@@ -98,62 +225,404 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         agg["iv_component"] = (agg["dist_good"] - agg["dist_bad"]) * agg["woe"]
         return {"woe_mapping": agg["woe"].to_dict(), "iv": agg["iv_component"].sum()}
 
+    def _woe_from_stats(self, stats: CategoryStats) -> Dict[str, object]:
+        """Calcula WoE e IV de forma vetorizada a partir das contagens por categoria.
+
+        `NaN` entra como a categoria `"__nan__"` (ao final) quando `include_nan=True`."""
+        cats, total, bad = self._count_table(stats)
+        woe, iv = woe_iv(total, bad, self.alpha)
+        return {"woe_mapping": dict(zip(cats, woe.tolist())), "iv": iv}
+
+    def _count_table(self, stats: CategoryStats):
+        """Categorias (ordenadas, `"__nan__"` ao final) e contagens total/bad usadas no WoE."""
+        stats = stats.sorted()
+        cats = stats.categories.tolist()
+        total = stats.count.astype(float)
+        bad = stats.total.astype(float)
+        if self.include_nan and stats.nan_count:
+            if "__nan__" in cats:
+                i = cats.index("__nan__")
+                total[i] += stats.nan_count
+                bad[i] += stats.nan_total
+            else:
+                cats.append("__nan__")
+                total = np.append(total, stats.nan_count)
+                bad = np.append(bad, stats.nan_total)
+        return cats, total, bad
+
+    def _column_table(self, col: str):
+        """`_count_table` de uma coluna categórica ou das faixas de uma coluna numérica."""
+        if col not in self.bins_:
+            return self._count_table(self.stats_[col])
+        bins = self.bins_[col]
+        labels, total, bad = bins.labels()[: len(bins.count)], bins.count.astype(float), bins.bad
+        if self.include_nan and bins.nan_count:
+            labels = labels + ["__nan__"]
+            total = np.append(total, bins.nan_count)
+            bad = np.append(bad, bins.nan_bad)
+        return labels, total, np.asarray(bad, dtype=float)
+
     def fit(self, X: pd.DataFrame, y: pd.Series):
-        """Calcula WoE e IV para `categorical_cols`. Retorna `self`."""
-        X = X.copy()
-        y = pd.Series(y).reset_index(drop=True)
+        """Calcula WoE e IV para `categorical_cols`. Retorna `self`.
+
+        Cada coluna é fatorada uma única vez em códigos inteiros e as contagens
+        good/bad são obtidas com `np.bincount`, sem `groupby` nem cópia de `X`."""
+        self._partial = None
+        return self.partial_fit(X, y).finalize()
+
+    def partial_fit(self, X: pd.DataFrame, y: pd.Series):
+        """Acumula contagens good/bad de um bloco de linhas. Retorna `self`.
+
+        Pode ser chamado repetidamente (ex.: `pd.read_csv(chunksize=...)`); a
+        memória fica limitada ao bloco mais a cardinalidade das colunas. Execute
+        `finalize()` ao final para obter `woe_log_`/`iv_log_`.
+
+        Para `numeric_cols`, o primeiro bloco é guardado e, a partir do segundo,
+        vira uma grade fixa de quantis com contagens exatas por célula
+        (`BinSketch`): a memória não cresce com o número de blocos, as contagens
+        das faixas são exatas e só as bordas ficam restritas à grade."""
+        X = as_frame(X)
+        y = pd.Series(target_values(y)).reset_index(drop=True)
         self._validate_target(y)
-        self.global_event_rate_ = y.mean()
+        missing = [c for c in self._encoded_cols if c not in X.columns]
+        if missing:
+            raise KeyError(f"Coluna '{missing[0]}' não encontrada em X.")
+        if getattr(self, "_partial", None) is None:
+            self._partial = StatsAccumulator()
+            self._numeric_parts = {col: BinSketch() for col in self.numeric_cols or []}
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        target = y.to_numpy(dtype=float)
+        self._partial.update(
+            X, target, self.categorical_cols, n_jobs=self.n_jobs, n_buckets=getattr(self, "n_buckets", None)
+        )
+        for col, sketch in self._numeric_parts.items():
+            sketch.update(numeric_values(X[col]), target)
+        return self
 
-        for col in self.categorical_cols:
-            if col not in X.columns:
-                raise KeyError(f"Coluna '{{col}}' não encontrada em X.")
-            s = self._prepare_series(X[col])
-            res = self._calculate_woe_iv(s, y)
-            self.woe_log_[col] = res["woe_mapping"]
-            self.iv_log_[col] = res["iv"]
+    def finalize(self):
+        """Calcula `woe_log_`/`iv_log_` a partir das contagens acumuladas. Retorna `self`."""
+        acc = getattr(self, "_partial", None)
+        if acc is None:
+            raise RuntimeError("Nenhum bloco acumulado. Execute `.partial_fit()` primeiro.")
+        self.global_event_rate_ = acc.target_mean
+        self.n_rows_ = acc.n_rows
+        if not hasattr(self, "stats_"):
+            self.stats_ = {}
+        for col, stats in acc.stats.items():
+            self.stats_[col] = stats.pool(self.min_count, self.max_categories)
+        parts = getattr(self, "_numeric_parts", None) or {}
+        for col, sketch in parts.items():
+            self.bins_[col], _ = sketch.fit(
+                method=self.binning,
+                n_prebins=self.n_prebins,
+                max_bins=self.max_bins,
+                min_bin_size=self.min_bin_size,
+                alpha=self.alpha,
+                include_nan=self.include_nan,
+            )
+        self._partial = None
+        self._numeric_parts = None
+        return self._finalize_columns(list(acc.stats) + list(parts))
 
+    def _finalize_columns(self, cols: List[str]):
+        """Recalcula `woe_log_`/`iv_log_` das colunas `cols` a partir de `stats_`/`bins_`."""
+        for col in cols:
+            if col in self.bins_:
+                self.bins_[col], iv = self.bins_[col].refit(self.alpha, self.include_nan)
+                self.woe_log_[col] = self.bins_[col].mapping()
+            else:
+                res = self._woe_from_stats(self.stats_[col])
+                self.woe_log_[col] = res["woe_mapping"]
+                iv = res["iv"]
+            self.iv_log_[col] = iv
+        self.stability_ = None
+        self.monitor_ = None
+        self._compile()
         self.fitted_ = True
         return self
 
-    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        """Aplica WoE criando novas colunas `_woe`, com warnings para colunas faltantes."""
+    def iv_stability(
+        self,
+        n_boot: int = 200,
+        method: str = "poisson",
+        ci: float = 0.95,
+        random_state: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Intervalos de confiança do IV e estabilidade do sinal do WoE via bootstrap.
+
+        As contagens good/bad guardadas (`stats_`, `bins_`) são reamostradas
+        (`method="poisson"` ou `"multinomial"`) para todas as features de uma vez,
+        sem reajustar o encoder. Retorna uma linha por categoria com `woe_low`,
+        `woe_high`, `sign_stability` (fração das réplicas com o mesmo sinal do WoE)
+        e o intervalo `iv_low`/`iv_high` da feature; o resultado fica em
+        `stability_` e é incluído no `summary()`."""
+        tables = [(col, *self._column_table(col)) for col in self._state_cols()]
+        tables = [t for t in tables if len(t[2])]
+        lengths = np.array([len(t[2]) for t in tables], dtype=np.intp)
+        res = bootstrap_stability(
+            np.concatenate([t[2] for t in tables]),
+            np.concatenate([t[3] for t in tables]),
+            np.concatenate([[0], np.cumsum(lengths)[:-1]]),
+            self.alpha,
+            n_boot=n_boot,
+            method=method,
+            ci=ci,
+            random_state=random_state,
+        )
+        self.stability_ = pd.DataFrame({
+            "feature": np.repeat([t[0] for t in tables], lengths),
+            "category": [cat for t in tables for cat in t[1]],
+            "woe_low": res["woe_low"],
+            "woe_high": res["woe_high"],
+            "sign_stability": res["sign_stability"],
+            "iv_low": np.repeat(res["iv_low"], lengths),
+            "iv_high": np.repeat(res["iv_high"], lengths),
+        })
+        return self.stability_
+
+    def _state_cols(self) -> List[str]:
+        cols = self._encoded_cols
+        stats, bins = getattr(self, "stats_", {}), getattr(self, "bins_", {})
+        absent = [c for c in cols if c not in stats and c not in bins]
+        if absent or not getattr(self, "n_rows_", 0):
+            raise RuntimeError(
+                "Encoder sem contagens good/bad (carregado de JSON/colunar?). Ajuste com `.fit()` primeiro."
+            )
+        return cols
+
+    def merge(self, other: "WOEGuard") -> "WOEGuard":
+        """Soma as contagens de um encoder ajustado em outra partição dos dados. Retorna `self`.
+
+        Ambos precisam das mesmas colunas, do mesmo `n_buckets` e das mesmas faixas
+        numéricas. O agrupamento em `"__other__"` é reaplicado às contagens somadas;
+        como cada partição agrupa suas categorias raras antes, o resultado só é exato
+        sem agrupamento (ou com `n_buckets`)."""
+        cols = self._state_cols()
+        if other._state_cols() != cols:
+            raise ValueError("Os encoders devem codificar as mesmas colunas.")
+        if getattr(self, "n_buckets", None) != getattr(other, "n_buckets", None):
+            raise ValueError("Os encoders devem usar o mesmo `n_buckets`.")
+        n_rows = self.n_rows_ + other.n_rows_
+        self.global_event_rate_ = (
+            self.global_event_rate_ * self.n_rows_ + other.global_event_rate_ * other.n_rows_
+        ) / n_rows
+        self.n_rows_ = n_rows
+        for col in self.categorical_cols:
+            merged = self.stats_[col].merge(other.stats_[col])
+            self.stats_[col] = merged.pool(self.min_count, self.max_categories)
+        for col in self.numeric_cols or []:
+            self.bins_[col] = self.bins_[col].merge(other.bins_[col])
+        return self._finalize_columns(cols)
+
+    def refinalize(self, alpha: Optional[float] = None) -> "WOEGuard":
+        """Recalcula WoE/IV a partir das contagens guardadas, opcionalmente com novo `alpha`.
+
+        Custa O(categorias): nenhum dado é relido. Retorna `self`."""
+        cols = self._state_cols()
+        if alpha is not None:
+            self.alpha = alpha
+        return self._finalize_columns(cols)
+
+    def _compile(self) -> Dict[str, CompiledMapping]:
+        """Compila `woe_log_` em arrays ordenados de categorias/valores para o `transform`.
+
+        Colunas numéricas usam diretamente as faixas de `bins_` (bordas + WoE)."""
+        nan_key = "__nan__" if self.include_nan else None
+        dtype = getattr(self, "output_dtype", "float64")
+        bins = getattr(self, "bins_", {})
+        self.tables_ = {
+            col: (
+                bins[col].astype(dtype)
+                if col in bins
+                else replace(mapping, use_nan=self.include_nan, values=mapping.values.astype(dtype, copy=False))
+                if isinstance(mapping, SortedMapping)
+                else CompiledMapping.from_dict(mapping, nan_key=nan_key, dtype=dtype)
+            )
+            for col, mapping in self.woe_log_.items()
+        }
+        n_buckets = getattr(self, "n_buckets", None)
+        if n_buckets:
+            for col in self.categorical_cols:
+                if col in self.tables_:
+                    self.tables_[col] = HashedMapping(self.tables_[col], n_buckets)
+        return self.tables_
+
+    def _unseen_woe(self, col: str) -> float:
+        """WoE de categorias não vistas: o de `"__other__"` se houve agrupamento, senão `default_woe`."""
+        mapping = self.woe_log_.get(col)
+        if mapping is None or col in getattr(self, "bins_", {}):
+            return self.default_woe
+        return float(mapping.get(OTHER_KEY, self.default_woe))
+
+    def _compiled(self) -> Dict[str, CompiledMapping]:
+        tables = getattr(self, "tables_", None)
+        return tables if tables is not None else self._compile()
+
+    def transform(self, X: pd.DataFrame, out: Optional[np.ndarray] = None) -> Union[pd.DataFrame, np.ndarray]:
+        """Aplica WoE criando novas colunas `_woe`, com warnings para colunas faltantes.
+
+        O formato de retorno segue `output_mode`; apenas `"copy"` duplica `X`. Com
+        `output_mode="ndarray"`, `out` recebe os valores no lugar de um bloco novo."""
         if not self.fitted_:
             raise RuntimeError("Encoder não foi ajustado. Execute `.fit()` primeiro.")
 
-        X = X.copy()
-        missing = [c for c in self.categorical_cols if c not in X.columns]
+        X = as_frame(X)
+        cols = self._encoded_cols
+        missing = [c for c in cols if c not in X.columns]
         if missing:
             warnings.warn(f"As colunas {missing} não foram encontradas no DataFrame de entrada e serão ignoradas.")
-        for col in self.categorical_cols:
-            if col not in X.columns:
-                continue
-            s = self._prepare_series(X[col])
-            mapping = self.woe_log_.get(col, {})
-            new_col = col + self.suffix
-            vals = s.map(mapping).astype(float)
-            X[new_col] = vals.fillna(self.default_woe)
-
-        if self.drop_original:
-            to_drop = [c for c in self.categorical_cols if c in X.columns]
-            X = X.drop(columns=to_drop)
-        return X
+        present = [c for c in cols if c in X.columns]
+        dtype = getattr(self, "output_dtype", "float64")
+        writer = OutputWriter(
+            X,
+            [col + self.suffix for col in present],
+            mode=self.output_mode,
+            drop=present if self.drop_original else (),
+            dtype=dtype,
+            out=out,
+        )
+        tables = self._compiled()
+        empty = CompiledMapping.from_dict({}, dtype=dtype)
+        monitors = self._monitors()
+        encoded = map_columns(
+            _lookup if monitors is None else partial(_lookup_hits, max_rows=getattr(self, "monitor_rows", None)),
+            # não vistas → WoE de "__other__"; NaN → entrada "__nan__" ou `default_woe`
+            [(tables.get(col, empty), X[col], self._unseen_woe(col), self.default_woe) for col in present],
+            self.n_jobs,
+            labels=present,
+        )
+        for col, values in zip(present, encoded):
+            if monitors is not None:
+                values, slots, counts = values
+                if col in monitors:
+                    monitors[col].add(slots, counts)
+            writer.write(col + self.suffix, values)
+        return writer.result()
+
+    # Monitoramento de drift ------------------------------------------
+    def _monitors(self) -> Optional[Dict[str, HitCounter]]:
+        """Contadores por feature (criados no primeiro `transform`), ou `None` sem `monitor`."""
+        if not getattr(self, "monitor", False):
+            return None
+        if getattr(self, "monitor_", None) is None:
+            with _MONITOR_LOCK:
+                if getattr(self, "monitor_", None) is None:
+                    self.monitor_ = {
+                        col: HitCounter(table.slot_labels()) for col, table in self._compiled().items()
+                    }
+        return self.monitor_
+
+    def reset_monitor(self) -> "WOEGuard":
+        """Zera as contagens acumuladas pelo `transform`. Retorna `self`."""
+        for counter in (getattr(self, "monitor_", None) or {}).values():
+            counter.reset()
+        return self
+
+    def _training_counts(self, col: str) -> pd.Series:
+        """Linhas do fit por categoria/faixa, com `NaN` em `"__nan__"` mesmo se `include_nan=False`."""
+        if col in self.bins_:
+            bins = self.bins_[col]
+            labels, total = bins.labels()[: len(bins.count)], bins.count.tolist()
+            nan_count = bins.nan_count
+        else:
+            stats = self.stats_[col].sorted()
+            labels, total = stats.categories.tolist(), stats.count.tolist()
+            nan_count = stats.nan_count
+        counts = pd.Series(total, index=pd.Index(labels, dtype=object), dtype=np.int64)
+        if nan_count:
+            counts = pd.concat([counts, pd.Series({NAN_KEY: nan_count})]).groupby(level=0, sort=False).sum()
+        return counts
+
+    def drift_report(self, eps: float = 1e-4) -> pd.DataFrame:
+        """Análise característica: distribuição do fit vs. linhas vistas no `transform`.
+
+        Uma linha por categoria com contagens e participações (`expected_pct`,
+        `actual_pct`), o termo de PSI (participações limitadas a `eps`) e
+        `woe_shift = (actual_pct - expected_pct) * woe`, o deslocamento do WoE
+        médio da feature. Requer `monitor=True` e as contagens do fit."""
+        if not getattr(self, "monitor", False):
+            raise RuntimeError("Monitoramento desligado. Use `WOEGuard(..., monitor=True)`.")
+        cols = self._state_cols()
+        monitors = self._monitors()
+        parts = []
+        for col in cols:
+            mapping, unseen = self.woe_log_[col], self._unseen_woe(col)
+            parts.append(drift_table(
+                col,
+                self._training_counts(col),
+                monitors[col].snapshot(),
+                lambda c, m=mapping, u=unseen: m.get(c, self.default_woe if c == NAN_KEY else u),
+                OTHER_KEY,
+                eps,
+            ))
+        return pd.concat(parts, ignore_index=True)
+
+    def psi(self, eps: float = 1e-4) -> pd.Series:
+        """Population Stability Index por feature sobre as linhas monitoradas."""
+        report = self.drift_report(eps)
+        return report.groupby("feature", sort=False)["psi"].sum().rename("psi")
+
+    def memory_estimate(self, X: pd.DataFrame) -> Dict[str, int]:
+        """Estimativa de memória do `transform`: saída (bytes) e temporários por linha.
+
+        Cada coluna em processamento aloca os códigos inteiros e o array de WoE (em `output_dtype`)."""
+        X = as_frame(X)
+        present = [c for c in self._encoded_cols if c in X.columns]
+        workers = min(max(1, effective_n_jobs(self.n_jobs)), max(1, len(present)))
+        dtype = getattr(self, "output_dtype", "float64")
+        return {
+            "output": estimate_output_bytes(X, len(present), self.output_mode, dtype),
+            "temporary_per_row": (8 + np.dtype(dtype).itemsize) * workers,
+        }
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Nomes das colunas devolvidas por `transform`, na mesma ordem.
+
+        Em `"copy"`/`"inplace"` inclui as colunas de entrada (`input_features` ou as
+        vistas no `fit`), sem as originais quando `drop_original=True`."""
+        if input_features is None:
+            input_features = getattr(self, "feature_names_in_", None)
+        cols = self._encoded_cols
+        if input_features is not None:
+            cols = [c for c in cols if c in set(input_features)]
+        encoded = [c + self.suffix for c in cols]
+        if self.output_mode in ("encoded_only", "ndarray") or input_features is None:
+            return np.asarray(encoded, dtype=object)
+        dropped = set(cols) if self.drop_original else set()
+        kept = [f for f in input_features if f not in dropped and f not in set(encoded)]
+        return np.asarray(kept + encoded, dtype=object)
 
     def fit_transform(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:  # type: ignore[override]
-        """Ajusta e transforma em uma só etapa e retorna `X` transformado com `y` como primeira coluna."""
+        """Ajusta e transforma em uma só etapa e retorna `X` transformado com `y` como primeira coluna.
+
+        Com `output_mode` diferente de `"copy"` retorna a saída de `transform` sem a coluna `y`."""
         Xt = self.fit(X, y).transform(X)
+        if self.output_mode != "copy" or not isinstance(Xt, pd.DataFrame):
+            return Xt
         Xt[y.name] = y.values  # adiciona a coluna y
         # reorganiza para que y fique como primeira coluna
         cols = [y.name] + [c for c in Xt.columns if c != y.name]
         return Xt[cols]
 
+    def to_scorer(self) -> "WOEScorer":
+        """Compila um `WOEScorer` (sem pandas) para scoring de registros individuais."""
+        from .woe_scorer import WOEScorer
+
+        return WOEScorer.from_encoder(self)
+
     def view_log(self) -> Dict[str, Dict]:
         """Retorna o mapeamento interno `woe_log_`."""
         return self.woe_log_
 
     def export_log(self, path: Union[str, Path]) -> None:
-        """Salva `woe_log_` e `iv_log_` em arquivo JSON."""
-        data = {"woe_log": self.woe_log_, "iv_log": self.iv_log_}
+        """Salva `woe_log_`, `iv_log_` e as faixas numéricas (`bins_`) em arquivo JSON."""
+        woe_log = {col: dict(mapping) for col, mapping in self.woe_log_.items()}
+        data = {"woe_log": woe_log, "iv_log": self.iv_log_}
+        bins = getattr(self, "bins_", {})
+        if bins:
+            data["bins"] = {col: b.to_dict() for col, b in bins.items()}
+        if getattr(self, "n_buckets", None):
+            data["n_buckets"] = self.n_buckets
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
 
@@ -166,6 +635,8 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         alpha: Optional[float] = None,
         default_woe: Optional[float] = None,
         include_nan: Optional[bool] = None,
+        output_mode: Optional[str] = None,
+        output_dtype: Optional[str] = None,
     ) -> "WOEGuard":
         """Carrega mapeamento de JSON e retorna um encoder pronto para `transform()`.
 
@@ -174,37 +645,105 @@ class WOEGuard(BaseEstimator, TransformerMixin):
             data = json.load(f)
         woe_log = data.get("woe_log", {})
         iv_log = data.get("iv_log", {})
-        cols = list(woe_log.keys())
+        bins = {col: NumericBins.from_dict(spec) for col, spec in data.get("bins", {}).items()}
+        cols = [col for col in woe_log if col not in bins]
+        n_buckets = data.get("n_buckets")
+        if n_buckets:
+            # JSON guarda as chaves como texto; os buckets voltam a ser inteiros
+            woe_log = {
+                col: {int(k) if col in cols and k.isdigit() else k: v for k, v in mapping.items()}
+                for col, mapping in woe_log.items()
+            }
         encoder = cls(
             categorical_cols=cols,
+            numeric_cols=list(bins) or None,
+            n_buckets=n_buckets,
             drop_original=drop_original if drop_original is not None else False,
             suffix=suffix if suffix is not None else "_woe",
             alpha=alpha if alpha is not None else 0.5,
             default_woe=default_woe if default_woe is not None else 0.0,
             include_nan=include_nan if include_nan is not None else True,
+            output_mode=output_mode if output_mode is not None else "copy",
+            output_dtype=output_dtype if output_dtype is not None else "float64",
         )
         encoder.woe_log_ = woe_log
         encoder.iv_log_ = iv_log
+        encoder.bins_ = bins
+        encoder._compile()
         encoder.fitted_ = True
         return encoder
 
-    def summary(self, path: Optional[Union[str, Path]] = None) -> pd.DataFrame:
-        """Retorna DataFrame resumo e opcionalmente salva em XLSX."""
+    def _summary_part(self, col: str):
+        """Categorias, contagens total/bad e WoE guardado (`None` se há contagens) de `col`."""
+        if col in self.bins_ or col in getattr(self, "stats_", {}):
+            return (*self._column_table(col), None)
+        mapping = self.woe_log_[col]
+        if isinstance(mapping, SortedMapping):
+            labels = list(mapping)
+            woe = mapping.values.astype(float)
+            if mapping.nan_entry is not None:
+                woe = np.append(woe, mapping.nan_entry)
+        else:
+            labels = list(mapping.keys())
+            woe = np.fromiter(mapping.values(), dtype=float, count=len(labels))
+        missing = np.full(len(labels), np.nan)
+        return labels, missing, missing, woe
+
+    def summary(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        format: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Retorna DataFrame resumo por (feature, categoria) e opcionalmente o exporta.
+
+        Colunas: `count`, `count_pct`, `good`, `bad`, `event_rate`, `dist_good`,
+        `dist_bad`, `woe` e `iv`; após `iv_stability()`, também os intervalos de
+        WoE/IV e `sign_stability`. Tudo é calculado de uma vez sobre os arrays de
+        contagens concatenados (sem laço por categoria). Encoders carregados sem
+        contagens (JSON/colunar) trazem apenas `woe`/`iv`.
+
+        `path` aceita `.csv`, `.parquet` ou `.xlsx` (ou `format` explícito); o XLSX é
+        escrito em streaming, com memória constante, em novas abas a cada
+        1.048.575 linhas."""
         if not self.fitted_:
             raise RuntimeError("Encoder não foi ajustado.")
-        rows = []
-        for col, mapping in self.woe_log_.items():
-            for cat, woe in mapping.items():
-                rows.append({
-                    "feature": col,
-                    "category": cat,
-                    "woe": woe,
-                    "iv": self.iv_log_.get(col, np.nan),
-                })
-        df = pd.DataFrame(rows)
+        parts = [(col, *self._summary_part(col)) for col in self.woe_log_]
+        parts = [p for p in parts if len(p[1])]
+        lengths = np.array([len(p[1]) for p in parts], dtype=np.intp)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.intp)
+        total = np.concatenate([p[2] for p in parts]) if parts else np.empty(0)
+        bad = np.concatenate([p[3] for p in parts]) if parts else np.empty(0)
+        good = total - bad
+
+        def per_feature(a: np.ndarray) -> np.ndarray:
+            return np.repeat(np.add.reduceat(a, starts), lengths) if len(a) else a
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            smoothed_good, smoothed_bad = good + self.alpha, bad + self.alpha
+            woe = np.log((smoothed_good / per_feature(smoothed_good)) / (smoothed_bad / per_feature(smoothed_bad)))
+            stored = [p[4] for p in parts]
+            if any(w is not None for w in stored):
+                woe = np.where(np.isnan(total), np.concatenate([
+                    np.full(n, np.nan) if w is None else w for w, n in zip(stored, lengths)
+                ]), woe)
+            df = pd.DataFrame({
+                "feature": np.repeat(np.array([p[0] for p in parts], dtype=object), lengths),
+                "category": np.array([c for p in parts for c in p[1]], dtype=object),
+                "count": total,
+                "count_pct": total / per_feature(total),
+                "good": good,
+                "bad": bad,
+                "event_rate": bad / total,
+                "dist_good": good / per_feature(good),
+                "dist_bad": bad / per_feature(bad),
+                "woe": woe,
+                "iv": np.repeat([self.iv_log_.get(p[0], np.nan) for p in parts], lengths),
+            })
+        stability = getattr(self, "stability_", None)
+        if stability is not None and len(df):
+            df = df.merge(stability, on=["feature", "category"], how="left")
         if path is not None:
-            with pd.ExcelWriter(path, engine="openpyxl") as writer:
-                df.to_excel(writer, sheet_name="WoE_Summary", index=False)
+            export_table(df, path, format=format, sheet_name="WoE_Summary")
         return df
 
     def plot_woe(self, feature: str, top_n: int = 30) -> None:
@@ -221,20 +760,57 @@ class WOEGuard(BaseEstimator, TransformerMixin):
         plt.tight_layout()
         plt.show()
 
-    def save(self, path: Union[str, Path]) -> None:
-        """Serializa o encoder via pickle."""
-        with open(path, "wb") as f:
-            pickle.dump(self, f)
+    def __getstate__(self):
+        # as tabelas compiladas são derivadas de `woe_log_` e refeitas sob demanda
+        state = dict(super().__getstate__())
+        state.pop("tables_", None)
+        return state
+
+    def save(self, path: Union[str, Path], format: str = "pickle") -> None:
+        """Serializa o encoder via pickle ou no formato binário colunar (`format="columnar"`)."""
+        if format == "columnar":
+            if not self.fitted_:
+                raise RuntimeError("Encoder não foi ajustado.")
+            write_woe(self, path)
+        elif format == "pickle":
+            with open(path, "wb") as f:
+                pickle.dump(self, f)
+        else:
+            raise ValueError("format deve ser 'pickle' ou 'columnar'.")
 
     @staticmethod
-    def load(path: Union[str, Path]) -> "WOEGuard":
-        """Carrega encoder salvo via `save()`."""
-        with open(path, "rb") as f:
-            return pickle.load(f)
+    def load(path: Union[str, Path], mmap: bool = True) -> "WOEGuard":
+        """Carrega encoder salvo via `save()`.
+
+        Artefatos colunares são mapeados em memória (`mmap=True`): apenas o
+        cabeçalho é lido e os arrays são compartilhados entre processos."""
+        if not is_columnar(path):
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        header, woe_log = read_woe(path, mmap=mmap)
+        encoder = WOEGuard(**header["params"])
+        encoder.bins_ = {col: NumericBins.from_dict(spec) for col, spec in header.get("bins", {}).items()}
+        woe_log.update({col: bins.mapping() for col, bins in encoder.bins_.items()})
+        encoder.woe_log_ = woe_log
+        encoder.iv_log_ = header["iv_log"]
+        encoder.global_event_rate_ = header["global_event_rate"]
+        encoder._compile()
+        encoder.fitted_ = True
+        return encoder
 
     def __repr__(self) -> str:
         status = "fitted" if getattr(self, "fitted_", False) else "unfitted"
         return (
-            f"<WOEGuard n_features={len(self.categorical_cols)} status={status} "
+            f"<WOEGuard n_features={len(self._encoded_cols)} status={status} "
             f"drop_original={self.drop_original}>"
         )
+
+
+def _lookup(table, s, default: float, nan_default: float) -> np.ndarray:
+    """WoE por linha via `CompiledMapping`/`SortedMapping` (categorias) ou `NumericBins` (faixas)."""
+    return table.lookup(s, default, nan_default)
+
+
+def _lookup_hits(table, s, default: float, nan_default: float, max_rows: Optional[int] = None):
+    """`_lookup` com as contagens por slot da tabela: `(valores, slots, contagens)`."""
+    return table.lookup_hits(s, default, nan_default, max_rows)
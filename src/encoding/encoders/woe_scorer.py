@@ -0,0 +1,126 @@
+"""Pandas-free scorer for low-latency, single-record WoE encoding.
+
+``WOEScorer`` is compiled from a fitted ``WOEGuard`` (or a JSON log) into flat
+``{category: woe}`` dicts, one per feature; binned numeric features keep their
+bin edges and are resolved with ``bisect``; hashed features (``n_buckets``) hash
+the value to its bucket first. Scoring a record is a handful of
+dict lookups with no DataFrame, copy or dtype conversion, and the scorer is
+immutable after construction, so a single instance can serve concurrent
+requests from many threads.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+__all__ = ["WOEScorer"]
+
+_NAN_KEY = "__nan__"
+_OTHER_KEY = "__other__"
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, (float, np.floating)) and value != value)
+
+
+def _bucket(value: Any, n_buckets: int) -> int:
+    """Hash bucket of one value, identical to ``_aggregation.hash_buckets``."""
+    from pandas.util import hash_array  # only hashed features need pandas
+
+    return int(hash_array(np.array([str(value)], dtype=object))[0] % np.uint64(n_buckets))
+
+
+class WOEScorer:
+    """Compiled WoE lookup for plain ``dict`` records.
+
+    Missing values (``None``/``NaN``, or a feature absent from the record) get the
+    ``"__nan__"`` WoE when ``include_nan`` is set and that category was seen at
+    fit time; otherwise – like unseen categories – they get ``default_woe``.
+    Unseen categories get the ``"__other__"`` WoE when rare categories were pooled.
+    Features listed in ``bins`` (``NumericBins`` or their ``to_dict()``) are scored
+    by locating the value among the right-closed bin edges.
+    """
+
+    __slots__ = ("_features", "feature_names_out", "default_woe")
+
+    def __init__(
+        self,
+        woe_log: Mapping[str, Mapping[Any, float]],
+        suffix: str = "_woe",
+        default_woe: float = 0.0,
+        include_nan: bool = True,
+        bins: Optional[Mapping[str, Any]] = None,
+        n_buckets: Optional[int] = None,
+    ) -> None:
+        bins = dict(bins or {})
+        features = []
+        for col, mapping in woe_log.items():
+            table = {key: float(value) for key, value in mapping.items()}
+            nan_woe = table.get(_NAN_KEY, default_woe) if include_nan else default_woe
+            unseen_woe = table.get(_OTHER_KEY, default_woe)
+            spec = bins.get(col)
+            hashed = None
+            if spec is not None:
+                spec = spec.to_dict() if hasattr(spec, "to_dict") else spec
+                table = (tuple(float(e) for e in spec["edges"]), tuple(float(w) for w in spec["woe"]))
+            else:
+                hashed = n_buckets
+            features.append((col, col + suffix, table, float(nan_woe), float(unseen_woe), hashed))
+        self._features: Tuple[Tuple[str, str, Any, float, float, Optional[int]], ...] = tuple(features)
+        self.feature_names_out: Tuple[str, ...] = tuple(f[1] for f in features)
+        self.default_woe = float(default_woe)
+
+    @classmethod
+    def from_encoder(cls, encoder) -> "WOEScorer":
+        """Build a scorer from a fitted ``WOEGuard``."""
+        if not getattr(encoder, "fitted_", False):
+            raise RuntimeError("Encoder must be fitted before building a scorer.")
+        return cls(
+            {col: encoder.woe_log_[col] for col in encoder._encoded_cols if col in encoder.woe_log_},
+            suffix=encoder.suffix,
+            default_woe=encoder.default_woe,
+            include_nan=encoder.include_nan,
+            bins=getattr(encoder, "bins_", None),
+            n_buckets=getattr(encoder, "n_buckets", None),
+        )
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path], **kwargs) -> "WOEScorer":
+        """Build a scorer from a log written by ``WOEGuard.export_log``."""
+        from .woe_guard import WOEGuard
+
+        return cls.from_encoder(WOEGuard.load_from_json(path, **kwargs))
+
+    def _values(self, record: Mapping[str, Any]) -> List[float]:
+        out = []
+        for col, _, table, nan_woe, unseen_woe, n_buckets in self._features:
+            value = record.get(col)
+            if _is_missing(value):
+                out.append(nan_woe)
+            elif isinstance(table, tuple):
+                edges, woe = table
+                out.append(woe[bisect_left(edges, float(value))])
+            else:
+                key = _bucket(value, n_buckets) if n_buckets else value
+                out.append(table.get(key, unseen_woe))
+        return out
+
+    def score(self, record: Mapping[str, Any]) -> Dict[str, float]:
+        """Encode one record into ``{feature + suffix: woe}``."""
+        return dict(zip(self.feature_names_out, self._values(record)))
+
+    def score_many(self, records: Iterable[Mapping[str, Any]]) -> List[Dict[str, float]]:
+        """Encode a list of records, one output dict per record."""
+        return [self.score(record) for record in records]
+
+    def score_matrix(self, records: Iterable[Mapping[str, Any]]) -> np.ndarray:
+        """Encode records into a ``(n_records, n_features)`` float array."""
+        rows = [self._values(record) for record in records]
+        return np.array(rows, dtype=float).reshape(len(rows), len(self._features))
+
+    def __repr__(self) -> str:
+        return f"<WOEScorer n_features={len(self._features)}>"
@@ -1,25 +1,96 @@
 from __future__ import annotations
 
-from typing import Dict, Type, Iterable, Protocol, Optional, Any
+import copy
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, List, Type, Iterable, Protocol, Optional, Any, Tuple, Union
 
 import numpy as np
 
 import pandas as pd
 import joblib
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
 
 VERSION_HEADER = 1
 
+from .comparison import ComparisonResult
 from .memory_manager import MemoryManager
-from .encoders import WOEGuard, TargetEncoder, LeaveOneOutEncoder, OneHotEncoder
+from .encoders import WOEGuard, TargetEncoder, LeaveOneOutEncoder, OneHotEncoder, CompositeEncoder
+from .encoders._arrow import ArrowFrame, as_frame, pa, pl
+from .encoders._output import low_precision_savings
 from .missing import MissingHandler
+from .report.stats import shallow_stats
 
 class Encoder(Protocol):
     def fit(self, X: pd.DataFrame, y: pd.Series): ...
     def transform(self, X: pd.DataFrame): ...
 
 
-class EncodingManager:
-    """Factory and orchestrator for categorical encoders."""
+@dataclass
+class TransformPlan:
+    """Memory plan chosen by ``EncodingManager.plan_transform``."""
+
+    strategy: str  # "direct" or "chunked"
+    estimated_bytes: int
+    output_bytes: int
+    budget: int | None
+    chunk_rows: int | None = None
+    sparse: bool = False
+    reason: str = ""
+
+
+_MIN_CHUNK_ROWS = 1024
+
+
+def _stack(parts: list):
+    if sp.issparse(parts[0]):
+        return sp.vstack(parts, format="csr")
+    if isinstance(parts[0], np.ndarray):
+        return np.vstack(parts)
+    if pa is not None and isinstance(parts[0], pa.Table):
+        return pa.concat_tables(parts)  # zero-copy: each block becomes a chunk
+    if pl is not None and isinstance(parts[0], pl.DataFrame):
+        return pl.concat(parts, rechunk=False)
+    return pd.concat(parts)
+
+
+def _input_bytes(X) -> int:
+    if isinstance(X, ArrowFrame):
+        return X.nbytes
+    return int(X.memory_usage(index=False, deep=False).sum())
+
+
+EncodingSpec = Union[str, List[Tuple[str, Dict[str, Any]]]]
+
+
+class EncodingManager(TransformerMixin, BaseEstimator):
+    """Factory and orchestrator for categorical encoders.
+
+    The manager is a scikit-learn transformer (``get_feature_names_out``,
+    ``set_output``, ``get_params``/``set_params``), so it goes straight into a
+    ``Pipeline`` with missing-value handling and profiling intact. ``encoding``
+    is a registered name or a list of ``(name, kwargs)`` pairs; the latter builds
+    a ``CompositeEncoder`` whose dense and one-hot blocks land in one output
+    matrix (``passthrough=`` adds numeric columns, ``"remainder"`` keeps all the
+    others).
+
+    Before every ``transform`` the manager estimates the memory it needs (the
+    encoder's ``memory_estimate`` plus the missing-value copy) and compares it
+    with ``memory_budget`` bytes, or with ``MemoryManager.memory_ok`` when no
+    budget is given. Over budget, rows are encoded in blocks written into one
+    preallocated output; one-hot output stays sparse. Decisions are logged and
+    kept in ``last_plan_``.
+
+    ``output_dtype`` (``"float32"``/``"float16"``) is forwarded to the encoder; the
+    bytes saved against ``float64`` output are recorded in ``comparison_``.
+    ``frame_stats_["raw"]`` keeps the dtype sizes and NaN counts of the last
+    ``transform`` input, gathered on the way (``ReportBuilder(stats=...)``). The
+    counts come for free when ``missing_sentinel`` fills NaN (the fill builds
+    the mask anyway). With the default NaN sentinel they would cost a full
+    ``isna`` scan per call, so they are only gathered with ``collect_stats=True``;
+    otherwise ``frame_stats_`` stays empty.
+    """
 
     _registry: Dict[str, Type[Encoder]] = {
         "woe": WOEGuard,
@@ -28,45 +99,312 @@ class EncodingManager:
         "onehot": OneHotEncoder,
     }
 
+    _MANAGER_PARAMS = (
+        "encoding",
+        "memory_manager",
+        "missing_sentinel",
+        "output_mode",
+        "n_jobs",
+        "backend",
+        "memory_budget",
+        "output_dtype",
+        "collect_stats",
+    )
+
     def __init__(
         self,
-        encoding: str = "onehot",
+        encoding: EncodingSpec = "onehot",
         memory_manager: Optional[MemoryManager] = None,
         missing_sentinel: str | int | float | None = np.nan,
+        output_mode: str | None = None,
+        n_jobs: int | None = None,
+        backend: str | None = None,
+        memory_budget: int | None = None,
+        output_dtype: str | None = None,
+        collect_stats: bool = False,
         **encoder_kwargs,
     ) -> None:
-        if encoding not in self._registry:
-            raise ValueError(f"Encoding '{encoding}' not registered")
-        self.encoder_cls = self._registry[encoding]
-        self.encoder: Encoder = self.encoder_cls(**encoder_kwargs)  # type: ignore[call-arg]
+        self.encoding = encoding
+        self.missing_sentinel = missing_sentinel
+        self.output_mode = output_mode
+        self.n_jobs = n_jobs
+        self.output_dtype = output_dtype
+        self.collect_stats = collect_stats
+        self.encoder_kwargs = encoder_kwargs
+        # joblib backend for the per-column work ("threading", "loky", ...)
+        self.backend = backend
+        self.memory_budget = memory_budget
+        self.last_plan_: TransformPlan | None = None
+        self.encoder: Encoder = self._build_encoder()
         self.memory_manager = memory_manager or MemoryManager()
         self.missing_handler = MissingHandler(sentinel=missing_sentinel)
+        # filled from the profiled fit/transform runs
+        self.comparison_ = ComparisonResult()
+
+    def _build_encoder(self) -> Encoder:
+        kwargs = dict(self.encoder_kwargs)
+        if isinstance(self.encoding, str):
+            if self.encoding not in self._registry:
+                raise ValueError(f"Encoding '{self.encoding}' not registered")
+            self.encoder_cls = self._registry[self.encoding]
+            for name in ("output_mode", "n_jobs", "output_dtype"):
+                if getattr(self, name) is not None:
+                    kwargs[name] = getattr(self, name)
+            return self.encoder_cls(**kwargs)  # type: ignore[call-arg]
+
+        if self.output_mode not in (None, "ndarray"):
+            raise ValueError("combined encodings always return a single matrix; use output_mode=None")
+        children = []
+        for name, child_kwargs in self.encoding:
+            if name not in self._registry:
+                raise ValueError(f"Encoding '{name}' not registered")
+            child_kwargs = dict(child_kwargs)
+            if self.output_dtype is not None:
+                child_kwargs.setdefault("output_dtype", self.output_dtype)
+            children.append(self._registry[name](**child_kwargs))
+        if self.output_dtype is not None:
+            kwargs["output_dtype"] = self.output_dtype
+        self.encoder_cls = CompositeEncoder
+        return CompositeEncoder(children, n_jobs=self.n_jobs, **kwargs)
+
+    # scikit-learn API -----------------------------------------------
+    def get_params(self, deep: bool = True) -> Dict[str, Any]:
+        """Manager parameters plus the encoder keyword arguments (flattened)."""
+        params = {name: getattr(self, name) for name in self._MANAGER_PARAMS}
+        params.update(self.encoder_kwargs)
+        return params
+
+    def set_params(self, **params) -> "EncodingManager":
+        """Update parameters and rebuild the (unfitted) encoder."""
+        for name, value in params.items():
+            if name in self._MANAGER_PARAMS:
+                setattr(self, name, value)
+            else:
+                self.encoder_kwargs[name] = value
+        if "missing_sentinel" in params:
+            self.missing_handler = MissingHandler(sentinel=self.missing_sentinel)
+        self.encoder = self._build_encoder()
+        return self
+
+    def __sklearn_is_fitted__(self) -> bool:
+        return hasattr(self, "feature_names_in_")
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Names of the columns returned by ``transform``, in order."""
+        if input_features is None:
+            input_features = getattr(self, "feature_names_in_", None)
+        return np.asarray(self.encoder.get_feature_names_out(input_features), dtype=object)
 
     @classmethod
     def register(cls, name: str, encoder_cls: Type[Encoder]) -> None:
         cls._registry[name] = encoder_cls
 
-    def fit(self, X: pd.DataFrame, y: pd.Series) -> "EncodingManager":
-        X_prep = self.missing_handler.fit_transform(X)
-        with self.memory_manager.profile("fit"):
-            self.encoder.fit(X_prep, y)
+    def _parallel(self):
+        if self.backend is None:
+            return nullcontext()
+        return joblib.parallel_config(backend=self.backend)
+
+    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> "EncodingManager":
+        X = as_frame(X)
+        self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.n_features_in_ = X.shape[1]
+        profile = self.memory_manager.profile
+        with profile("fit") as rec:
+            with profile("fit.missing"):
+                X_prep = self.missing_handler.fit_transform(X)
+            with profile("fit.encode"), self._parallel():
+                self.encoder.fit(X_prep, y)
+        self.comparison_.time_fit = rec.duration
+        return self
+
+    def fit_chunks(
+        self,
+        chunks: Iterable[Union[pd.DataFrame, Tuple[pd.DataFrame, pd.Series]]],
+        target: str | None = None,
+    ) -> "EncodingManager":
+        """Fit out-of-core from an iterable of row chunks.
+
+        ``chunks`` yields either ``(X, y)`` pairs or frames holding the ``target``
+        column, e.g. ``pd.read_csv(path, chunksize=100_000)`` or, without any
+        pandas conversion, ``(pa.Table.from_batches([b]) for b in pq.ParquetFile(path).iter_batches())``. The
+        encoder accumulates counts via ``partial_fit`` and is finalized at the end,
+        so memory stays bounded by one chunk plus the category cardinality.
+        """
+        if not hasattr(self.encoder, "partial_fit"):
+            raise TypeError(f"{type(self.encoder).__name__} does not support partial_fit")
+        fitted_missing = False
+        with self.memory_manager.profile("fit_chunks") as rec, self._parallel():
+            for chunk in chunks:
+                if isinstance(chunk, tuple):
+                    X, y = chunk
+                else:
+                    if target is None:
+                        raise ValueError("target column is required when chunks are DataFrames")
+                    chunk = as_frame(chunk)
+                    if isinstance(chunk, ArrowFrame):
+                        X, y = chunk[[c for c in chunk.columns if c != target]], chunk[target]
+                    else:
+                        X, y = chunk.drop(columns=[target]), chunk[target]
+                X = as_frame(X)
+                if not fitted_missing:
+                    self.missing_handler.fit(X)
+                    self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+                    self.n_features_in_ = X.shape[1]
+                    fitted_missing = True
+                self.encoder.partial_fit(self.missing_handler.transform(X), y)
+            self.encoder.finalize()
+        self.comparison_.time_fit = rec.duration
         return self
 
+    def plan_transform(self, X: pd.DataFrame) -> TransformPlan:
+        """Estimate the memory of ``transform(X)`` and choose direct or chunked execution."""
+        X = as_frame(X)
+        n_rows = len(X)
+        input_bytes = _input_bytes(X)
+        if hasattr(self.encoder, "memory_estimate"):
+            est = self.encoder.memory_estimate(X)
+        else:
+            est = {"output": input_bytes, "temporary_per_row": input_bytes // max(n_rows, 1)}
+        per_row = est["temporary_per_row"]
+        if getattr(self.encoder, "output_mode", "copy") == "copy" and not isinstance(X, ArrowFrame):
+            # MissingHandler rebuilds the columns it fills; upper bound: all of them (Arrow: none)
+            per_row += input_bytes // max(n_rows, 1)
+        output = est["output"]
+        total = output + per_row * n_rows
+        sparse = "dense_output" in est
+
+        budget = self.memory_budget
+        if budget is None:
+            free = self.memory_manager.free_ram()
+            budget = int(0.5 * free) if free > 0 else None
+            fits = budget is None or self.memory_manager.memory_ok(total)
+        else:
+            fits = total < budget
+
+        if fits:
+            reason = "within budget" if budget is not None else "budget unknown"
+            if sparse:
+                reason += f"; sparse output instead of {est['dense_output']} dense bytes"
+            plan = TransformPlan("direct", total, output, budget, sparse=sparse, reason=reason)
+        else:
+            spare = budget - output
+            rows = spare // per_row if spare > 0 and per_row else _MIN_CHUNK_ROWS
+            chunk_rows = int(min(n_rows, max(_MIN_CHUNK_ROWS, rows)))
+            reason = "estimate exceeds budget"
+            if spare <= 0:
+                reason += "; output alone exceeds budget, minimising temporaries"
+            plan = TransformPlan("chunked", total, output, budget, chunk_rows, sparse, reason)
+        self.memory_manager.logger.info(
+            "transform plan: %s (estimated=%d output=%d budget=%s chunk_rows=%s): %s",
+            plan.strategy, plan.estimated_bytes, plan.output_bytes, plan.budget, plan.chunk_rows, plan.reason,
+        )
+        self.last_plan_ = plan
+        return plan
+
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        X_prep = self.missing_handler.transform(X)
-        with self.memory_manager.profile("transform"):
-            return self.encoder.transform(X_prep)
+        """Encode ``X``; ``pyarrow.Table``/polars input is encoded natively and returned as such."""
+        X = as_frame(X)
+        profile = self.memory_manager.profile
+        mode = getattr(self.encoder, "output_mode", "copy")
+        plan = self.plan_transform(X)
+        raw = shallow_stats(X)  # before an in-place transform overwrites X
+        # free when the sentinel fill scans for NaN anyway, a full extra scan otherwise
+        collect = getattr(self, "collect_stats", False) or not self.missing_handler._keeps_nan
+        counts = raw.nan_counts if collect else None
+        with profile("transform", strategy=plan.strategy) as rec:
+            if plan.strategy == "chunked":
+                with profile("transform.chunked"), self._parallel():
+                    out = self._transform_chunked(X, plan.chunk_rows, counts)
+            else:
+                with profile("transform.missing"):
+                    # sentinel-filled columns replace those of a shallow copy, or of
+                    # ``X`` itself when writing in place
+                    X_prep = self.missing_handler.transform(X, copy=mode != "inplace", counts=counts)
+                with profile("transform.encode"), self._parallel():
+                    out = self.encoder.transform(X_prep)
+        self.comparison_.time_transform = rec.duration
+        self.comparison_.shape_change = (X.shape[1], out.shape[1])
+        self.comparison_.output_dtype = getattr(self.encoder, "output_dtype", "float64")
+        self.comparison_.memory_saved = low_precision_savings(out, self._encoded_columns(out))
+        self.frame_stats_ = {"raw": raw} if collect else {}
+        return out
+
+    def _encoded_columns(self, out) -> Optional[List[Any]]:
+        """Columns of ``out`` written by the encoder (positions for matrices); ``None`` when all are."""
+        enc = self.encoder
+        if isinstance(enc, CompositeEncoder):
+            return list(range(out.shape[1] - len(enc.passthrough_)))
+        if not hasattr(out, "columns"):  # ndarray / sparse: encoded values only
+            return None
+        if isinstance(enc, WOEGuard):
+            return [col + enc.suffix for col in enc._encoded_cols]
+        return list(getattr(enc, "columns", out.columns))
+
+    def _transform_chunked(self, X: pd.DataFrame, chunk_rows: int, counts: dict | None = None):
+        """Encode ``X`` in row blocks written into a single preallocated output."""
+        n_rows = len(X)
+        starts = range(0, n_rows, chunk_rows)
+        mode = getattr(self.encoder, "output_mode", None)
+        missing = self.missing_handler.transform
+        if isinstance(X, ArrowFrame):
+            # Arrow blocks are concatenated as chunks of one table, without copying
+            parts = [self.encoder.transform(missing(X.slice(a, chunk_rows), counts=counts)) for a in starts]
+            return _stack(parts) if parts else self.encoder.transform(X)
+        if mode is None:
+            # encoder without output modes (e.g. sparse one-hot): stack the blocks
+            parts = [
+                self.encoder.transform(missing(X.iloc[a:a + chunk_rows], counts=counts))
+                for a in starts
+            ]
+            return _stack(parts) if parts else self.encoder.transform(X)
+
+        if mode == "inplace":
+            X = missing(X, copy=False, counts=counts)
+
+        def with_mode(m: str):
+            enc = copy.copy(self.encoder)
+            enc.output_mode = m
+            return enc
 
-    def fit_transform(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+        block_enc = with_mode("ndarray")
+        names = list(with_mode("encoded_only").transform(X.iloc[:0]).columns)
+        dtype = getattr(self.encoder, "output_dtype", "float64")
+        block = np.empty((n_rows, len(names)), dtype=dtype, order="F")
+        for a in starts:
+            chunk = X.iloc[a:a + chunk_rows]
+            if mode != "inplace":
+                chunk = missing(chunk, counts=counts)
+            block[a:a + len(chunk)] = block_enc.transform(chunk)
+
+        if mode == "ndarray":
+            return block
+        if mode == "encoded_only":
+            return pd.DataFrame(block, index=X.index, columns=names, copy=False)
+        layout = list(with_mode("copy").transform(X.iloc[:0]).columns)
+        pos = {name: j for j, name in enumerate(names)}
+        if mode == "inplace":
+            for name, j in pos.items():
+                X[name] = block[:, j]
+            X.drop(columns=[c for c in X.columns if c not in layout], inplace=True)
+            return X
+        kept = missing(X[[c for c in layout if c not in pos]])  # already counted per block
+        out = {c: block[:, pos[c]] if c in pos else kept[c].array for c in layout}
+        return pd.DataFrame(out, index=X.index)
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series | None = None) -> pd.DataFrame:
         self.fit(X, y)
         return self.transform(X)
 
     # Serialization -------------------------------------------------
     def save(self, path: str) -> None:
+        params = self.get_params()
+        params.pop("memory_manager")  # holds sinks/locks; recreated on load
         payload = {
             "version": VERSION_HEADER,
+            "params": params,
             "encoder": self.encoder,
             "missing_handler": self.missing_handler,
+            "feature_names_in": getattr(self, "feature_names_in_", None),
         }
         joblib.dump(payload, path)
 
@@ -76,7 +414,24 @@ class EncodingManager:
         _version = payload.get("version", 0)
         enc = payload["encoder"]
         mh = payload.get("missing_handler", MissingHandler())
-        manager = cls(enc.__class__.__name__.lower())
+        params = payload.get("params")
+        if params is None:
+            # older payloads: recover the registered name from the encoder class
+            name = next((n for n, c in cls._registry.items() if type(enc) is c), None)
+            if name is None:
+                raise ValueError(f"Unregistered encoder class {type(enc).__name__}")
+            params = {"encoding": name, **_init_kwargs(enc)}
+        manager = cls(**params)
         manager.encoder = enc
         manager.missing_handler = mh
+        manager.feature_names_in_ = payload.get("feature_names_in")
+        if manager.feature_names_in_ is None:
+            del manager.feature_names_in_
         return manager
+
+
+def _init_kwargs(enc: Encoder) -> Dict[str, Any]:
+    """Constructor arguments required to rebuild a placeholder of ``enc``'s class."""
+    if isinstance(enc, WOEGuard):
+        return {"categorical_cols": enc.categorical_cols, "numeric_cols": getattr(enc, "numeric_cols", None)}
+    return {"columns": list(getattr(enc, "columns", []))}
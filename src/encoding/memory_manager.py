@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import time
 import logging
+import threading
+import tracemalloc
 from contextlib import contextmanager
+from typing import Iterable, List
+
+from .profiling import LoggingSink, MetricsSink, ProfileRecord, RssSampler, column_timer
 
 try:
     import psutil
@@ -10,10 +15,60 @@ except Exception:  # pragma: no cover - fallback if psutil not available
     psutil = None
 
 class MemoryManager:
-    """Monitor available RAM and CPU usage."""
+    """Monitor available RAM and profile the operations of the encoders.
+
+    ``profile`` measures wall time with ``time.perf_counter``, the peak RSS of
+    *this* process (background sampling), optionally the Python heap peak via
+    ``tracemalloc`` (``trace_python=True``), and per-column timings reported by
+    the encoders. Each finished operation is emitted as a ``ProfileRecord`` to
+    every sink in ``sinks`` (default: a ``LoggingSink``).
 
-    def __init__(self, logger: logging.Logger | None = None) -> None:
+    All profiles of one manager share a single ``RssSampler`` thread, and the
+    stack of nested ``tracemalloc`` frames is kept per thread, so concurrent
+    transforms can be profiled. The ``tracemalloc`` peak counter is process
+    wide, though: with ``trace_python=True`` the Python peaks of overlapping
+    operations in different threads include each other's allocations.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        sinks: Iterable[MetricsSink] | None = None,
+        trace_python: bool = False,
+        sample_interval: float = 0.005,
+    ) -> None:
         self.logger = logger or logging.getLogger(__name__)
+        self.sinks: List[MetricsSink] = list(sinks) if sinks is not None else [LoggingSink(self.logger)]
+        self.trace_python = trace_python
+        self.sample_interval = sample_interval
+        self._init_runtime()
+
+    def _init_runtime(self) -> None:
+        self._sampler = RssSampler(self.sample_interval)
+        self._local = threading.local()
+
+    @property
+    def _stack(self) -> List[list]:
+        """Open ``tracemalloc`` frames of the calling thread, innermost last."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_sampler"], state["_local"]
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self.__dict__.pop("_stack", None)  # pickled before the stack became per thread
+        self._init_runtime()
+
+    def __deepcopy__(self, memo) -> "MemoryManager":
+        # shared, not copied: ``sklearn.base.clone`` of an ``EncodingManager`` keeps
+        # reporting to the same sinks (which hold locks and file handles)
+        return self
 
     def free_ram(self) -> int:
         if psutil:
@@ -27,18 +82,55 @@ class MemoryManager:
     def memory_ok(self, predicted_size: int) -> bool:
         return predicted_size < 0.5 * self.free_ram()
 
+    def add_sink(self, sink: MetricsSink) -> None:
+        self.sinks.append(sink)
+
+    def _start_trace(self, frame: list) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            frame.append(True)
+        else:
+            frame.append(False)
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            # keep the parent's peak before resetting the shared counter
+            parent = self._stack[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        frame[0] = current
+        frame[1] = current
+
+    def _stop_trace(self, frame: list) -> int:
+        frame[1] = max(frame[1], tracemalloc.get_traced_memory()[1])
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], frame[1])
+        if frame[2]:
+            tracemalloc.stop()
+        return frame[1] - frame[0]
+
     @contextmanager
-    def profile(self, op_name: str):
-        start = time.time()
-        mem_before = self.free_ram()
+    def profile(self, op_name: str, **details):
+        """Profile the enclosed block; yields the ``ProfileRecord`` being filled."""
+        record = ProfileRecord(op=op_name, details=details)
+
+        def timer(col: str, seconds: float) -> None:
+            record.columns[col] = record.columns.get(col, 0.0) + seconds
+
+        window = self._sampler.open()
+        frame = [0, 0]  # [current at start, absolute peak, started tracing]
+        if self.trace_python:
+            self._start_trace(frame)
+            self._stack.append(frame)
+        token = column_timer.set(timer)
+        start = time.perf_counter()
         try:
-            yield
+            yield record
         finally:
-            dur = time.time() - start
-            mem_after = self.free_ram()
-            self.logger.info(
-                "%s finished in %.3fs (Δmem=%d bytes)",
-                op_name,
-                dur,
-                mem_before - mem_after,
-            )
+            record.duration = time.perf_counter() - start
+            column_timer.reset(token)
+            if self.trace_python:
+                self._stack.pop()
+                record.python_peak = self._stop_trace(frame)
+            record.rss_start, record.rss_peak = self._sampler.close(window)
+            for sink in self.sinks:
+                sink.emit(record)
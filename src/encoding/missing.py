@@ -3,26 +3,69 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from .encoders._arrow import ArrowFrame, fill_null
+
 class MissingHandler:
-    """Central utility for NaN management inspired by XGBoost."""
+    """Central utility for NaN management inspired by XGBoost.
+
+    ``fit`` freezes all state: the column dtypes and ``mapping``, the treatment
+    of every column with missing values in the fit data. ``transform`` only
+    reads it, so one fitted handler can serve many scoring threads. Missing
+    values are found with one vectorized ``isna`` pass over the frame and only
+    the affected columns are rebuilt; the others are shared with the input
+    (copy-on-write).
+    """
 
     def __init__(self, sentinel: str | int | float | None = np.nan) -> None:
         self.sentinel = sentinel
         self.mapping: dict[str, str] = {}
 
+    @property
+    def _keeps_nan(self) -> bool:
+        # ``np.nan`` loses its identity through pickling, so compare by value
+        s = self.sentinel
+        return s is None or (isinstance(s, float) and np.isnan(s))
+
+    @staticmethod
+    def _nan_counts(df) -> pd.Series:
+        """Missing values per column, from one vectorized pass (Arrow: ``null_count`` metadata)."""
+        if isinstance(df, ArrowFrame):
+            return pd.Series({col: df[col].null_count for col in df.columns}, dtype=np.int64)
+        return df.isna().sum()
+
     def fit(self, df: pd.DataFrame) -> "MissingHandler":
         self.dtypes_ = df.dtypes.to_dict()
+        nan = self._nan_counts(df)
+        treatment = "kept_as_nan" if self._keeps_nan else f"filled_with_{self.sentinel}"
+        self.mapping = {col: treatment for col in self.dtypes_ if nan.get(col, 0)}
         return self
 
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        out = df.copy()
-        for col, dtype in self.dtypes_.items():
-            if out[col].isna().any():
-                if self.sentinel is np.nan:
-                    self.mapping[col] = "kept_as_nan"
-                else:
-                    self.mapping[col] = f"filled_with_{self.sentinel}"
-                    out[col] = out[col].fillna(self.sentinel).astype(dtype)
+    def transform(self, df: pd.DataFrame, copy: bool = True, counts: dict | None = None) -> pd.DataFrame:
+        """Apply the sentinel to every fitted column; ``self`` is not modified.
+
+        With ``copy=True`` a shallow copy is returned in which only the filled
+        columns are new; with ``copy=False`` they are assigned into ``df``.
+        Arrow input (``ArrowFrame``) is immutable: a new frame sharing the
+        unfilled columns is returned. When ``counts`` is given, the NaN count of
+        every fitted column found in ``df`` is added to it (from the same mask
+        used to decide the fill), so callers get missing-value stats for free.
+        """
+        if self._keeps_nan and counts is None:
+            return df.copy(deep=False) if copy and not isinstance(df, ArrowFrame) else df
+        nan = self._nan_counts(df)
+        cols = [col for col in self.dtypes_ if col in nan.index]
+        if counts is not None:
+            for col in cols:
+                counts[col] = counts.get(col, 0) + int(nan[col])
+        fill = [] if self._keeps_nan else [col for col in cols if nan[col]]
+        if isinstance(df, ArrowFrame):
+            return df.with_columns({col: fill_null(df[col], self.sentinel) for col in fill}) if fill else df
+        out = df.copy(deep=False) if copy else df
+        for col in fill:
+            filled = out[col].fillna(self.sentinel)
+            if filled.dtype != self.dtypes_[col]:
+                filled = filled.astype(self.dtypes_[col])
+            out[col] = filled
         return out
 
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+try:
+    import psutil
+except Exception:  # pragma: no cover - fallback if psutil not available
+    psutil = None
+
+__all__ = [
+    "ProfileRecord",
+    "MetricsSink",
+    "InMemorySink",
+    "JsonLinesSink",
+    "LoggingSink",
+    "RssSampler",
+    "column_timer",
+]
+
+# Set by ``MemoryManager.profile`` while an operation runs; per-column work
+# (``encoders._parallel.map_columns``) reports ``(column, seconds)`` through it.
+column_timer: ContextVar[Optional[Callable[[str, float], None]]] = ContextVar("column_timer", default=None)
+
+
+@dataclass
+class ProfileRecord:
+    """Measurements of one profiled operation."""
+
+    op: str
+    duration: float = 0.0
+    rss_start: Optional[int] = None
+    rss_peak: Optional[int] = None
+    python_peak: Optional[int] = None
+    columns: Dict[str, float] = field(default_factory=dict)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def rss_peak_delta(self) -> Optional[int]:
+        if self.rss_start is None or self.rss_peak is None:
+            return None
+        return self.rss_peak - self.rss_start
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = asdict(self)
+        out["rss_peak_delta"] = self.rss_peak_delta
+        return out
+
+
+class MetricsSink(Protocol):
+    def emit(self, record: ProfileRecord) -> None: ...
+
+
+class InMemorySink:
+    """Collect records in a list (tests, notebooks, ``ComparisonResult``)."""
+
+    def __init__(self) -> None:
+        self.records: List[ProfileRecord] = []
+        self._lock = threading.Lock()
+
+    def emit(self, record: ProfileRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def by_op(self, op: str) -> List[ProfileRecord]:
+        return [r for r in self.records if r.op == op]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+
+class JsonLinesSink:
+    """Append one JSON object per record to ``path``."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def emit(self, record: ProfileRecord) -> None:
+        line = json.dumps(record.to_dict(), default=str)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class LoggingSink:
+    """Log a one-line summary per record."""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def emit(self, record: ProfileRecord) -> None:
+        self.logger.log(
+            self.level,
+            "%s finished in %.3fs (peak RSS %s, Δpeak %s bytes, python peak %s bytes)",
+            record.op,
+            record.duration,
+            record.rss_peak,
+            record.rss_peak_delta,
+            record.python_peak,
+        )
+
+
+def current_rss() -> Optional[int]:
+    if psutil:
+        return int(psutil.Process().memory_info().rss)
+    return None
+
+
+class RssSampler:
+    """Poll the process RSS in one background thread and keep the peak of every open window.
+
+    A single sampler serves any number of nested or concurrent windows
+    (``open``/``close``), so profiling a transform costs no thread start per
+    stage. The thread is started by the first window and exits after
+    ``linger`` seconds without one. Without ``psutil`` no thread runs and the
+    lifetime peak from ``resource.getrusage`` is reported.
+    """
+
+    def __init__(self, interval: float = 0.005, linger: float = 1.0) -> None:
+        self.interval = interval
+        self.linger = linger
+        self._windows: Dict[int, List[Optional[int]]] = {}
+        self._next = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                if not self._windows:
+                    self._cond.wait(self.linger)
+                    if not self._windows:
+                        self._thread = None
+                        return
+                    continue
+                self._cond.wait(self.interval)
+                rss = current_rss()
+                for window in self._windows.values():
+                    if rss > window[1]:
+                        window[1] = rss
+
+    def open(self) -> int:
+        """Start a window at the current RSS; returns its key for ``close``."""
+        rss = current_rss()
+        with self._cond:
+            key = self._next
+            self._next += 1
+            self._windows[key] = [rss, rss]
+            if rss is not None and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return key
+
+    def close(self, key: int) -> Tuple[Optional[int], Optional[int]]:
+        """End window ``key``; returns its ``(start_rss, peak_rss)``."""
+        rss = current_rss()
+        with self._cond:
+            start, peak = self._windows.pop(key)
+        if start is None:
+            try:
+                import resource
+                return None, int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+            except Exception:
+                return None, None
+        return start, max(peak, rss)
+
+
+def timed_column(func: Callable, label: str, timer: Callable[[str, float], None]) -> Callable:
+    """Wrap ``func`` so that its duration is reported to ``timer`` under ``label``."""
+
+    def wrapper(*args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timer(label, time.perf_counter() - start)
+
+    return wrapper
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def file_signature(path: str | Path) -> tuple[int, int, int]:
+    """``(mtime_ns, size, inode)`` of ``path``; changes whenever the file is rewritten or replaced."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class ArtefactCache:
+    """Bounded, thread-safe LRU of loaded artefacts.
+
+    Every entry remembers the ``file_signature`` of the file it was loaded from,
+    so a file rewritten or replaced on disk is reloaded instead of served stale,
+    even within the filesystem's timestamp resolution. Cached objects are
+    shared: every caller gets the same instance, which must be treated as
+    read-only.
+
+    ``get_or_load`` counts one hit or miss per call. Callers assembling one
+    logical load from several files use ``fetch`` and ``record`` instead, so
+    the counters reflect whole loads.
+    """
+
+    def __init__(self, maxsize: int = 8) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[tuple[int, int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, key: Hashable, path: str | Path, loader: Callable[[Path], Any]) -> Any:
+        value, hit = self.fetch(key, path, loader)
+        self.record(hit)
+        return value
+
+    def fetch(self, key: Hashable, path: str | Path, loader: Callable[[Path], Any]) -> tuple[Any, bool]:
+        """``(value, hit)`` for ``key``, loading ``path`` on a miss; the counters are not touched."""
+        path = Path(path)
+        signature = file_signature(path)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] == signature:
+                self._data.move_to_end(key)
+                return entry[1], True
+        value = loader(path)
+        if self.maxsize <= 0:
+            return value, False
+        with self._lock:
+            self._data[key] = (signature, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value, False
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import os
+import shutil
+from copy import deepcopy
+import tempfile
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import joblib
 
+from .cache import ArtefactCache, CacheInfo
+
 
 class ArtefactRegistry:
     """Interface for saving and loading encoder artefacts."""
@@ -17,12 +26,58 @@ class ArtefactRegistry:
         raise NotImplementedError
 
 
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Atomically write ``data`` unless ``path`` already holds exactly those bytes."""
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return
+    # a unique temporary name, so concurrent writers never share a partial file
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
 class FilesystemRegistry(ArtefactRegistry):
-    """Simple filesystem-based registry."""
+    """Simple filesystem-based registry.
+
+    Artefacts are content-addressed: each object is serialized once under
+    ``objects/<sha256>.joblib`` and an artefact directory only holds a
+    ``manifest.json`` with the hashes plus ``meta.json``. Identical encoders
+    saved under different names share a single object file, and re-saving an
+    unchanged artefact touches nothing on disk. Loaded objects are kept in a
+    bounded LRU (``cache_size`` entries) keyed by content hash; see
+    ``cache_info()`` for hit/miss/eviction counters, one hit or miss per
+    ``load``. ``load`` returns the cached instances themselves, shared by every
+    caller, so treat them as read-only. Pass ``copy=True`` for private copies
+    to mutate (e.g. refit).
 
-    def __init__(self, base_path: str | Path = "artefacts") -> None:
+    Objects no manifest refers to any more (after ``delete`` or an overwrite
+    with a different encoder) are removed by ``gc()``.
+    """
+
+    def __init__(self, base_path: str | Path = "artefacts", cache_size: int = 32) -> None:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.objects_path = self.base_path / "objects"
+        self.cache = ArtefactCache(cache_size)
+
+    def _put_object(self, obj: Any) -> str:
+        buf = io.BytesIO()
+        joblib.dump(obj, buf)
+        data = buf.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        self.objects_path.mkdir(exist_ok=True)
+        path = self.objects_path / f"{digest}.joblib"
+        if not path.exists():
+            _write_if_changed(path, data)
+        return digest
+
+    def _get_object(self, digest: str) -> tuple[Any, bool]:
+        path = self.objects_path / f"{digest}.joblib"
+        return self.cache.fetch(("object", digest), path, joblib.load)
 
     def save(
         self,
@@ -33,18 +88,85 @@ class FilesystemRegistry(ArtefactRegistry):
     ) -> Path:
         artefact_dir = self.base_path / name
         artefact_dir.mkdir(parents=True, exist_ok=True)
-        joblib.dump(encoder, artefact_dir / "encoder.pkl")
-        if missing_handler is not None:
-            joblib.dump(missing_handler, artefact_dir / "missing_handler.pkl")
-        with open(artefact_dir / "meta.json", "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        manifest = {
+            "encoder": self._put_object(encoder),
+            "missing_handler": self._put_object(missing_handler) if missing_handler is not None else None,
+        }
+        _write_if_changed(artefact_dir / "manifest.json", json.dumps(manifest, indent=2).encode("utf-8"))
+        _write_if_changed(artefact_dir / "meta.json", json.dumps(metadata, indent=2).encode("utf-8"))
         return artefact_dir
 
-    def load(self, name: str):
+    def load(self, name: str, copy: bool = False):
+        """``(encoder, missing_handler, metadata)`` of ``name``; shared instances unless ``copy=True``."""
         artefact_dir = self.base_path / name
-        encoder = joblib.load(artefact_dir / "encoder.pkl")
-        mh_path = artefact_dir / "missing_handler.pkl"
-        missing_handler = joblib.load(mh_path) if mh_path.exists() else None
-        with open(artefact_dir / "meta.json", "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        manifest_path = artefact_dir / "manifest.json"
+        missing_handler, mh_hit = None, True
+        if manifest_path.exists():
+            manifest, hit = self.cache.fetch(("manifest", str(manifest_path)), manifest_path, _read_json)
+            encoder, enc_hit = self._get_object(manifest["encoder"])
+            mh_hash = manifest.get("missing_handler")
+            if mh_hash:
+                missing_handler, mh_hit = self._get_object(mh_hash)
+        else:
+            # layout written before content addressing
+            hit = True
+            enc_path = artefact_dir / "encoder.pkl"
+            encoder, enc_hit = self.cache.fetch(("file", str(enc_path)), enc_path, joblib.load)
+            mh_path = artefact_dir / "missing_handler.pkl"
+            if mh_path.exists():
+                missing_handler, mh_hit = self.cache.fetch(("file", str(mh_path)), mh_path, joblib.load)
+        meta_path = artefact_dir / "meta.json"
+        metadata, meta_hit = self.cache.fetch(("meta", str(meta_path)), meta_path, _read_json)
+        self.cache.record(hit and enc_hit and mh_hit and meta_hit)
+        if copy:
+            return deepcopy(encoder), deepcopy(missing_handler), deepcopy(metadata)
         return encoder, missing_handler, metadata
+
+    def delete(self, name: str) -> None:
+        """Remove the artefact ``name``; its objects stay until ``gc()``."""
+        artefact_dir = self.base_path / name
+        if not (artefact_dir / "manifest.json").exists() and not (artefact_dir / "encoder.pkl").exists():
+            raise FileNotFoundError(f"no artefact named {name!r} in {self.base_path}")
+        shutil.rmtree(artefact_dir)
+        self.cache.discard(("manifest", str(artefact_dir / "manifest.json")))
+        self.cache.discard(("meta", str(artefact_dir / "meta.json")))
+        self.cache.discard(("file", str(artefact_dir / "encoder.pkl")))
+        self.cache.discard(("file", str(artefact_dir / "missing_handler.pkl")))
+
+    def gc(self, min_age: float = 60.0) -> List[str]:
+        """Delete objects no manifest refers to and leftover temporary files.
+
+        Files modified less than ``min_age`` seconds ago are kept, so a ``save``
+        running concurrently (whose manifest is not written yet) is not broken.
+        Returns the hashes of the removed objects.
+        """
+        if not self.objects_path.exists():
+            return []
+        live = set()
+        for manifest_path in self.base_path.rglob("manifest.json"):
+            if self.objects_path not in manifest_path.parents:
+                live.update(h for h in _read_json(manifest_path).values() if h)
+        cutoff = time.time() - min_age
+        removed = []
+        for path in self.objects_path.iterdir():
+            is_object = path.suffix == ".joblib" and path.stem not in live
+            if not (is_object or path.suffix == ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            if is_object:
+                self.cache.discard(("object", path.stem))
+                removed.append(path.stem)
+        return removed
+
+    def cache_info(self) -> CacheInfo:
+        return self.cache.info()
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -2,16 +2,27 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import pandas as pd
 import matplotlib.pyplot as plt
 
 from ..comparison import ComparisonResult
+from ..encoders._arrow import as_frame
+from ..encoders._output import low_precision_savings
+from .stats import FrameStats, frame_stats
 
 
 class ReportBuilder:
-    """Generate simple HTML and text reports comparing raw vs encoded data."""
+    """Generate simple HTML and text reports comparing raw vs encoded data.
+
+    Sections are built on first use and cached, so ``to_text`` followed by
+    ``to_html`` scans each frame at most once. ``stats`` takes precomputed
+    ``FrameStats`` under ``"raw"``/``"encoded"`` (e.g. ``manager.frame_stats_``)
+    and skips those scans entirely. With ``sample_rows`` the remaining
+    statistics come from a random row sample and the report states their error
+    bound at ``confidence``.
+    """
 
     def __init__(
         self,
@@ -19,35 +30,77 @@ class ReportBuilder:
         X_enc: pd.DataFrame,
         metadata: Optional[Dict[str, Any]] = None,
         comparison: Optional[ComparisonResult] = None,
+        stats: Optional[Dict[str, FrameStats]] = None,
+        sample_rows: Optional[int] = None,
+        confidence: float = 0.95,
+        random_state: Optional[int] = 0,
     ) -> None:
         self.X_raw = X_raw
         self.X_enc = X_enc
         self.metadata = metadata or {}
         self.comparison = comparison
+        self.stats = dict(stats or {})
+        self.sample_rows = sample_rows
+        self.confidence = confidence
+        self.random_state = random_state
+        self._cache: Dict[str, Any] = {}
+
+    def _cached(self, key: str, build: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def _frame_stats(self, which: str) -> FrameStats:
+        if which not in self.stats:
+            X = self.X_raw if which == "raw" else self.X_enc
+            self.stats[which] = frame_stats(X, self.sample_rows, self.confidence, self.random_state)
+        return self.stats[which]
 
     def _summary(self) -> pd.DataFrame:
-        mem_raw = self.X_raw.memory_usage(deep=True).sum()
-        mem_enc = self.X_enc.memory_usage(deep=True).sum()
-        return pd.DataFrame(
-            {
-                "n_features": [self.X_raw.shape[1], self.X_enc.shape[1]],
-                "memory": [mem_raw, mem_enc],
-            },
-            index=["raw", "encoded"],
-        )
+        def build() -> pd.DataFrame:
+            raw, enc = self._frame_stats("raw"), self._frame_stats("encoded")
+            return pd.DataFrame(
+                {
+                    "n_features": [raw.n_features, enc.n_features],
+                    "memory": [raw.memory, enc.memory],
+                },
+                index=["raw", "encoded"],
+            )
+
+        return self._cached("summary", build)
+
+    def _accuracy_section(self) -> str:
+        return "\n".join(f"{which}: {self._frame_stats(which).describe()}" for which in ("raw", "encoded"))
+
+    def memory_saved(self) -> int:
+        """Bytes saved by a low-precision ``output_dtype`` compared with ``float64``."""
+        if self.comparison is not None and self.comparison.memory_saved is not None:
+            return self.comparison.memory_saved
+        return self._cached("memory_saved", lambda: low_precision_savings(self.X_enc))
+
+    def _dtype_section(self) -> str:
+        dtype = self.comparison.output_dtype if self.comparison is not None else None
+        if dtype is None:
+            floats = [str(d) for d in self.X_enc.dtypes if getattr(d, "kind", "") == "f"]
+            dtype = ", ".join(sorted(set(floats))) or "n/a"
+        return f"output_dtype: {dtype}\nmemory saved vs float64: {self.memory_saved()} bytes"
 
     def to_html(self, path: str | Path) -> None:
         html = self._summary().to_html()
+        html += "<pre>" + self._accuracy_section() + "\n\n" + self._dtype_section() + "</pre>"
         Path(path).write_text(html, encoding="utf-8")
 
     def to_text(self) -> str:
         text = self._summary().to_string()
+        text += "\n" + self._accuracy_section()
+        text += "\n\nOutput Precision\n"
+        text += self._dtype_section()
         text += "\n\nMissing-Value Treatment\n"
         text += self._missing_section()
         return text
 
     def save_plot(self, path: str | Path) -> None:
-        counts = [self.X_raw.shape[1], self.X_enc.shape[1]]
+        counts = self._summary()["n_features"].tolist()
         plt.bar(["raw", "encoded"], counts)
         plt.ylabel("n_features")
         plt.tight_layout()
@@ -56,10 +109,21 @@ class ReportBuilder:
 
     # ------------------------------------------------------------------
     def _missing_section(self) -> str:
+        return self._cached("missing", self._build_missing_section)
+
+    def _build_missing_section(self) -> str:
         sentinel = self.metadata.get("missing", {}).get("sentinel")
-        raw_pct = self.X_raw.isna().mean() * 100
-        enc_pct = self.X_enc.isna().mean() * 100
-        df = pd.DataFrame({"raw_pct": raw_pct, "encoded_pct": enc_pct})
-        df = df[df["raw_pct"] > 0]
+        raw_pct = self._frame_stats("raw").nan_pct()
+        raw_pct = raw_pct[raw_pct > 0]
+        if "encoded" in self.stats:
+            enc_pct = self.stats["encoded"].nan_pct()
+        elif hasattr(self.X_enc, "columns"):
+            # only the columns shown are scanned
+            X_enc = as_frame(self.X_enc)
+            cols = [c for c in raw_pct.index if c in X_enc.columns]
+            enc_pct = frame_stats(X_enc[cols], self.sample_rows, self.confidence, self.random_state).nan_pct()
+        else:
+            enc_pct = pd.Series(dtype=float)  # ndarray output has no column names
+        df = pd.DataFrame({"raw_pct": raw_pct, "encoded_pct": enc_pct.reindex(raw_pct.index)})
         sec = df.round(2).to_string()
         return f"sentinel: {sentinel}\n{sec}"
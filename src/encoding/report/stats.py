@@ -0,0 +1,146 @@
+"""Per-column frame statistics for reports: memory and NaN counts.
+
+``frame_stats`` computes them exactly or, for large frames, from a uniform row
+sample with a stated error bound:
+
+* NaN fraction of each column – within ``± nan_error`` (Hoeffding bound,
+  ``sqrt(ln(2 / (1 - confidence)) / (2 m))`` for ``m`` sampled rows);
+* memory – fixed-width columns are exact (``itemsize × rows``); the payload of
+  ``object`` columns is extrapolated from the sampled rows' ``sys.getsizeof``,
+  and the total is within ``± nbytes_error`` (relative, normal approximation).
+
+Arrow input is always exact: sizes and null counts are Arrow metadata.
+``EncodingManager`` fills a ``FrameStats`` during ``transform`` (NaN counts from
+``MissingHandler``, shallow dtype sizes), so a report can skip the scan.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..encoders._arrow import ArrowFrame, as_frame
+
+__all__ = ["FrameStats", "frame_stats", "shallow_stats"]
+
+
+@dataclass
+class FrameStats:
+    """Row count, bytes and NaN count per column; errors are ``0`` when exact."""
+
+    n_rows: int
+    nbytes: Dict[str, float] = field(default_factory=dict)
+    nan_counts: Dict[str, float] = field(default_factory=dict)
+    sample_rows: Optional[int] = None
+    nan_error: float = 0.0
+    nbytes_error: float = 0.0
+    confidence: float = 0.95
+    # False when object columns were measured by their pointers only
+    deep: bool = True
+
+    @property
+    def n_features(self) -> int:
+        return len(self.nbytes)
+
+    @property
+    def memory(self) -> float:
+        return float(sum(self.nbytes.values()))
+
+    def nan_pct(self) -> pd.Series:
+        rows = max(self.n_rows, 1)
+        return pd.Series(self.nan_counts, dtype=float) * 100 / rows
+
+    def describe(self) -> str:
+        """One line stating how the numbers were obtained and how far off they can be."""
+        if self.sample_rows is None:
+            text = f"exact over {self.n_rows} rows"
+        else:
+            text = (
+                f"sampled {self.sample_rows} of {self.n_rows} rows: NaN % within "
+                f"±{self.nan_error * 100:.2f} pp, memory within ±{self.nbytes_error * 100:.2f}% "
+                f"({self.confidence:.0%} confidence)"
+            )
+        if not self.deep:
+            text += "; memory excludes object payloads"
+        return text
+
+
+def _boxed(dtype) -> bool:
+    """Whether values of ``dtype`` are Python objects (payload not in ``memory_usage(deep=False)``)."""
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "python"
+    return dtype == object
+
+
+def _arrow_stats(X: ArrowFrame) -> FrameStats:
+    table = X.table
+    return FrameStats(
+        n_rows=table.num_rows,
+        nbytes={name: float(col.nbytes) for name, col in zip(table.column_names, table.columns)},
+        nan_counts={name: float(col.null_count) for name, col in zip(table.column_names, table.columns)},
+    )
+
+
+def shallow_stats(X: Any) -> FrameStats:
+    """Row count and dtype sizes of ``X`` from metadata only, with empty NaN counts.
+
+    Used by ``EncodingManager``, which fills ``nan_counts`` from
+    ``MissingHandler.transform``. Object payloads are not measured (``deep=False``).
+    """
+    if isinstance(X, ArrowFrame):
+        stats = _arrow_stats(X)
+        stats.nan_counts = {}
+        return stats
+    nbytes = {str(c): float(b) for c, b in X.memory_usage(index=False, deep=False).items()}
+    return FrameStats(len(X), nbytes, deep=not any(map(_boxed, X.dtypes)))
+
+
+def frame_stats(
+    X: Any,
+    sample_rows: Optional[int] = None,
+    confidence: float = 0.95,
+    random_state: Optional[int] = 0,
+) -> FrameStats:
+    """Memory and NaN counts of ``X``, from ``sample_rows`` random rows when given."""
+    X = as_frame(X)
+    if isinstance(X, ArrowFrame):
+        return _arrow_stats(X)
+    if isinstance(X, np.ndarray):
+        X = pd.DataFrame(X.reshape(len(X), -1), copy=False)
+    n = len(X)
+    if sample_rows is None or sample_rows >= n:
+        return FrameStats(
+            n_rows=n,
+            nbytes={str(c): float(b) for c, b in X.memory_usage(index=False, deep=True).items()},
+            nan_counts={str(c): float(k) for c, k in X.isna().sum().items()},
+            confidence=confidence,
+        )
+
+    rng = np.random.default_rng(random_state)
+    rows = np.sort(rng.choice(n, sample_rows, replace=False))
+    sample = X.iloc[rows]
+    shallow = X.memory_usage(index=False, deep=False)
+    nbytes = {str(c): float(b) for c, b in shallow.items()}
+    per_row = np.zeros(sample_rows)
+    for col in X.columns[[_boxed(d) for d in X.dtypes]]:
+        sizes = np.fromiter(map(sys.getsizeof, sample[col].to_numpy()), dtype=float, count=sample_rows)
+        per_row += sizes
+        nbytes[str(col)] += float(sizes.mean() * n)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    total = sum(nbytes.values())
+    payload_error = z * n * per_row.std(ddof=1) / math.sqrt(sample_rows) if sample_rows > 1 else 0.0
+    return FrameStats(
+        n_rows=n,
+        nbytes=nbytes,
+        nan_counts={str(c): float(p * n) for c, p in sample.isna().mean().items()},
+        sample_rows=sample_rows,
+        nan_error=math.sqrt(math.log(2 / (1 - confidence)) / (2 * sample_rows)),
+        nbytes_error=payload_error / total if total else 0.0,
+        confidence=confidence,
+    )
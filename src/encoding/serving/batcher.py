@@ -0,0 +1,274 @@
+"""Asyncio micro-batching in front of ``EncodingManager.transform``.
+
+An API server receiving many single-record requests would otherwise call
+``transform`` once per record and pay pandas' per-call overhead every time.
+``MicroBatcher`` queues concurrent ``encode`` calls and a single worker task
+closes a batch when it holds ``max_batch_size`` rows or when its oldest request
+has waited ``max_wait`` seconds. It encodes the batch with one vectorized
+``transform`` (inline or in an ``executor``) and resolves each caller's future
+with its slice of the output. Batches run one at a time, so the manager is never
+called concurrently. Requests that arrive while a batch is encoding simply form
+the next, larger batch.
+
+``ServingMetrics`` keeps batch sizes, per-request queueing latency and transform
+time over a sliding window. Every batch is also emitted as a ``ProfileRecord``
+(``op="serve.batch"``) to the manager's ``MemoryManager`` sinks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..profiling import ProfileRecord
+
+__all__ = ["MicroBatcher", "ServingMetrics"]
+
+Request = Union[Mapping[str, Any], pd.DataFrame]
+
+
+class ServingMetrics:
+    """Thread-safe counters and sliding windows of batch sizes and latencies (seconds)."""
+
+    def __init__(self, window: int = 10_000) -> None:
+        self.batches = 0
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+        self.batch_sizes: deque = deque(maxlen=window)
+        self.queue_latency: deque = deque(maxlen=window)
+        self.transform_time: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, n_requests: int, n_rows: int, waits: List[float], seconds: float, failed: bool) -> None:
+        with self._lock:
+            self.batches += 1
+            self.requests += n_requests
+            self.rows += n_rows
+            self.errors += int(failed)
+            self.batch_sizes.append(n_requests)
+            self.queue_latency.extend(waits)
+            self.transform_time.append(seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Totals plus mean/max batch size and p50/p95/max queueing latency of the window."""
+        with self._lock:
+            sizes = np.asarray(self.batch_sizes, dtype=float)
+            waits = np.asarray(self.queue_latency, dtype=float)
+            times = np.asarray(self.transform_time, dtype=float)
+            out = {"batches": self.batches, "requests": self.requests, "rows": self.rows, "errors": self.errors}
+        if len(sizes):
+            out.update(batch_size_mean=float(sizes.mean()), batch_size_max=float(sizes.max()))
+            p50, p95 = np.quantile(waits, [0.5, 0.95])
+            out.update(queue_latency_p50=float(p50), queue_latency_p95=float(p95), queue_latency_max=float(waits.max()))
+            out.update(transform_time_mean=float(times.mean()))
+        return out
+
+
+@dataclass
+class _Pending:
+    payload: Request
+    future: asyncio.Future
+    enqueued: float
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.payload) if isinstance(self.payload, pd.DataFrame) else 1
+
+
+def _batch_frame(items: List[_Pending]) -> pd.DataFrame:
+    """One frame with the rows of every request, in order."""
+    if all(not isinstance(p.payload, pd.DataFrame) for p in items):
+        return pd.DataFrame.from_records([dict(p.payload) for p in items])
+    frames = [
+        p.payload.reset_index(drop=True) if isinstance(p.payload, pd.DataFrame) else pd.DataFrame([dict(p.payload)])
+        for p in items
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _results(out: Any, items: List[_Pending]) -> List[Any]:
+    """Slice the batch output back per request: a frame/array block, or one row for a mapping."""
+    results = []
+    records = None
+    start = 0
+    for p in items:
+        stop = start + p.n_rows
+        if isinstance(p.payload, pd.DataFrame):
+            part = out.iloc[start:stop] if isinstance(out, pd.DataFrame) else out[start:stop]
+            if isinstance(part, pd.DataFrame):
+                part = part.set_axis(p.payload.index, axis=0)
+            results.append(part)
+        elif isinstance(out, pd.DataFrame):
+            if records is None:
+                records = out.to_dict("records")  # one conversion for the whole batch
+            results.append(records[start])
+        elif isinstance(out, np.ndarray):
+            results.append(out[start])
+        else:
+            results.append(out[start:stop])
+        start = stop
+    return results
+
+
+class MicroBatcher:
+    """Collect concurrent ``encode`` calls into vectorized ``manager.transform`` batches.
+
+    Parameters
+    ----------
+    manager : EncodingManager
+        Fitted manager (or any object with ``transform``).
+    max_batch_size : int, default=256
+        Rows after which a batch is closed immediately.
+    max_wait : float, default=0.002
+        Seconds the oldest queued request may wait for more to arrive.
+    executor : concurrent.futures.Executor, optional
+        Run ``transform`` there instead of on the event loop thread.
+    metrics_window : int, default=10000
+        Batches/requests kept for the latency and size statistics.
+
+    Use as ``async with MicroBatcher(manager) as batcher: await batcher.encode(record)``.
+    ``encode`` takes a mapping (one record, resolved to a ``dict`` row or a
+    1-D array for ``output_mode="ndarray"``) or a DataFrame (resolved to the
+    matching block of the output). If ``transform`` fails, every request of
+    that batch gets the exception.
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        max_batch_size: int = 256,
+        max_wait: float = 0.002,
+        executor: Optional[Executor] = None,
+        metrics_window: int = 10_000,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0")
+        self.manager = manager
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self.metrics = ServingMetrics(metrics_window)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self) -> "MicroBatcher":
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def close(self) -> None:
+        """Encode what is still queued, then stop the worker."""
+        if self._worker is None:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+        self._queue = None
+
+    async def __aenter__(self) -> "MicroBatcher":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def encode(self, record: Request) -> Any:
+        """Queue ``record`` and wait for its encoded output."""
+        if self._worker is None:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(record, future, time.perf_counter()))
+        return await future
+
+    # ------------------------------------------------------------------
+    async def _collect(self, first: _Pending) -> tuple:
+        """Requests of one batch, and whether the close sentinel was seen."""
+        items, rows = [first], first.n_rows
+        deadline = first.enqueued + self.max_wait
+        while rows < self.max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is None:
+                return items, True
+            items.append(item)
+            rows += item.n_rows
+        return items, False
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            first = await self._queue.get()
+            if first is None:
+                break
+            items, closing = await self._collect(first)
+            await self._encode_batch(items)
+        # requests queued behind the sentinel are still answered
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                await self._encode_batch([item])
+
+    async def _encode_batch(self, items: List[_Pending]) -> None:
+        items = [p for p in items if not p.future.cancelled()]
+        if not items:
+            return
+        started = time.perf_counter()
+        waits = [started - p.enqueued for p in items]
+        n_rows = sum(p.n_rows for p in items)
+        failed = False
+        try:
+            batch = _batch_frame(items)
+            if self.executor is None:
+                out = self.manager.transform(batch)
+            else:
+                out = await asyncio.get_running_loop().run_in_executor(self.executor, self.manager.transform, batch)
+            results = _results(out, items)
+        except Exception as exc:  # every caller of the batch sees the failure
+            failed = True
+            for p in items:
+                if not p.future.done():
+                    p.future.set_exception(exc)
+        else:
+            for p, result in zip(items, results):
+                if not p.future.done():
+                    p.future.set_result(result)
+        seconds = time.perf_counter() - started
+        self.metrics.record(len(items), n_rows, waits, seconds, failed)
+        self._emit(len(items), n_rows, waits, seconds, failed)
+
+    def _emit(self, n_requests: int, n_rows: int, waits: List[float], seconds: float, failed: bool) -> None:
+        memory_manager = getattr(self.manager, "memory_manager", None)
+        sinks = getattr(memory_manager, "sinks", None)
+        if not sinks:
+            return
+        record = ProfileRecord(
+            op="serve.batch",
+            duration=seconds,
+            details={
+                "requests": n_requests,
+                "rows": n_rows,
+                "queue_latency_max": max(waits),
+                "failed": failed,
+            },
+        )
+        for sink in sinks:
+            sink.emit(record)
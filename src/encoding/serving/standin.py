@@ -0,0 +1,157 @@
+"""Local HTTP and stdio stand-ins for a scoring service built on ``MicroBatcher``.
+
+They are meant for tests and load experiments, not production traffic, and use
+only ``asyncio`` streams:
+
+* ``serve_http`` – minimal HTTP/1.1 with keep-alive. ``POST /encode`` takes a
+  JSON object (one record) or a list of objects, and ``GET /metrics`` returns
+  ``ServingMetrics.snapshot()``. Each connection is handled by its own task, so
+  concurrent clients share batches.
+* ``serve_stdio`` – JSON lines: one record (or list of records) per input line,
+  one result per output line, in input order. Lines are encoded concurrently,
+  so a burst of input is batched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .batcher import MicroBatcher
+
+__all__ = ["serve_http", "serve_stdio"]
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict("records")
+    if hasattr(obj, "toarray"):  # sparse block
+        return obj.toarray().tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_jsonable).encode("utf-8")
+
+
+async def _encode_json(batcher: MicroBatcher, payload: Any) -> Any:
+    if isinstance(payload, list):
+        return await batcher.encode(pd.DataFrame.from_records(payload))
+    if isinstance(payload, dict):
+        return await batcher.encode(payload)
+    raise ValueError("expected a JSON object or a list of objects")
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, result: Any, keep_alive: bool) -> None:
+    data = _dumps(result)
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+    )
+    await writer.drain()
+
+
+async def _handle_http(batcher: MicroBatcher, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                length = int(headers.get("content-length", 0))
+                if length < 0:
+                    raise ValueError(f"negative Content-Length {length}")
+            except ValueError as exc:
+                # the request boundaries are lost: answer and close the connection
+                await _respond(writer, 400, {"error": f"malformed request: {exc}"}, keep_alive=False)
+                break
+            body = await reader.readexactly(length)
+
+            status, result = 200, None
+            try:
+                if method == "POST" and target == "/encode":
+                    result = await _encode_json(batcher, json.loads(body))
+                elif method == "GET" and target == "/metrics":
+                    result = batcher.metrics.snapshot()
+                else:
+                    status, result = 404, {"error": f"{method} {target}"}
+            except (ValueError, KeyError) as exc:
+                status, result = 400, {"error": str(exc)}
+            except Exception as exc:
+                status, result = 500, {"error": str(exc)}
+            keep_alive = headers.get("connection", "").lower() != "close"
+            await _respond(writer, status, result, keep_alive)
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_http(batcher: MicroBatcher, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+    """Start the HTTP stand-in; ``port=0`` picks a free port (see ``server.sockets[0].getsockname()``)."""
+    await batcher.start()
+    return await asyncio.start_server(lambda r, w: _handle_http(batcher, r, w), host, port)
+
+
+async def _stdio_streams():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+
+async def serve_stdio(
+    batcher: MicroBatcher,
+    reader: Optional[asyncio.StreamReader] = None,
+    writer: Optional[Any] = None,
+) -> None:
+    """Answer JSON lines from ``reader`` (default: stdin) on ``writer`` (default: stdout) until EOF.
+
+    ``writer`` needs ``write(bytes)`` and ``async drain()``. A line that fails
+    is answered with ``{"error": ...}``.
+    """
+    if reader is None or writer is None:
+        reader, writer = await _stdio_streams()
+    pending: asyncio.Queue = asyncio.Queue()
+
+    async def answer(line: bytes) -> Any:
+        try:
+            return await _encode_json(batcher, json.loads(line))
+        except Exception as exc:
+            return {"error": str(exc)}
+
+    async def write_in_order() -> None:
+        while (task := await pending.get()) is not None:
+            writer.write(_dumps(await task) + b"\n")
+            await writer.drain()
+
+    await batcher.start()
+    output = asyncio.get_running_loop().create_task(write_in_order())
+    async for line in reader:
+        if line.strip():
+            await pending.put(asyncio.ensure_future(answer(line)))
+    await pending.put(None)
+    await output
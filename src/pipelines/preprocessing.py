@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-import pandas as pd
-from sklearn.compose import ColumnTransformer
+from typing import Sequence
 
 from encoding import EncodingManager
 
 
-def build_preprocessor(categorical: list[str]):
-    manager = EncodingManager("onehot", columns=categorical)
-    encoder = manager.encoder  # underlying encoder
-    return ColumnTransformer(
-        [
-            ("cat", encoder.encoder, categorical),
-        ],
-        remainder="passthrough",
-        sparse_output=True,
-    )
+def build_preprocessor(
+    categorical: list[str],
+    woe: list[str] | None = None,
+    passthrough: Sequence[str] | str = "remainder",
+    output_dtype: str | None = None,
+) -> EncodingManager:
+    """One-hot (and optionally WoE) encoding plus passthrough columns in one matrix.
+
+    The ``EncodingManager`` is used as the transformer itself, so missing-value
+    handling and profiling run inside the pipeline. ``passthrough="remainder"``
+    keeps every column not encoded, as ``ColumnTransformer(remainder="passthrough")``.
+    """
+    encoding = [("onehot", {"columns": categorical})]
+    if woe:
+        encoding.append(("woe", {"categorical_cols": woe}))
+    return EncodingManager(encoding, passthrough=passthrough, output_dtype=output_dtype)
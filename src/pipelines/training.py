@@ -6,8 +6,8 @@ from sklearn.pipeline import Pipeline
 from .preprocessing import build_preprocessor
 
 
-def build_pipeline(categorical: list[str]):
-    pre = build_preprocessor(categorical)
+def build_pipeline(categorical: list[str], woe: list[str] | None = None, output_dtype: str | None = None):
+    pre = build_preprocessor(categorical, woe=woe, output_dtype=output_dtype)
     clf = LogisticRegression(max_iter=100)
     return Pipeline([
         ("pre", pre),
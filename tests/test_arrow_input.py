@@ -0,0 +1,81 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from encoding import EncodingManager
+from encoding.encoders import WOEGuard, TargetEncoder
+
+
+def _data(n=300, seed=4):
+    rng = np.random.default_rng(seed)
+    uf = rng.choice(["SP", "RJ", "MG"], size=n).astype(object)
+    uf[rng.random(n) < 0.1] = None
+    df = pd.DataFrame({"uf": uf, "renda": rng.normal(size=n)})
+    y = pd.Series(rng.integers(0, 2, size=n), name="target")
+    table = pa.table({"uf": pa.array(uf).dictionary_encode(), "renda": df["renda"].to_numpy()})
+    return df, y, table
+
+
+def test_woe_arrow_matches_pandas():
+    df, y, table = _data()
+    ref = WOEGuard(["uf"]).fit(df, y)
+    enc = WOEGuard(["uf"]).fit(table, pa.array(y.to_numpy()))
+    assert enc.iv_log_ == pytest.approx(ref.iv_log_)
+    out = enc.transform(table)
+    assert isinstance(out, pa.Table)
+    assert out.column_names == ["uf", "renda", "uf_woe"]
+    np.testing.assert_allclose(out.column("uf_woe").to_numpy(), ref.transform(df)["uf_woe"].to_numpy())
+
+
+def test_nan_and_dirty_dictionaries_match_pandas():
+    rng = np.random.default_rng(5)
+    n = 400
+    y = pd.Series(rng.integers(0, 2, size=n))
+    # float codes with NaN (a dictionary entry after encoding) and nulls
+    num = rng.choice([1.0, 2.0, np.nan], size=n)
+    table = pa.table({"cod": pa.array(num, mask=np.arange(n) < 5)})
+    df = pd.DataFrame({"cod": np.where(np.arange(n) < 5, np.nan, num)})
+    ref = WOEGuard(["cod"]).fit(df, y)
+    enc = WOEGuard(["cod"]).fit(table, y)
+    assert set(enc.woe_log_["cod"]) == set(ref.woe_log_["cod"]) == {1.0, 2.0, "__nan__"}
+    np.testing.assert_allclose(enc.transform(table).column("cod_woe").to_numpy(), ref.transform(df)["cod_woe"])
+
+    # duplicate and null entries inside the dictionary itself
+    idx = rng.integers(0, 4, size=n)
+    dirty = pa.DictionaryArray.from_arrays(pa.array(idx, type=pa.int8()), pa.array(["SP", "RJ", "SP", None]))
+    plain = pd.DataFrame({"uf": np.array(["SP", "RJ", "SP", None], dtype=object)[idx]})
+    ref = WOEGuard(["uf"]).fit(plain, y)
+    enc = WOEGuard(["uf"]).fit(pa.table({"uf": dirty}), y)
+    assert enc.woe_log_["uf"] == pytest.approx(ref.woe_log_["uf"])
+    np.testing.assert_allclose(
+        enc.transform(pa.table({"uf": dirty})).column("uf_woe").to_numpy(), ref.transform(plain)["uf_woe"]
+    )
+
+
+def test_target_encoder_arrow_encoded_only():
+    df, y, table = _data()
+    ref = TargetEncoder(["uf"], output_mode="ndarray").fit(df, y).transform(df)
+    out = TargetEncoder(["uf"], output_mode="encoded_only").fit(table, y).transform(table)
+    assert isinstance(out, pa.Table)
+    np.testing.assert_allclose(out.column("uf").to_numpy(), ref[:, 0])
+
+
+def test_manager_arrow_chunked(caplog):
+    df, y, table = _data()
+    manager = EncodingManager("woe", categorical_cols=["uf"], memory_budget=1)
+    out = manager.fit(table, y).transform(table)
+    assert manager.last_plan_.strategy == "chunked"
+    assert isinstance(out, pa.Table) and out.num_rows == len(df)
+
+
+def test_polars_roundtrip():
+    pl = pytest.importorskip("polars")
+    df, y, _ = _data()
+    frame = pl.from_pandas(df).with_columns(pl.col("uf").cast(pl.Categorical))
+    out = WOEGuard(["uf"]).fit(frame, y).transform(frame)
+    assert isinstance(out, pl.DataFrame) and "uf_woe" in out.columns
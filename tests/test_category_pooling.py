@@ -0,0 +1,106 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import TargetEncoder, WOEGuard, WOEScorer
+from encoding.encoders._aggregation import hash_buckets
+
+
+def _data():
+    # "a"/"b" are frequent, "c".."f" appear once each
+    df = pd.DataFrame({"id": ["a", "a", "a", "b", "b", "b", "c", "d", "e", "f", None, "a"]})
+    y = pd.Series([1, 0, 1, 0, 0, 1, 1, 0, 1, 1, 0, 0])
+    return df, y
+
+
+def test_woe_min_count_pools_into_other():
+    df, y = _data()
+    enc = WOEGuard(["id"], min_count=2).fit(df, y)
+    assert set(enc.woe_log_["id"]) == {"a", "b", "__other__", "__nan__"}
+    # reference: the same WoE as encoding the pooled column directly
+    pooled = df["id"].where(~df["id"].isin(["c", "d", "e", "f"]), "__other__")
+    ref = WOEGuard(["id"]).fit(pooled.to_frame(), y)
+    assert enc.woe_log_["id"] == pytest.approx(ref.woe_log_["id"])
+    # rare-at-fit and unseen values both get the "__other__" WoE
+    out = enc.transform(pd.DataFrame({"id": ["c", "zzz", "a"]}))["id_woe"]
+    other = enc.woe_log_["id"]["__other__"]
+    assert out.tolist() == pytest.approx([other, other, enc.woe_log_["id"]["a"]])
+    scorer = enc.to_scorer()
+    assert scorer.score({"id": "zzz"})["id_woe"] == pytest.approx(other)
+
+
+def test_max_categories_keeps_most_frequent():
+    df, y = _data()
+    enc = WOEGuard(["id"], max_categories=1).fit(df, y)
+    assert set(enc.woe_log_["id"]) == {"a", "__other__", "__nan__"}
+    te = TargetEncoder(["id"], max_categories=1).fit(df, y)
+    assert list(te.stats_["id"].categories) == ["a", "__other__"]
+    assert te.stats_["id"].count.tolist() == [4, 7]
+    out = te.transform(pd.DataFrame({"id": ["b", "new", "a"]}))["id"]
+    assert out.tolist() == pytest.approx([4 / 7, 4 / 7, 0.5])
+
+
+def test_no_pooling_keeps_default_for_unseen():
+    df, y = _data()
+    enc = WOEGuard(["id"], default_woe=-9.0).fit(df, y)
+    assert "__other__" not in enc.woe_log_["id"]
+    assert enc.transform(pd.DataFrame({"id": ["zzz"]}))["id_woe"].iloc[0] == -9.0
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+@pytest.mark.parametrize("include_nan", [True, False])
+def test_nan_and_unseen_match_scorer(with_nan, include_nan):
+    # unseen → "__other__" WoE; NaN → "__nan__" WoE if fitted, else default_woe
+    df = pd.DataFrame({"c": list("aaaabbbbcd") + ([None] if with_nan else [])})
+    y = pd.Series([1, 0, 1, 0, 0, 1, 0, 0, 1, 0, 1][: len(df)])
+    enc = WOEGuard(["c"], min_count=2, default_woe=-9, include_nan=include_nan).fit(df, y)
+    new = pd.DataFrame({"c": ["a", "zz", None]})
+    got = enc.transform(new)["c_woe"].to_numpy()
+    want = WOEScorer.from_encoder(enc).score_matrix(new.to_dict("records")).ravel()
+    np.testing.assert_allclose(got, want)
+    assert got[1] == enc.woe_log_["c"]["__other__"]
+    if not (with_nan and include_nan):
+        assert got[2] == -9.0
+
+
+def test_hash_buckets_are_stable_and_bounded():
+    s = pd.Series([f"user_{i}" for i in range(1000)] + [None])
+    buckets = hash_buckets(s, 16)
+    assert buckets[-1] == -1
+    assert buckets[:-1].min() >= 0 and buckets[:-1].max() < 16
+    # same value → same bucket, independent of the batch and of categorical dtype
+    np.testing.assert_array_equal(hash_buckets(s.iloc[500:].astype("category"), 16), buckets[500:])
+
+
+def test_hashing_mode_bounds_map_size(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"id": [f"user_{i}" for i in rng.integers(0, 5000, 20000)]})
+    y = pd.Series(rng.integers(0, 2, len(df)))
+    enc = WOEGuard(["id"], n_buckets=32).fit(df, y)
+    assert len(enc.woe_log_["id"]) <= 32
+    out = enc.transform(df)["id_woe"].to_numpy()
+    expected = np.array([enc.woe_log_["id"][b] for b in hash_buckets(df["id"], 32)])
+    np.testing.assert_allclose(out, expected)
+
+    records = df.head(20).to_dict(orient="records")
+    np.testing.assert_allclose(enc.to_scorer().score_matrix(records)[:, 0], out[:20])
+    enc.export_log(tmp_path / "log.json")
+    loaded = WOEGuard.load_from_json(tmp_path / "log.json")
+    np.testing.assert_allclose(loaded.transform(df)["id_woe"].to_numpy(), out)
+    enc.save(tmp_path / "enc.bin", format="columnar")
+    np.testing.assert_allclose(WOEGuard.load(tmp_path / "enc.bin").transform(df)["id_woe"].to_numpy(), out)
+
+    te = TargetEncoder(["id"], n_buckets=32).fit(df, y)
+    assert len(te.stats_["id"].categories) <= 32
+    codes = hash_buckets(df["id"], 32)
+    means = pd.Series(y.to_numpy()).groupby(codes).mean()
+    np.testing.assert_allclose(te.transform(df)["id"].to_numpy(), means.loc[codes].to_numpy())
+
+
+def test_invalid_pooling_params():
+    with pytest.raises(ValueError):
+        WOEGuard(["id"], min_count=0)
+    with pytest.raises(ValueError):
+        TargetEncoder(["id"], n_buckets=0)
@@ -0,0 +1,128 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import WOEGuard
+
+
+def _data(n=4000, seed=0, p=(0.5, 0.3, 0.2)):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG"], n, p=p),
+        "renda": rng.normal(size=n),
+    })
+    df.loc[df.index[::10], "uf"] = None
+    y = pd.Series(rng.integers(0, 2, n))
+    return df, y
+
+
+def test_hits_match_value_counts():
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["renda"], monitor=True).fit(df, y)
+    ref = WOEGuard(["uf"], numeric_cols=["renda"]).fit(df, y)
+    new = pd.DataFrame({"uf": ["SP", "SP", "AM", None, "__nan__"], "renda": [0.1, np.nan, 5.0, -3.0, 0.0]})
+    pd.testing.assert_frame_equal(enc.transform(new), ref.transform(new))
+    report = enc.drift_report()
+    uf = report[report.feature == "uf"].set_index("category")
+    assert uf.loc["SP", "actual"] == 2
+    assert uf.loc["__unseen__", "actual"] == 1 and uf.loc["__unseen__", "expected"] == 0
+    # NaN rows and the literal "__nan__" category share one slot
+    assert uf.loc["__nan__", "actual"] == 2
+    assert uf.loc["__nan__", "expected"] == df["uf"].isna().sum()
+    assert uf["expected"].sum() == len(df)
+    renda = report[report.feature == "renda"].set_index("category")
+    assert renda["actual"].sum() == len(new)
+    assert renda.loc["__nan__", "actual"] == 1
+
+
+def test_psi_detects_shift_and_reset():
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["renda"], monitor=True).fit(df, y)
+    enc.transform(_data(seed=1)[0])
+    stable = enc.psi()
+    assert (stable < 0.01).all()
+    shifted, _ = _data(seed=2, p=(0.1, 0.2, 0.7))
+    shifted["renda"] += 1
+    enc.reset_monitor().transform(shifted)
+    psi = enc.psi()
+    assert psi["uf"] > 0.25 and psi["renda"] > 0.25
+    report = enc.drift_report()
+    uf = report[report.feature == "uf"]
+    expected = ((uf.actual_pct - uf.expected_pct) * uf.woe).to_numpy()
+    np.testing.assert_allclose(uf.woe_shift, expected)
+    assert psi["uf"] == pytest.approx(uf.psi.sum())
+
+
+def test_thread_safe_accumulation():
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["renda"], monitor=True, n_jobs=2).fit(df, y)
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(enc.transform, [df] * 16))
+    report = enc.drift_report()
+    uf = report[report.feature == "uf"].set_index("category")
+    assert (uf["actual"] == 16 * uf["expected"]).all()
+    assert (report.groupby("feature")["actual"].sum() == 16 * len(df)).all()
+
+
+def test_pooled_and_hashed_features():
+    df, y = _data()
+    df["cep"] = np.arange(len(df)) % 50
+    pooled = WOEGuard(["cep"], min_count=100, monitor=True).fit(df, y)
+    pooled.transform(pd.DataFrame({"cep": [0, 999]}))
+    cep = pooled.drift_report().set_index("category")
+    assert "__unseen__" not in cep.index
+    assert cep.loc["__other__", "actual"] == 2
+
+    hashed = WOEGuard(["uf"], n_buckets=8, monitor=True).fit(df, y)
+    hashed.transform(df)
+    assert hashed.psi()["uf"] == pytest.approx(0.0)
+    clone = pickle.loads(pickle.dumps(hashed))
+    clone.transform(df)
+    assert clone.drift_report()["actual"].sum() == 2 * len(df)
+
+
+def test_monitor_off_and_refit():
+    df, y = _data()
+    with pytest.raises(RuntimeError):
+        WOEGuard(["uf"]).fit(df, y).drift_report()
+    enc = WOEGuard(["uf"], monitor=True).fit(df, y)
+    enc.transform(df)
+    enc.refinalize(alpha=1.0)
+    assert enc.drift_report()["actual"].sum() == 0
+
+
+@pytest.mark.parametrize("n_unseen", [1, 7])
+def test_large_batches_are_sampled(n_unseen):
+    df, y = _data(n=40_000)
+    exact = WOEGuard(["uf"], numeric_cols=["renda"], monitor=True, monitor_rows=None).fit(df, y)
+    sampled = WOEGuard(["uf"], numeric_cols=["renda"], monitor=True, monitor_rows=1000).fit(df, y)
+    new = df.copy()
+    rows = new.index[1::997]  # a handful of rows with unseen values
+    new.loc[rows, "uf"] = [f"AM{i % n_unseen}" for i in range(len(rows))]
+    new.loc[new.index[1::1009], "renda"] = np.nan
+    pd.testing.assert_frame_equal(sampled.transform(new), exact.transform(new))
+    got = sampled.drift_report().set_index(["feature", "category"])
+    want = exact.drift_report().set_index(["feature", "category"])
+    # unseen and NaN rows are counted exactly, the seen categories estimated
+    for key in [("uf", "__unseen__"), ("uf", "__nan__"), ("renda", "__nan__")]:
+        assert got.loc[key, "actual"] == want.loc[key, "actual"] > 0
+    assert got.groupby(level=0)["actual"].sum().sub(len(df)).abs().le(5).all()
+    np.testing.assert_allclose(got["actual_pct"], want["actual_pct"], atol=0.05)
+    assert (sampled.psi() < 0.01).all()
+    # batches up to monitor_rows are counted exactly
+    sampled.reset_monitor().transform(df.iloc[:1000])
+    assert sampled.drift_report().groupby("feature")["actual"].sum().eq(1000).all()
+    with pytest.raises(ValueError):
+        WOEGuard(["uf"], monitor_rows=0)
+
+
+def test_sample_is_fresh_per_call():
+    from encoding.encoders._lookup import sample_rows
+
+    assert sample_rows(100, None) is None and sample_rows(100, 100) is None
+    assert not np.array_equal(sample_rows(10_000, 500), sample_rows(10_000, 500))
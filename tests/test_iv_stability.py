@@ -0,0 +1,65 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import WOEGuard
+
+
+def _data(n=4000, seed=0):
+    rng = np.random.default_rng(seed)
+    grade = rng.choice(["A", "B", "C"], n, p=[0.5, 0.3, 0.2])
+    grade[:3] = "Z"  # tiny category with a noisy WoE
+    rate = pd.Series(grade).map({"A": 0.1, "B": 0.25, "C": 0.5, "Z": 0.3}).to_numpy()
+    y = pd.Series((rng.random(n) < rate).astype(int))
+    df = pd.DataFrame({"grade": grade, "noise": rng.choice(["x", "y"], n), "score": rng.normal(size=n) - y})
+    return df, y
+
+
+@pytest.mark.parametrize("method", ["poisson", "multinomial"])
+def test_intervals_and_sign_stability(method):
+    df, y = _data()
+    enc = WOEGuard(["grade", "noise"], numeric_cols=["score"]).fit(df, y)
+    out = enc.iv_stability(n_boot=300, method=method, random_state=0)
+    assert set(out.columns) >= {"feature", "category", "woe_low", "woe_high", "sign_stability", "iv_low", "iv_high"}
+    assert len(out) == sum(len(m) for m in enc.woe_log_.values())
+    per_feature = out.groupby("feature")[["iv_low", "iv_high"]].first()
+    for col, iv in enc.iv_log_.items():
+        assert per_feature.loc[col, "iv_low"] <= iv <= per_feature.loc[col, "iv_high"]
+    grade = out[out.feature == "grade"].set_index("category")
+    assert grade.loc["A", "sign_stability"] == 1.0
+    assert grade.loc["Z", "sign_stability"] < 1.0
+    assert (grade["woe_low"] <= grade["woe_high"]).all()
+    # the uninformative feature has an interval close to zero
+    assert per_feature.loc["noise", "iv_high"] < per_feature.loc["grade", "iv_low"]
+
+
+def test_multinomial_matches_row_bootstrap():
+    df, y = _data(n=1500, seed=1)
+    enc = WOEGuard(["grade"]).fit(df, y)
+    ivs = enc.iv_stability(n_boot=400, method="multinomial", random_state=1)
+    rng = np.random.default_rng(2)
+    refits = []
+    for _ in range(60):
+        idx = rng.integers(0, len(df), len(df))
+        refits.append(WOEGuard(["grade"]).fit(df.iloc[idx], y.iloc[idx]).iv_log_["grade"])
+    lo, hi = np.quantile(refits, [0.025, 0.975])
+    row = ivs.iloc[0]
+    assert row.iv_low == pytest.approx(lo, rel=0.35)
+    assert row.iv_high == pytest.approx(hi, rel=0.35)
+
+
+def test_reproducible_and_in_summary():
+    df, y = _data()
+    enc = WOEGuard(["grade"]).fit(df, y)
+    a = enc.iv_stability(random_state=3)
+    b = enc.iv_stability(random_state=3)
+    pd.testing.assert_frame_equal(a, b)
+    summary = enc.summary()
+    assert {"woe_low", "woe_high", "sign_stability"} <= set(summary.columns)
+    assert summary["sign_stability"].notna().all()
+    enc.refinalize(alpha=1.0)
+    assert "sign_stability" not in enc.summary().columns
+    with pytest.raises(ValueError):
+        enc.iv_stability(method="jackknife")
@@ -0,0 +1,57 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import LeaveOneOutEncoder
+
+
+def _frame(n=200, seed=3):
+    rng = np.random.default_rng(seed)
+    uf = rng.choice(["SP", "RJ", "MG", "AC"], size=n).astype(object)
+    uf[rng.random(n) < 0.1] = np.nan
+    uf[0] = "RR"  # singleton category
+    df = pd.DataFrame({"uf": uf})
+    y = pd.Series(rng.integers(0, 2, size=n), name="target")
+    return df, y
+
+
+def test_loo_matches_naive():
+    df, y = _frame()
+    enc = LeaveOneOutEncoder(["uf"])
+    out = enc.fit_transform(df, y)["uf"].to_numpy()
+    gm = y.mean()
+    expected = []
+    for i, v in enumerate(df["uf"]):
+        others = (df["uf"] == v) & (df.index != i)
+        expected.append(y[others].mean() if pd.notna(v) and others.any() else gm)
+    np.testing.assert_allclose(out, expected)
+
+
+def test_transform_without_target_uses_category_means():
+    df, y = _frame()
+    enc = LeaveOneOutEncoder(["uf"]).fit(df, y)
+    new = pd.DataFrame({"uf": ["SP", "XX", np.nan]})
+    out = enc.transform(new)["uf"].to_numpy()
+    assert out[0] == pytest.approx(y[df["uf"] == "SP"].mean())
+    assert out[1] == pytest.approx(y.mean())
+    assert out[2] == pytest.approx(y.mean())
+
+
+def test_kfold_matches_refit_per_fold():
+    df, y = _frame()
+    enc = LeaveOneOutEncoder(["uf"], n_folds=4, random_state=0)
+    out = enc.fit_transform(df, y)["uf"].to_numpy()
+    folds = enc.fold_ids(len(df))
+    expected = np.empty(len(df))
+    for k in range(4):
+        train = folds != k
+        means = y[train].groupby(df["uf"][train]).mean()
+        expected[~train] = df["uf"][~train].map(means).astype(float).fillna(y.mean()).to_numpy()
+    np.testing.assert_allclose(out, expected)
+
+
+def test_invalid_n_folds():
+    with pytest.raises(ValueError):
+        LeaveOneOutEncoder(["uf"], n_folds=1)
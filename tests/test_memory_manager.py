@@ -0,0 +1,68 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from encoding import EncodingManager, MemoryManager
+from encoding.profiling import InMemorySink, JsonLinesSink
+
+
+def _data():
+    df = pd.DataFrame({"a": ["x", "y", "x", "z"] * 50, "b": ["p", "q"] * 100})
+    y = pd.Series([0, 1, 1, 0] * 50, name="y")
+    return df, y
+
+
+def test_profile_records_stages_and_columns(tmp_path):
+    sink = InMemorySink()
+    mm = MemoryManager(sinks=[sink, JsonLinesSink(tmp_path / "m.jsonl")], trace_python=True)
+    df, y = _data()
+    manager = EncodingManager("woe", memory_manager=mm, categorical_cols=["a", "b"])
+    manager.fit_transform(df, y)
+
+    ops = [r.op for r in sink.records]
+    assert ops == ["fit.missing", "fit.encode", "fit", "transform.missing", "transform.encode", "transform"]
+    encode = sink.by_op("transform.encode")[0]
+    assert set(encode.columns) == {"a", "b"}
+    fit = sink.by_op("fit")[0]
+    assert fit.python_peak is not None and fit.python_peak >= sink.by_op("fit.encode")[0].python_peak
+    assert fit.rss_peak is not None
+
+    assert manager.comparison_.time_fit == fit.duration
+    assert manager.comparison_.time_transform == sink.by_op("transform")[0].duration
+    lines = (tmp_path / "m.jsonl").read_text().splitlines()
+    assert json.loads(lines[-1])["op"] == "transform"
+
+
+def test_concurrent_profiles_share_one_sampler():
+    sink = InMemorySink()
+    mm = MemoryManager(sinks=[sink], trace_python=True)
+    df, y = _data()
+    manager = EncodingManager("woe", memory_manager=mm, categorical_cols=["a", "b"]).fit(df, y)
+    started = []
+    original = threading.Thread.start
+
+    def start(thread):
+        started.append(thread.name)
+        original(thread)
+
+    threading.Thread.start = start
+    try:
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(manager.transform, [df] * 16))
+    finally:
+        threading.Thread.start = original
+    assert started.count("rss-sampler") <= 1
+    transforms = sink.by_op("transform")
+    assert len(transforms) == 16
+    assert all(r.rss_peak is not None and r.python_peak is not None for r in transforms)
+
+    clone = pickle.loads(pickle.dumps(MemoryManager(trace_python=True)))
+    clone.sinks = [sink]
+    with clone.profile("outer"), clone.profile("inner"):
+        pass
+    assert [r.op for r in sink.records[-2:]] == ["inner", "outer"]
@@ -0,0 +1,50 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager
+
+
+def _data(n=5000):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        "a": rng.choice(["x", "y", "z", None], size=n),
+        "b": rng.choice(["p", "q"], size=n),
+        "num": rng.random(n),
+    })
+    return df, pd.Series(rng.integers(0, 2, size=n), name="y")
+
+
+@pytest.mark.parametrize("output_mode", ["copy", "encoded_only", "ndarray", "inplace"])
+def test_chunked_woe_matches_direct(output_mode):
+    df, y = _data()
+    kwargs = dict(categorical_cols=["a", "b"], drop_original=True, output_mode=output_mode, missing_sentinel="NA")
+    direct = EncodingManager("woe", **kwargs).fit(df, y)
+    expected = direct.transform(df.copy())
+    assert direct.last_plan_.strategy == "direct"
+
+    chunked = EncodingManager("woe", memory_budget=1, **kwargs).fit(df, y)
+    result = chunked.transform(df.copy())
+    plan = chunked.last_plan_
+    assert plan.strategy == "chunked" and plan.chunk_rows < len(df)
+    if output_mode == "ndarray":
+        np.testing.assert_array_equal(result, expected)
+    else:
+        pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("encoding,kwargs", [("target", {"columns": ["a", "b"]}), ("onehot", {"columns": ["a", "b"]})])
+def test_chunked_other_encoders(encoding, kwargs):
+    df, y = _data()
+    df = df.fillna("missing")
+    expected = EncodingManager(encoding, **kwargs).fit(df, y).transform(df)
+    manager = EncodingManager(encoding, memory_budget=1, **kwargs).fit(df, y)
+    result = manager.transform(df)
+    assert manager.last_plan_.strategy == "chunked"
+    if encoding == "onehot":
+        assert manager.last_plan_.sparse
+        assert (result != expected).nnz == 0
+    else:
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,101 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import LeaveOneOutEncoder, TargetEncoder, WOEGuard
+
+
+def _data(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG", "BA", None], n),
+        "canal": rng.choice(["app", "web", "loja"], n, p=[0.6, 0.3, 0.1]),
+        "renda": rng.normal(size=n),
+    })
+    y = pd.Series(rng.integers(0, 2, n), name="target")
+    return df, y
+
+
+def _shards(df, y, k=3):
+    bounds = np.linspace(0, len(df), k + 1).astype(int)
+    return [(df.iloc[a:b], y.iloc[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _assert_same_woe(a, b):
+    for col, mapping in b.woe_log_.items():
+        assert a.woe_log_[col] == pytest.approx(mapping)
+        assert a.iv_log_[col] == pytest.approx(b.iv_log_[col])
+    assert a.global_event_rate_ == pytest.approx(b.global_event_rate_)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"n_buckets": 8}])
+def test_woe_merge_matches_full_fit(kwargs):
+    df, y = _data()
+    full = WOEGuard(["uf", "canal"], **kwargs).fit(df, y)
+    # shards are fitted independently (and shipped as pickles, as between processes)
+    parts = [pickle.loads(pickle.dumps(WOEGuard(["uf", "canal"], **kwargs).fit(X, t))) for X, t in _shards(df, y)]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    _assert_same_woe(merged, full)
+    pd.testing.assert_frame_equal(merged.transform(df), full.transform(df))
+
+
+def test_woe_refinalize_matches_refit():
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["renda"]).fit(df, y)
+    edges = enc.bins_["renda"].edges.copy()
+    enc.refinalize(alpha=2.0)
+    ref = WOEGuard(["uf"], numeric_cols=["renda"], alpha=2.0).fit(df, y)
+    np.testing.assert_array_equal(enc.bins_["renda"].edges, edges)
+    _assert_same_woe(enc, ref)
+    assert enc.transform(df)["uf_woe"].tolist() == pytest.approx(ref.transform(df)["uf_woe"].tolist())
+
+
+def test_numeric_bins_merge_requires_same_edges():
+    df, y = _data()
+    a = WOEGuard([], numeric_cols=["renda"]).fit(df.iloc[:1500], y.iloc[:1500])
+    b = WOEGuard([], numeric_cols=["renda"]).fit(df.iloc[1500:], y.iloc[1500:])
+    same = a.bins_["renda"].merge(a.bins_["renda"])
+    assert same.count.tolist() == (2 * a.bins_["renda"].count).tolist()
+    with pytest.raises(ValueError):
+        a.merge(b)
+
+
+def test_merge_errors():
+    df, y = _data()
+    enc = WOEGuard(["uf"]).fit(df, y)
+    with pytest.raises(ValueError):
+        enc.merge(WOEGuard(["canal"]).fit(df, y))
+    with pytest.raises(ValueError):
+        enc.merge(WOEGuard(["uf"], n_buckets=4).fit(df, y))
+    with pytest.raises(RuntimeError):
+        WOEGuard(["uf"]).refinalize()
+
+
+def test_target_encoder_merge_and_refinalize():
+    df, y = _data()
+    full = TargetEncoder(["uf", "canal"], smoothing=5.0).fit(df, y)
+    parts = [TargetEncoder(["uf", "canal"], smoothing=5.0).fit(X, t) for X, t in _shards(df, y)]
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert merged.global_mean == pytest.approx(full.global_mean)
+    expected = full.transform(df)
+    np.testing.assert_allclose(merged.transform(df)[["uf", "canal"]], expected[["uf", "canal"]])
+
+    merged.refinalize(smoothing=0.0)
+    plain = TargetEncoder(["uf", "canal"]).fit(df, y)
+    np.testing.assert_allclose(merged.transform(df)[["uf", "canal"]], plain.transform(df)[["uf", "canal"]])
+
+
+def test_leave_one_out_merge():
+    df, y = _data()
+    full = LeaveOneOutEncoder(["uf"]).fit(df, y)
+    a, b = [LeaveOneOutEncoder(["uf"]).fit(X, t) for X, t in _shards(df, y, k=2)]
+    merged = a.merge(b)
+    np.testing.assert_allclose(merged.transform(df, y)["uf"], full.transform(df, y)["uf"])
+    with pytest.raises(ValueError):
+        merged.merge(TargetEncoder(["uf"]).fit(df, y))
@@ -34,3 +34,32 @@ def test_registry_roundtrip(tmp_path):
     assert isinstance(loaded_mh, MissingHandler)
     assert np.isnan(loaded_mh.sentinel)
 
+
+
+def test_transform_is_read_only_and_copy_on_write():
+    df = pd.DataFrame({"a": [1.0, np.nan, 2.0], "b": [1, 2, 3], "c": ["x", None, "y"]})
+    mh = MissingHandler(sentinel=-999).fit(df.iloc[[0, 2]])
+    assert mh.mapping == {}
+    counts = {}
+    out = mh.transform(df, counts=counts)
+    assert mh.mapping == {}  # frozen at fit
+    assert counts == {"a": 1, "b": 0, "c": 1}
+    assert out["a"].tolist() == [1.0, -999.0, 2.0] and str(out["c"].iloc[1]) == "-999"
+    assert df["a"].isna().sum() == 1  # input untouched
+    assert np.shares_memory(out["b"].to_numpy(), df["b"].to_numpy())
+    assert out["a"].dtype == df["a"].dtype
+
+
+def test_concurrent_transform():
+    from concurrent.futures import ThreadPoolExecutor
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(2000, 4)), columns=list("abcd"))
+    df[df > 1.5] = np.nan
+    mh = MissingHandler(sentinel=0.0).fit(df)
+    expected = df.fillna(0.0)
+    with ThreadPoolExecutor(8) as pool:
+        outs = list(pool.map(mh.transform, [df] * 32))
+    for out in outs:
+        pd.testing.assert_frame_equal(out, expected)
+    assert mh.mapping == {c: "filled_with_0.0" for c in "abcd"}
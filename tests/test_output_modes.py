@@ -0,0 +1,120 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager, ReportBuilder
+from encoding.encoders import WOEGuard, TargetEncoder, LeaveOneOutEncoder
+
+
+@pytest.fixture
+def data():
+    df = pd.DataFrame({"feat": ["a", "b", "a", "c", None], "num": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    y = pd.Series([0, 1, 0, 1, 1], name="y")
+    return df, y
+
+
+def test_woe_output_modes(data):
+    df, y = data
+    ref = WOEGuard(["feat"]).fit(df, y).transform(df)
+
+    only = WOEGuard(["feat"], output_mode="encoded_only").fit(df, y).transform(df)
+    assert list(only.columns) == ["feat_woe"]
+    pd.testing.assert_series_equal(only["feat_woe"], ref["feat_woe"])
+
+    block = WOEGuard(["feat"], output_mode="ndarray").fit(df, y).transform(df)
+    assert block.shape == (5, 1) and block.flags.f_contiguous
+    np.testing.assert_array_equal(block[:, 0], ref["feat_woe"].to_numpy())
+
+    target = df.copy()
+    out = WOEGuard(["feat"], output_mode="inplace", drop_original=True).fit(df, y).transform(target)
+    assert out is target
+    assert list(target.columns) == ["num", "feat_woe"]
+
+
+@pytest.mark.parametrize("cls", [WOEGuard, TargetEncoder, LeaveOneOutEncoder])
+def test_ndarray_fills_out(cls, data):
+    df, y = data
+    enc = cls(["feat"], output_mode="ndarray").fit(df, y)
+    wide = np.full((5, 3), -1.0, order="F")
+    assert enc.transform(df, out=wide[:, 1:2]).base is wide
+    np.testing.assert_array_equal(wide[:, 1], enc.transform(df)[:, 0])
+    assert (wide[:, [0, 2]] == -1.0).all()
+    with pytest.raises(ValueError, match="shape"):
+        enc.transform(df, out=wide)
+
+
+@pytest.mark.parametrize("cls", [TargetEncoder, LeaveOneOutEncoder])
+def test_target_encoders_encoded_only(cls, data):
+    df, y = data
+    df = df.fillna("z")
+    ref = cls(["feat"]).fit(df, y).transform(df)
+    only = cls(["feat"], output_mode="encoded_only").fit(df, y).transform(df)
+    assert list(only.columns) == ["feat"]
+    np.testing.assert_allclose(only["feat"].to_numpy(), ref["feat"].to_numpy())
+
+
+def test_manager_output_mode_does_not_touch_input(data):
+    df, y = data
+    before = df.copy()
+    manager = EncodingManager("woe", categorical_cols=["feat"], missing_sentinel="missing", output_mode="ndarray")
+    out = manager.fit(df, y).transform(df)
+    assert isinstance(out, np.ndarray) and out.shape == (5, 1)
+    pd.testing.assert_frame_equal(df, before)
+
+
+def test_invalid_output_mode():
+    with pytest.raises(ValueError):
+        WOEGuard(["feat"], output_mode="bogus")
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+@pytest.mark.parametrize("mode", ["copy", "encoded_only", "ndarray"])
+def test_output_dtype(data, dtype, mode):
+    df, y = data
+    ref = WOEGuard(["feat"], output_mode="ndarray").fit(df, y).transform(df)
+    for enc in (
+        WOEGuard(["feat"], output_mode=mode, output_dtype=dtype),
+        TargetEncoder(["feat"], output_mode=mode, output_dtype=dtype),
+        LeaveOneOutEncoder(["feat"], output_mode=mode, output_dtype=dtype),
+    ):
+        out = enc.fit(df, y).transform(df)
+        name = "feat_woe" if isinstance(enc, WOEGuard) else "feat"
+        values = out if mode == "ndarray" else out[name]
+        assert values.dtype == np.dtype(dtype)
+    woe = WOEGuard(["feat"], output_mode="ndarray", output_dtype=dtype).fit(df, y).transform(df)
+    np.testing.assert_allclose(woe, ref, rtol=1e-3)
+
+
+def test_manager_output_dtype_reports_savings(data):
+    df, y = data
+    manager = EncodingManager("woe", categorical_cols=["feat"], output_mode="ndarray", output_dtype="float32")
+    out = manager.fit(df, y).transform(df)
+    assert out.dtype == np.float32
+    assert manager.comparison_.output_dtype == "float32"
+    assert manager.comparison_.memory_saved == out.size * 4
+    report = ReportBuilder(df, pd.DataFrame(out), comparison=manager.comparison_)
+    assert f"memory saved vs float64: {out.size * 4} bytes" in report.to_text()
+
+    onehot = EncodingManager("onehot", columns=["feat"], output_dtype="float32").fit(df.fillna("z"), y)
+    assert onehot.transform(df.fillna("z")).dtype == np.float32
+
+
+def test_savings_skip_passthrough_columns(data):
+    df, y = data
+    df = df.assign(num=df["num"].astype("float32"))
+    copy = EncodingManager("woe", categorical_cols=["feat"], output_dtype="float32").fit(df, y)
+    copy.transform(df)
+    assert copy.comparison_.memory_saved == len(df) * 4
+
+    combined = EncodingManager(
+        [("woe", {"categorical_cols": ["feat"]})], passthrough=["num"], output_dtype="float32"
+    ).fit(df, y)
+    out = combined.transform(df)
+    assert out.shape == (len(df), 2) and combined.comparison_.memory_saved == len(df) * 4
+
+
+def test_invalid_output_dtype():
+    with pytest.raises(ValueError):
+        TargetEncoder(["feat"], output_dtype="int8")
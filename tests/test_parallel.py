@@ -0,0 +1,22 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager
+
+
+@pytest.mark.parametrize("encoding,kwargs", [
+    ("woe", {"categorical_cols": ["c0", "c1", "c2"]}),
+    ("target", {"columns": ["c0", "c1", "c2"]}),
+    ("leave_one_out", {"columns": ["c0", "c1", "c2"]}),
+])
+@pytest.mark.parametrize("backend", [None, "loky"])
+def test_parallel_matches_serial(encoding, kwargs, backend):
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame({f"c{j}": rng.choice(list("abcdef"), size=400) for j in range(3)})
+    y = pd.Series(rng.integers(0, 2, size=400), name="y")
+    serial = EncodingManager(encoding, **kwargs).fit_transform(X, y)
+    parallel = EncodingManager(encoding, n_jobs=2, backend=backend, **kwargs).fit_transform(X, y)
+    pd.testing.assert_frame_equal(serial, parallel)
@@ -0,0 +1,92 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager
+from encoding.encoders import WOEGuard, TargetEncoder, LeaveOneOutEncoder
+
+
+def _frame(n=300, seed=1):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG", "BA"], size=n),
+        "qtd": rng.integers(0, 4, size=n),
+    })
+    y = pd.Series(rng.integers(0, 2, size=n), name="target")
+    return df, y
+
+
+def _chunks(df, y, size=70):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size], y.iloc[start:start + size]
+
+
+def test_woe_partial_fit_matches_fit():
+    df, y = _frame()
+    full = WOEGuard(["uf", "qtd"]).fit(df, y)
+    inc = WOEGuard(["uf", "qtd"])
+    for X_chunk, y_chunk in _chunks(df, y):
+        inc.partial_fit(X_chunk, y_chunk)
+    inc.finalize()
+    assert inc.iv_log_ == pytest.approx(full.iv_log_)
+    for col in full.woe_log_:
+        assert inc.woe_log_[col] == pytest.approx(full.woe_log_[col])
+    pd.testing.assert_frame_equal(inc.transform(df), full.transform(df))
+
+
+@pytest.mark.parametrize("cls", [TargetEncoder, LeaveOneOutEncoder])
+def test_target_partial_fit_matches_fit(cls):
+    df, y = _frame()
+    full = cls(["uf", "qtd"]).fit(df, y)
+    inc = cls(["uf", "qtd"])
+    for X_chunk, y_chunk in _chunks(df, y):
+        inc.partial_fit(X_chunk, y_chunk)
+    inc.finalize()
+    np.testing.assert_allclose(
+        inc.transform(df)[["uf", "qtd"]].to_numpy(float),
+        full.transform(df)[["uf", "qtd"]].to_numpy(float),
+    )
+
+
+def test_manager_fit_chunks_from_csv():
+    df, y = _frame()
+    buf = io.StringIO(df.assign(target=y).to_csv(index=False))
+    manager = EncodingManager("woe", categorical_cols=["uf", "qtd"])
+    manager.fit_chunks(pd.read_csv(buf, chunksize=50), target="target")
+    direct = WOEGuard(["uf", "qtd"]).fit(df, y)
+    assert manager.encoder.iv_log_ == pytest.approx(direct.iv_log_)
+
+
+def test_finalize_without_chunks():
+    with pytest.raises(RuntimeError):
+        WOEGuard(["uf"]).finalize()
+
+
+def test_woe_partial_fit_numeric_bounded():
+    rng = np.random.default_rng(3)
+    n = 6000
+    df = pd.DataFrame({"idade": rng.integers(18, 80, size=n).astype(float), "renda": rng.lognormal(8, 1, size=n)})
+    df.loc[rng.random(n) < 0.05, "renda"] = np.nan
+    y = pd.Series((rng.random(n) < 1 / (1 + np.exp(-(df["idade"] - 45) / 10))).astype(int))
+
+    full = WOEGuard([], numeric_cols=["idade", "renda"]).fit(df, y)
+    inc = WOEGuard([], numeric_cols=["idade", "renda"])
+    for X_chunk, y_chunk in _chunks(df, y, size=1500):
+        inc.partial_fit(X_chunk, y_chunk)
+    for sketch in inc._numeric_parts.values():
+        assert sketch._block is None and len(sketch.count) <= sketch.n_cells + 1
+    inc.finalize()
+
+    # few distinct values: every value is a cell, so the bins match `fit` exactly
+    np.testing.assert_array_equal(inc.bins_["idade"].edges, full.bins_["idade"].edges)
+    np.testing.assert_array_equal(inc.bins_["idade"].count, full.bins_["idade"].count)
+    assert inc.iv_log_["idade"] == pytest.approx(full.iv_log_["idade"])
+    # continuous values: edges come from the grid, counts stay exact
+    renda = inc.bins_["renda"]
+    assert renda.count.sum() + renda.nan_count == n
+    assert renda.nan_count == full.bins_["renda"].nan_count
+    assert renda.bad.sum() + renda.nan_bad == y.sum()
@@ -1,7 +1,10 @@
 import sys, os
 sys.path.insert(0, os.path.abspath("src"))
 
+import json
+
 import pandas as pd
+import pytest
 from encoding import EncodingManager, FilesystemRegistry
 
 
@@ -14,3 +17,68 @@ def test_registry_roundtrip(tmp_path):
     enc, mh, meta = reg.load("v1")
     assert hasattr(enc, "transform")
     assert isinstance(mh, type(manager.missing_handler))
+
+
+def test_registry_cache_and_dedup(tmp_path):
+    df = pd.DataFrame({"feat": ["a", "b", "a", "c"], "y": [0, 1, 0, 1]})
+    manager = EncodingManager("woe", categorical_cols=["feat"])
+    manager.fit(df[["feat"]], df["y"])
+    reg = FilesystemRegistry(tmp_path, cache_size=4)
+    reg.save("v1", manager.encoder, {"ok": True})
+    reg.save("v2", manager.encoder, {"ok": True})
+    assert len(list((tmp_path / "objects").iterdir())) == 1
+
+    first, _, _ = reg.load("v1")
+    assert (reg.cache_info().hits, reg.cache_info().misses) == (0, 1)
+    again, _, _ = reg.load("v2")
+    # one miss per load: v2 only reads its manifest and meta, the object is shared
+    assert (reg.cache_info().hits, reg.cache_info().misses) == (0, 2)
+    assert first is again
+    assert reg.load("v2")[0] is first
+    assert (reg.cache_info().hits, reg.cache_info().misses) == (1, 2)
+    private, _, meta = reg.load("v2", copy=True)
+    assert private is not first and meta == {"ok": True}
+    private.default_woe = 99.0
+    assert reg.load("v2")[0].default_woe == manager.encoder.default_woe
+
+    manager.encoder.default_woe = -5.0
+    reg.save("v1", manager.encoder, {"ok": True})
+    reloaded, _, _ = reg.load("v1")
+    assert reloaded.default_woe == -5.0
+    assert reg.cache_info().evictions >= 1
+
+
+def test_cache_sees_same_size_rewrite(tmp_path):
+    df = pd.DataFrame({"feat": ["a", "b", "a", "c"], "y": [0, 1, 0, 1]})
+    manager = EncodingManager("woe", categorical_cols=["feat"]).fit(df[["feat"]], df["y"])
+    reg = FilesystemRegistry(tmp_path)
+    reg.save("v1", manager.encoder, {"tag": "aaaa"})
+    meta_path = tmp_path / "v1" / "meta.json"
+    stamp = meta_path.stat().st_mtime_ns
+    assert reg.load("v1")[2] == {"tag": "aaaa"}
+    # same size and mtime, new inode: only the inode tells the files apart
+    reg.save("v1", manager.encoder, {"tag": "bbbb"})
+    os.utime(meta_path, ns=(stamp, stamp))
+    assert reg.load("v1")[2] == {"tag": "bbbb"}
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_delete_and_gc(tmp_path):
+    df = pd.DataFrame({"feat": ["a", "b", "a", "c"], "y": [0, 1, 0, 1]})
+    manager = EncodingManager("woe", categorical_cols=["feat"]).fit(df[["feat"]], df["y"])
+    reg = FilesystemRegistry(tmp_path)
+    reg.save("v1", manager.encoder, {}, missing_handler=manager.missing_handler)
+    reg.save("v2", manager.encoder, {})
+    manager.encoder.default_woe = -5.0
+    reg.save("v2", manager.encoder, {})  # overwrite orphans nothing: v1 still uses the old object
+    assert reg.gc(min_age=0) == []
+    reg.delete("v1")
+    (tmp_path / "objects" / "crashed.joblib.tmp").write_bytes(b"")
+    assert reg.gc() == []  # everything is younger than the grace period
+    removed = reg.gc(min_age=0)
+    assert len(removed) == 2  # v1's encoder and missing handler
+    manifest = json.loads((tmp_path / "v2" / "manifest.json").read_text())
+    assert [p.stem for p in (tmp_path / "objects").iterdir()] == [manifest["encoder"]]
+    assert reg.load("v2")[0].default_woe == -5.0
+    with pytest.raises(FileNotFoundError):
+        reg.delete("v1")
@@ -0,0 +1,95 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager, ReportBuilder, frame_stats
+
+
+def _data(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG", "Rio Grande do Sul", None], n),
+        "renda": np.where(rng.random(n) < 0.3, np.nan, rng.normal(size=n)),
+        "qtd": rng.integers(0, 4, n),
+    })
+    y = pd.Series(rng.integers(0, 2, n), name="target")
+    return df, y
+
+
+def test_sampled_stats_within_stated_bound():
+    df, _ = _data()
+    exact = frame_stats(df)
+    assert exact.sample_rows is None and exact.nan_error == 0
+    assert exact.nan_counts == {c: float(k) for c, k in df.isna().sum().items()}
+    for seed in range(5):
+        approx = frame_stats(df, sample_rows=2000, confidence=0.999, random_state=seed)
+        assert approx.sample_rows == 2000 and approx.nan_error > 0
+        err = (approx.nan_pct() - exact.nan_pct()).abs() / 100
+        assert (err <= approx.nan_error).all()
+        assert abs(approx.memory - exact.memory) <= approx.nbytes_error * approx.memory
+        # fixed-width columns are exact
+        assert approx.nbytes["renda"] == exact.nbytes["renda"]
+    assert "±" in approx.describe()
+
+
+def test_sections_are_cached(monkeypatch):
+    df, y = _data(n=500)
+    out = EncodingManager("woe", categorical_cols=["uf"]).fit(df, y).transform(df)
+    report = ReportBuilder(df, out)
+    calls = []
+    original = pd.DataFrame.isna
+    monkeypatch.setattr(pd.DataFrame, "isna", lambda self: calls.append(1) or original(self))
+    first = report.to_text()
+    n_scans = len(calls)
+    assert report.to_text() == first
+    report.to_html(os.devnull)
+    assert len(calls) == n_scans
+    assert "exact over 500 rows" in first
+
+
+def test_manager_stats_reused_without_rescan(monkeypatch):
+    df, y = _data(n=3000)
+    for sentinel, collect in ((np.nan, True), (-999, False)):
+        manager = EncodingManager(
+            "woe", categorical_cols=["uf"], missing_sentinel=sentinel, collect_stats=collect
+        ).fit(df, y)
+        out = manager.transform(df)
+        raw = manager.frame_stats_["raw"]
+        assert raw.n_rows == len(df)
+        assert raw.nan_counts == {c: int(k) for c, k in df.isna().sum().items()}
+
+        report = ReportBuilder(df, out, stats=manager.frame_stats_)
+        original = pd.DataFrame.memory_usage
+
+        def memory_usage(self, *args, **kwargs):
+            assert self is not df, "raw frame rescanned"
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(pd.DataFrame, "memory_usage", memory_usage)
+        summary = report._summary()
+        monkeypatch.undo()
+        assert summary.loc["raw", "memory"] == raw.memory
+        assert "raw_pct" in report.to_text()
+
+
+def test_chunked_transform_counts_once():
+    df, y = _data(n=5000)
+    for mode in ("copy", "inplace", "ndarray"):
+        manager = EncodingManager(
+            "woe", categorical_cols=["uf"], output_mode=mode, memory_budget=1, collect_stats=True
+        ).fit(df, y)
+        manager.transform(df.copy())
+        assert manager.last_plan_.strategy == "chunked"
+        assert manager.frame_stats_["raw"].nan_counts == {c: int(k) for c, k in df.isna().sum().items()}
+
+
+def test_default_transform_skips_nan_scan(monkeypatch):
+    df, y = _data(n=3000)
+    manager = EncodingManager("woe", categorical_cols=["uf"]).fit(df, y)
+    calls = []
+    original = pd.DataFrame.isna
+    monkeypatch.setattr(pd.DataFrame, "isna", lambda self: calls.append(1) or original(self))
+    manager.transform(df)
+    assert calls == [] and manager.frame_stats_ == {}
@@ -0,0 +1,155 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding import EncodingManager, InMemorySink, MemoryManager, MicroBatcher
+from encoding.serving.standin import serve_http, serve_stdio
+
+
+def _manager(**kwargs):
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame({"uf": rng.choice(["SP", "RJ", "MG", None], n), "qtd": rng.integers(0, 4, n)})
+    y = pd.Series(rng.integers(0, 2, n))
+    sink = InMemorySink()
+    manager = EncodingManager("woe", categorical_cols=["uf"], memory_manager=MemoryManager(sinks=[sink]), **kwargs)
+    return manager.fit(df, y), df, sink
+
+
+def test_concurrent_requests_share_batches():
+    manager, df, sink = _manager()
+    expected = manager.transform(df.iloc[:100]).to_dict("records")
+    calls = []
+    transform = manager.transform
+    manager.transform = lambda X: calls.append(len(X)) or transform(X)
+
+    async def main():
+        async with MicroBatcher(manager, max_batch_size=32, max_wait=0.05) as batcher:
+            rows = df.iloc[:100].to_dict("records")
+            return await asyncio.gather(*(batcher.encode(r) for r in rows)), batcher.metrics.snapshot()
+
+    results, metrics = asyncio.run(main())
+    assert all(set(got) == set(want) for got, want in zip(results, expected))
+    np.testing.assert_allclose([r["uf_woe"] for r in results], [w["uf_woe"] for w in expected])
+    assert sum(calls) == 100 and max(calls) <= 32 and len(calls) < 10
+    assert metrics["requests"] == 100 and metrics["batches"] == len(calls)
+    assert metrics["batch_size_max"] == 32
+    assert 0 <= metrics["queue_latency_p50"] <= metrics["queue_latency_max"]
+    assert len(sink.by_op("serve.batch")) == len(calls)
+
+
+def test_frames_executor_and_max_wait():
+    manager, df, _ = _manager(output_mode="ndarray")
+
+    async def main():
+        with ThreadPoolExecutor(1) as pool:
+            async with MicroBatcher(manager, max_batch_size=10_000, max_wait=0.01, executor=pool) as batcher:
+                block = df.iloc[10:20]
+                parts = await asyncio.gather(batcher.encode(block), batcher.encode(df.iloc[0].to_dict()))
+                # a lone request is flushed by the wait timer, not the size limit
+                alone = await asyncio.wait_for(batcher.encode(df.iloc[5].to_dict()), 1.0)
+        return parts, alone
+
+    (block, row), alone = asyncio.run(main())
+    full = manager.transform(df)
+    np.testing.assert_allclose(block, full[10:20])
+    np.testing.assert_allclose(row, full[0])
+    np.testing.assert_allclose(alone, full[5])
+
+
+def test_errors_reach_every_caller():
+    manager, df, _ = _manager()
+
+    def broken(X):
+        raise ValueError("bad batch")
+
+    manager.transform = broken
+
+    async def main():
+        async with MicroBatcher(manager, max_wait=0.01) as batcher:
+            rows = df.iloc[:2].to_dict("records")
+            out = await asyncio.gather(*(batcher.encode(r) for r in rows), return_exceptions=True)
+            return out, batcher.metrics.snapshot()
+
+    out, metrics = asyncio.run(main())
+    assert all(isinstance(o, ValueError) for o in out)
+    assert metrics["errors"] == 1 and metrics["requests"] == 2
+
+
+def test_http_standin():
+    manager, df, _ = _manager()
+    expected = manager.transform(df.iloc[:3])
+
+    async def request(port, method, path, body=b""):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+        raw = await reader.read()
+        writer.close()
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(payload)
+
+    async def main():
+        batcher = MicroBatcher(manager, max_wait=0.02)
+        server = await serve_http(batcher)
+        port = server.sockets[0].getsockname()[1]
+        rows = [json.dumps(r).encode() for r in df.iloc[:3].to_dict("records")]
+        answers = await asyncio.gather(*(request(port, "POST", "/encode", r) for r in rows))
+        block = await request(port, "POST", "/encode", json.dumps(df.iloc[:3].to_dict("records")).encode())
+        metrics = await request(port, "GET", "/metrics")
+        missing = await request(port, "GET", "/nope")
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GARBAGE\r\n\r\n")
+        malformed = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        await batcher.close()
+        return answers, block, metrics, missing, malformed
+
+    answers, block, metrics, missing, malformed = asyncio.run(main())
+    assert [status for status, _ in answers] == [200, 200, 200]
+    np.testing.assert_allclose([a["uf_woe"] for _, a in answers], expected["uf_woe"])
+    np.testing.assert_allclose([r["uf_woe"] for r in block[1]], expected["uf_woe"])
+    assert metrics[0] == 200 and metrics[1]["requests"] == 4
+    assert missing[0] == 404
+    assert malformed.startswith(b"HTTP/1.1 400 ") and b"malformed request" in malformed
+
+
+def test_stdio_standin():
+    manager, df, _ = _manager(output_mode="encoded_only")
+    expected = manager.transform(df.iloc[:20])["uf_woe"].tolist()
+
+    class Writer:
+        def __init__(self):
+            self.data = b""
+
+        def write(self, data):
+            self.data += data
+
+        async def drain(self):
+            pass
+
+    async def main():
+        reader = asyncio.StreamReader()
+        for record in df.iloc[:20].to_dict("records"):
+            reader.feed_data(json.dumps(record).encode() + b"\n")
+        reader.feed_data(b"not json\n")
+        reader.feed_eof()
+        writer = Writer()
+        async with MicroBatcher(manager, max_wait=0.01) as batcher:
+            await serve_stdio(batcher, reader, writer)
+            return writer.data, batcher.metrics.snapshot()
+
+    data, metrics = asyncio.run(main())
+    lines = [json.loads(line) for line in data.splitlines()]
+    assert [line["uf_woe"] for line in lines[:20]] == pytest.approx(expected)
+    assert "error" in lines[20]
+    assert metrics["batches"] < 20
@@ -0,0 +1,93 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+from sklearn.base import clone
+from encoding import EncodingManager
+from encoding.encoders import CompositeEncoder, OneHotEncoder, WOEGuard
+from pipelines.training import build_pipeline
+
+
+def _frame(n=400, seed=2):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "uf": rng.choice([f"uf{i}" for i in range(30)], size=n),
+        "prod": rng.choice(["x", "y", "z"], size=n),
+        "renda": rng.normal(size=n),
+    })
+    return X, pd.Series(rng.integers(0, 2, size=n), name="target")
+
+
+def _reference(X, y):
+    onehot = pd.get_dummies(X["uf"]).to_numpy(float)
+    woe = WOEGuard(["prod"], output_mode="ndarray").fit(X, y).transform(X)
+    return np.hstack([onehot, woe, X[["renda"]].to_numpy()])
+
+
+@pytest.mark.parametrize("threshold", [1.0, 0.0])
+def test_combined_output_matches_hstack(threshold):
+    X, y = _frame()
+    manager = EncodingManager(
+        [("onehot", {"columns": ["uf"]}), ("woe", {"categorical_cols": ["prod"]})],
+        passthrough="remainder",
+        sparse_threshold=threshold,
+    )
+    out = manager.fit_transform(X, y)
+    assert sp.isspmatrix_csr(out) if threshold == 1.0 else isinstance(out, np.ndarray)
+    dense = out.toarray() if sp.issparse(out) else out
+    np.testing.assert_allclose(dense, _reference(X, y))
+    names = manager.get_feature_names_out()
+    assert list(names[-2:]) == ["prod_woe", "renda"] and len(names) == out.shape[1]
+
+
+def test_composite_copies_children():
+    X, y = _frame()
+    woe, onehot = WOEGuard(["prod"]), OneHotEncoder(["uf"])
+    composite = CompositeEncoder([onehot, woe], passthrough=["renda"], sparse_threshold=0.0, n_jobs=2).fit(X, y)
+    assert woe.output_mode == "copy" and woe.n_jobs == 1 and not woe.fitted_
+    assert not hasattr(onehot.encoder, "categories_")
+    np.testing.assert_allclose(composite.transform(X), _reference(X, y))
+
+
+def test_string_remainder_rejected_at_fit():
+    X, y = _frame()
+    X["cliente"] = [f"id{i}" for i in range(len(X))]
+    manager = EncodingManager([("woe", {"categorical_cols": ["uf", "prod"]})], passthrough="remainder")
+    with pytest.raises(ValueError, match=r"non-numeric \['cliente'\]"):
+        manager.fit(X, y)
+    out = manager.fit(X.drop(columns="cliente"), y).transform(X)
+    assert out.shape == (len(X), 3)
+
+
+def test_set_output_pandas():
+    X, y = _frame()
+    manager = EncodingManager("woe", categorical_cols=["uf"], output_mode="ndarray").set_output(transform="pandas")
+    out = manager.fit(X, y).transform(X)
+    assert list(out.columns) == ["uf_woe"]
+    pd.testing.assert_index_equal(out.index, X.index)
+
+
+def test_clone_keeps_encoder_kwargs():
+    manager = EncodingManager("target", columns=["uf"], smoothing=5.0)
+    cloned = clone(manager)
+    assert cloned.encoder.smoothing == 5.0 and cloned.encoder.columns == ["uf"]
+    assert cloned.memory_manager is manager.memory_manager
+
+
+def test_training_pipeline():
+    X, y = _frame()
+    pipe = build_pipeline(["uf"], woe=["prod"]).fit(X, y)
+    assert pipe.predict_proba(X).shape == (len(X), 2)
+    assert pipe.named_steps["pre"].comparison_.time_transform is not None
+
+
+def test_save_load_combined(tmp_path):
+    X, y = _frame()
+    manager = EncodingManager([("onehot", {"columns": ["uf"]})], passthrough=["renda"]).fit(X, y)
+    manager.save(tmp_path / "m.joblib")
+    loaded = EncodingManager.load(tmp_path / "m.joblib")
+    np.testing.assert_allclose(loaded.transform(X).toarray(), manager.transform(X).toarray())
+    assert list(loaded.get_feature_names_out()) == list(manager.get_feature_names_out())
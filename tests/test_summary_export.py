@@ -0,0 +1,93 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import WOEGuard
+from encoding.encoders._export import export_table
+
+
+def _fitted():
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG", None], n),
+        "qtd": rng.integers(0, 4, n),
+        "renda": rng.normal(size=n),
+    })
+    y = pd.Series(rng.integers(0, 2, n), name="target")
+    return df, y, WOEGuard(["uf", "qtd"], numeric_cols=["renda"]).fit(df, y)
+
+
+def test_summary_counts_rates_and_woe():
+    df, y, enc = _fitted()
+    out = enc.summary()
+    assert list(out.columns) == [
+        "feature", "category", "count", "count_pct", "good", "bad",
+        "event_rate", "dist_good", "dist_bad", "woe", "iv",
+    ]
+    assert len(out) == sum(len(m) for m in enc.woe_log_.values())
+    for col, mapping in enc.woe_log_.items():
+        part = out[out.feature == col].set_index("category")
+        assert part["woe"].to_dict() == pytest.approx(dict(mapping))
+        assert part["count"].sum() == len(df)
+        assert part["dist_good"].sum() == pytest.approx(1.0)
+        assert part["iv"].iloc[0] == pytest.approx(enc.iv_log_[col])
+    uf = out[out.feature == "uf"].set_index("category")
+    rates = y.groupby(df["uf"].fillna("__nan__")).mean()
+    assert uf["event_rate"].to_dict() == pytest.approx(rates.to_dict())
+
+
+def test_summary_without_counts(tmp_path):
+    _, _, enc = _fitted()
+    enc.export_log(tmp_path / "log.json")
+    loaded = WOEGuard.load_from_json(tmp_path / "log.json")
+    out = loaded.summary()
+    uf = out[out.feature == "uf"]
+    assert uf["count"].isna().all()
+    assert uf.set_index("category")["woe"].to_dict() == pytest.approx(dict(enc.woe_log_["uf"]))
+    # numeric bins keep their counts in the log
+    assert out[out.feature == "renda"]["count"].notna().all()
+
+    enc.save(tmp_path / "enc.bin", format="columnar")
+    columnar = WOEGuard.load(tmp_path / "enc.bin").summary()
+    assert columnar.set_index(["feature", "category"])["woe"].to_dict() == pytest.approx(
+        enc.summary().set_index(["feature", "category"])["woe"].to_dict()
+    )
+
+
+def test_csv_export(tmp_path):
+    _, _, enc = _fitted()
+    expected = enc.summary(tmp_path / "summary.csv")
+    back = pd.read_csv(tmp_path / "summary.csv")
+    assert len(back) == len(expected)
+    np.testing.assert_allclose(back["woe"], expected["woe"])
+    with pytest.raises(ValueError):
+        enc.summary(tmp_path / "summary.txt")
+
+
+def test_parquet_export(tmp_path):
+    pytest.importorskip("pyarrow")
+    _, _, enc = _fitted()
+    expected = enc.summary(tmp_path / "summary.parquet")
+    back = pd.read_parquet(tmp_path / "summary.parquet")
+    np.testing.assert_allclose(back["woe"], expected["woe"])
+    # mixed int/str/bin-label categories share the CSV schema: strings
+    assert back["category"].tolist() == expected["category"].astype(str).tolist()
+    enc.summary(tmp_path / "summary.csv")
+    csv = pd.read_csv(tmp_path / "summary.csv", dtype={"category": str})
+    assert csv["category"].tolist() == back["category"].tolist()
+
+
+def test_xlsx_streaming_splits_sheets(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    df = pd.DataFrame({"feature": ["f"] * 25, "category": range(25), "woe": np.linspace(-1, 1, 25)})
+    df.loc[3, "woe"] = np.nan
+    export_table(df, tmp_path / "out.xlsx", sheet_name="WoE_Summary", max_rows=11)
+    wb = openpyxl.load_workbook(tmp_path / "out.xlsx", read_only=True)
+    assert wb.sheetnames == ["WoE_Summary", "WoE_Summary_2", "WoE_Summary_3"]
+    # read-only sheets drop trailing empty cells unless the width is given
+    rows = [r for ws in wb.worksheets for r in list(ws.iter_rows(max_col=3, values_only=True))[1:]]
+    assert len(rows) == 25
+    assert rows[3][2] is None
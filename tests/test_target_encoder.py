@@ -0,0 +1,65 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import TargetEncoder
+
+
+def _frame(n=300, seed=5):
+    rng = np.random.default_rng(seed)
+    uf = rng.choice(["SP", "RJ", "MG"], size=n).astype(object)
+    uf[rng.random(n) < 0.15] = np.nan
+    df = pd.DataFrame({"uf": uf, "qtd": rng.integers(0, 5, size=n)})
+    y = pd.Series(rng.integers(0, 2, size=n), name="target")
+    return df, y
+
+
+def test_matches_groupby_means():
+    df, y = _frame()
+    enc = TargetEncoder(["uf", "qtd"]).fit(df, y)
+    for col in ["uf", "qtd"]:
+        expected = y.groupby(df[col]).mean()
+        pd.testing.assert_series_equal(
+            enc.maps[col].sort_index(), expected.sort_index(), check_names=False, check_index_type=False
+        )
+
+
+def test_m_estimate_smoothing():
+    df, y = _frame()
+    m = 10.0
+    enc = TargetEncoder(["uf"], smoothing=m).fit(df, y)
+    grouped = y.groupby(df["uf"]).agg(["sum", "count"])
+    expected = (grouped["sum"] + m * y.mean()) / (grouped["count"] + m)
+    assert enc.maps["uf"]["SP"] == pytest.approx(expected["SP"])
+
+
+def test_nan_and_unseen_mapping():
+    df, y = _frame()
+    new = pd.DataFrame({"uf": ["SP", "XX", np.nan], "qtd": [1, 99, 2]})
+
+    enc = TargetEncoder(["uf", "qtd"], handle_nan="value").fit(df, y)
+    out = enc.transform(new)["uf"].to_numpy()
+    assert out[0] == pytest.approx(y[df["uf"] == "SP"].mean())
+    assert out[1] == pytest.approx(y.mean())
+    assert out[2] == pytest.approx(y[df["uf"].isna()].mean())
+
+    enc = TargetEncoder(["uf"], handle_nan="global").fit(df, y)
+    assert enc.transform(new)["uf"].iloc[2] == pytest.approx(y.mean())
+
+
+def test_nan_defaults_to_global_mean():
+    # the behaviour before ``handle_nan`` existed: NaN is encoded with the prior
+    df, y = _frame()
+    assert df["uf"].isna().any() and y[df["uf"].isna()].mean() != pytest.approx(y.mean())
+    enc = TargetEncoder(["uf"]).fit(df, y)
+    assert enc.handle_nan == "global"
+    assert enc.transform(pd.DataFrame({"uf": [np.nan]}))["uf"].iloc[0] == pytest.approx(y.mean())
+
+
+def test_invalid_params():
+    with pytest.raises(ValueError):
+        TargetEncoder(["uf"], smoothing=-1)
+    with pytest.raises(ValueError):
+        TargetEncoder(["uf"], handle_nan="drop")
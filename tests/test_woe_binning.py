@@ -0,0 +1,105 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import WOEGuard
+
+
+def _data(n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    consultas = rng.poisson(2.0, n).astype(float)
+    renda = rng.normal(size=n)
+    p = 1 / (1 + np.exp(-(0.6 * consultas - 0.8 * renda - 1.5)))
+    y = pd.Series((rng.random(n) < p).astype(int), name="target")
+    renda[rng.random(n) < 0.05] = np.nan
+    df = pd.DataFrame({"consultas": consultas, "renda": renda, "uf": rng.choice(["SP", "RJ"], n)})
+    return df, y
+
+
+@pytest.mark.parametrize("binning", ["monotonic", "optimal"])
+def test_bins_respect_limits(binning):
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["consultas", "renda"], binning=binning, max_bins=4).fit(df, y)
+    for col in ("consultas", "renda"):
+        bins = enc.bins_[col]
+        assert len(bins.woe) <= 4
+        assert len(bins.edges) == len(bins.woe) - 1
+        assert bins.count.min() >= 0.05 * df[col].notna().sum()
+        assert enc.iv_log_[col] > 0
+    assert "__nan__" in enc.woe_log_["renda"]
+    assert "__nan__" not in enc.woe_log_["consultas"]
+
+
+def test_monotonic_woe_and_searchsorted_transform():
+    df, y = _data()
+    enc = WOEGuard([], numeric_cols=["consultas", "renda"]).fit(df, y)
+    woe = enc.bins_["consultas"].woe
+    assert np.all(np.diff(woe) < 0) or np.all(np.diff(woe) > 0)
+    out = enc.transform(df)
+    # reference: assign each row to its right-closed interval by hand
+    bins = enc.bins_["renda"]
+    bounds = np.concatenate([[-np.inf], bins.edges, [np.inf]])
+    x = df["renda"].to_numpy()
+    expected = np.full(len(x), bins.nan_woe)
+    for i in range(len(bins.woe)):
+        expected[(x > bounds[i]) & (x <= bounds[i + 1])] = bins.woe[i]
+    np.testing.assert_allclose(out["renda_woe"].to_numpy(), expected)
+    assert list(enc.get_feature_names_out()) == list(df.columns) + ["consultas_woe", "renda_woe"]
+
+
+def test_binned_woe_matches_categorical_woe_of_bins():
+    df, y = _data()
+    enc = WOEGuard([], numeric_cols=["renda"], binning="optimal").fit(df, y)
+    labels = np.array(enc.bins_["renda"].labels() + ["__nan__"])
+    positions = np.searchsorted(enc.bins_["renda"].edges, df["renda"].to_numpy())
+    positions[df["renda"].isna().to_numpy()] = len(labels) - 1
+    ref = WOEGuard(["bin"]).fit(pd.DataFrame({"bin": labels[positions]}), y)
+    assert ref.woe_log_["bin"] == pytest.approx(enc.woe_log_["renda"])
+    assert ref.iv_log_["bin"] == pytest.approx(enc.iv_log_["renda"])
+
+
+def test_partial_fit_matches_fit():
+    df, y = _data()
+    full = WOEGuard(["uf"], numeric_cols=["renda"]).fit(df, y)
+    enc = WOEGuard(["uf"], numeric_cols=["renda"])
+    for start in range(0, len(df), 1000):
+        enc.partial_fit(df.iloc[start:start + 1000], y.iloc[start:start + 1000])
+    enc.finalize()
+    assert enc.woe_log_["uf"] == pytest.approx(full.woe_log_["uf"])
+    # chunked numeric bins come from a fixed grid: same rows, close IV
+    bins, ref = enc.bins_["renda"], full.bins_["renda"]
+    assert bins.count.sum() == ref.count.sum() and bins.nan_count == ref.nan_count
+    assert bins.bad.sum() == ref.bad.sum()
+    assert enc.iv_log_["renda"] == pytest.approx(full.iv_log_["renda"], rel=0.05)
+
+
+@pytest.mark.parametrize("how", ["pickle", "columnar", "json"])
+def test_roundtrip_and_scorer(tmp_path, how):
+    df, y = _data()
+    enc = WOEGuard(["uf"], numeric_cols=["consultas", "renda"], output_dtype="float32").fit(df, y)
+    expected = enc.transform(df)
+    if how == "json":
+        enc.export_log(tmp_path / "log.json")
+        loaded = WOEGuard.load_from_json(tmp_path / "log.json", output_dtype="float32")
+    else:
+        enc.save(tmp_path / "enc.bin", format=how)
+        loaded = WOEGuard.load(tmp_path / "enc.bin")
+    pd.testing.assert_frame_equal(loaded.transform(df), expected)
+
+    scorer = enc.to_scorer()
+    records = df.head(50).to_dict(orient="records")
+    np.testing.assert_allclose(
+        scorer.score_matrix(records),
+        expected[["uf_woe", "consultas_woe", "renda_woe"]].head(50).to_numpy(),
+        rtol=1e-6,
+    )
+    assert pickle.loads(pickle.dumps(enc)).bins_.keys() == enc.bins_.keys()
+
+
+def test_invalid_binning():
+    with pytest.raises(ValueError):
+        WOEGuard([], numeric_cols=["x"], binning="quantile")
@@ -0,0 +1,95 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+import pytest
+from encoding.encoders import WOEGuard
+
+
+def _frame(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "uf": rng.choice(["SP", "RJ", "MG", None], size=n),
+        "qtd": rng.integers(0, 6, size=n),
+        "produto": pd.Categorical(rng.choice(["a", "b", "c"], size=n), categories=["a", "b", "c", "d"]),
+    })
+    y = pd.Series(rng.integers(0, 2, size=n), name="target")
+    return df, y
+
+
+@pytest.mark.parametrize("include_nan", [True, False])
+def test_vectorized_fit_matches_groupby(include_nan):
+    df, y = _frame()
+    enc = WOEGuard(list(df.columns), include_nan=include_nan).fit(df, y)
+    for col in df.columns:
+        ref = enc._calculate_woe_iv(enc._prepare_series(df[col]), y)
+        assert enc.woe_log_[col].keys() == ref["woe_mapping"].keys()
+        for cat, woe in ref["woe_mapping"].items():
+            assert enc.woe_log_[col][cat] == pytest.approx(woe)
+        assert enc.iv_log_[col] == pytest.approx(ref["iv"])
+
+
+def test_compiled_transform_matches_dict_map():
+    df, y = _frame()
+    df.loc[:9, "uf"] = "AM"  # unseen after refit below
+    enc = WOEGuard(list(df.columns), default_woe=-9.0).fit(df.iloc[10:], y.iloc[10:])
+    out = enc.transform(df)
+    for col in df.columns:
+        ref = enc._prepare_series(df[col]).map(enc.woe_log_[col]).astype(float).fillna(-9.0)
+        np.testing.assert_allclose(out[col + "_woe"].to_numpy(), ref.to_numpy())
+    assert (out["uf_woe"].iloc[:10] == -9.0).all()
+
+
+def test_nan_without_include_nan_gets_default(tmp_path):
+    df = pd.DataFrame({"feat": ["a", "b", None, "a"]})
+    y = pd.Series([0, 1, 1, 0])
+    enc = WOEGuard(["feat"], include_nan=False, default_woe=7.0).fit(df, y)
+    assert enc.transform(df)["feat_woe"].iloc[2] == 7.0
+
+    enc.save(tmp_path / "enc.pkl")
+    loaded = WOEGuard.load(tmp_path / "enc.pkl")
+    pd.testing.assert_frame_equal(loaded.transform(df), enc.transform(df))
+
+
+def test_nan_value_resolved_at_compile_time(monkeypatch):
+    from encoding.encoders._lookup import CompiledMapping
+
+    table = CompiledMapping.from_dict({"a": 1.0, "__nan__": 2.5}, nan_key="__nan__")
+    without = CompiledMapping.from_dict({"a": 1.0}, nan_key="__nan__")
+    assert table.nan_entry == 2.5
+    monkeypatch.setattr(pd.Index, "get_indexer", lambda *a, **k: pytest.fail("NaN key looked up at transform"))
+    assert table.nan_value(0.0) == 2.5
+    assert without.nan_value(-1.0) == -1.0
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_columnar_roundtrip(tmp_path, mmap):
+    df, y = _frame()
+    df["mixed"] = pd.Series(["x", 1, "x", 2] * 125, dtype=object)
+    enc = WOEGuard(list(df.columns)).fit(df, y)
+    path = tmp_path / "enc.woeg"
+    enc.save(path, format="columnar")
+
+    loaded = WOEGuard.load(path, mmap=mmap)
+    assert loaded.iv_log_ == pytest.approx(enc.iv_log_)
+    for col in enc.woe_log_:
+        assert dict(loaded.woe_log_[col]) == pytest.approx(enc.woe_log_[col])
+    probe = pd.concat([df, pd.DataFrame({"uf": ["XX"], "qtd": [42]})], ignore_index=True)
+    pd.testing.assert_frame_equal(loaded.transform(probe), enc.transform(probe))
+
+    loaded.export_log(tmp_path / "log.json")
+    assert WOEGuard.load_from_json(tmp_path / "log.json").iv_log_ == pytest.approx(enc.iv_log_)
+
+
+def test_columnar_float32_tables_stay_mapped(tmp_path):
+    df, y = _frame()
+    enc = WOEGuard(["uf", "qtd"], output_mode="ndarray", output_dtype="float32").fit(df, y)
+    path = tmp_path / "enc.woeg"
+    enc.save(path, format="columnar")
+
+    loaded = WOEGuard.load(path, mmap=True)
+    for col in ("uf", "qtd"):
+        assert loaded.woe_log_[col].values.dtype == np.float32
+        assert np.shares_memory(loaded._compiled()[col].values, loaded.woe_log_[col].values)
+    np.testing.assert_array_equal(loaded.transform(df), enc.transform(df))
@@ -0,0 +1,35 @@
+import sys, os
+sys.path.insert(0, os.path.abspath("src"))
+
+import numpy as np
+import pandas as pd
+from encoding.encoders import WOEGuard, WOEScorer
+
+
+def _fitted(**kwargs):
+    df = pd.DataFrame({"uf": ["SP", "RJ", None, "SP", "MG"], "qtd": [0, 1, 1, 2, 0]})
+    y = pd.Series([0, 1, 1, 0, 1])
+    return df, WOEGuard(["uf", "qtd"], default_woe=-1.0, **kwargs).fit(df, y)
+
+
+def test_scorer_matches_transform():
+    df, enc = _fitted()
+    scorer = enc.to_scorer()
+    records = df.to_dict(orient="records")
+    expected = enc.transform(df)[["uf_woe", "qtd_woe"]]
+    np.testing.assert_allclose(scorer.score_matrix(records), expected.to_numpy())
+    assert scorer.score(records[0]) == expected.iloc[0].to_dict()
+
+
+def test_scorer_missing_and_unseen():
+    _, enc = _fitted(include_nan=False)
+    scorer = enc.to_scorer()
+    out = scorer.score({"uf": float("nan"), "qtd": 99})
+    assert out == {"uf_woe": -1.0, "qtd_woe": -1.0}
+
+
+def test_scorer_from_json(tmp_path):
+    _, enc = _fitted()
+    enc.export_log(tmp_path / "log.json")
+    scorer = WOEScorer.from_json(tmp_path / "log.json", default_woe=-1.0)
+    assert scorer.score({"uf": None})["uf_woe"] == enc.woe_log_["uf"]["__nan__"]